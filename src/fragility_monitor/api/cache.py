@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+from fragility_monitor.config import Config
+from fragility_monitor.metrics import CACHE_REQUESTS
+from fragility_monitor.monitor import MonitorResult, curated_paths, run_monitor
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Fingerprint = tuple[tuple[str, int, int] | None, ...]
+
+
+def served_components(config: Config) -> list[str]:
+    # Components the API computes beyond the weighted ones: every one by default.
+    return list(config.api.get("components", ["all"]))
+
+
+def file_fingerprint(paths: list[Path]) -> Fingerprint:
+    stamps: list[tuple[str, int, int] | None] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            stamps.append(None)
+            continue
+        stamps.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+@dataclass
+class CacheEntry:
+    fingerprint: Fingerprint
+    result: MonitorResult
+    derived: dict[str, Any] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def derive(self, key: str, build: Callable[[MonitorResult], T]) -> T:
+        with self.lock:
+            if key not in self.derived:
+                self.derived[key] = build(self.result)
+            value: T = self.derived[key]
+            return value
+
+
+class ResultCache:
+    def __init__(
+        self,
+        config: Config,
+        compute: Callable[[Config], MonitorResult] | None = None,
+    ) -> None:
+        self.config = config
+        self._compute = compute or (
+            lambda cfg: run_monitor(cfg, refresh=False, components=served_components(cfg))
+        )
+        self._lock = threading.Lock()
+        self._entry: CacheEntry | None = None
+        self._inflight: Future[CacheEntry] | None = None
+        self._holds = 0
+        self._listeners: list[Callable[[MonitorResult], None]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self) -> Fingerprint:
+        return file_fingerprint(list(curated_paths(self.config).values()))
+
+    def add_listener(self, listener: Callable[[MonitorResult], None]) -> None:
+        self._listeners.append(listener)
+
+    def _notify(self, result: MonitorResult) -> None:
+        for listener in self._listeners:
+            try:
+                listener(result)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Result listener failed")
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entry = None
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        # While held, a stale entry keeps being served even if the curated
+        # files change underneath it; used while a refresh rewrites them.
+        with self._lock:
+            self._holds += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._holds -= 1
+
+    def publish(self, result: MonitorResult) -> CacheEntry:
+        entry = CacheEntry(fingerprint=self.fingerprint(), result=result)
+        with self._lock:
+            self._entry = entry
+        self._notify(result)
+        return entry
+
+    def peek(self) -> CacheEntry | None:
+        with self._lock:
+            return self._entry
+
+    def get(self) -> MonitorResult:
+        return self.get_entry().result
+
+    def get_entry(self) -> CacheEntry:
+        fingerprint = self.fingerprint()
+        with self._lock:
+            entry = self._entry
+            if entry is not None and (entry.fingerprint == fingerprint or self._holds):
+                self.hits += 1
+                CACHE_REQUESTS.inc("result", "hit")
+                return entry
+            self.misses += 1
+            CACHE_REQUESTS.inc("result", "miss")
+            future = self._inflight
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight = future
+        if not leader:
+            return future.result()
+        try:
+            result = self._compute(self.config)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight = None
+            future.set_exception(exc)
+            raise
+        # Keyed on the pre-compute fingerprint so a file replaced mid-run
+        # triggers another recompute on the next request.
+        entry = CacheEntry(fingerprint=fingerprint, result=result)
+        with self._lock:
+            self._entry = entry
+            self._inflight = None
+        future.set_result(entry)
+        LOGGER.info("Recomputed monitor result")
+        self._notify(result)
+        return entry
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+from fragility_monitor.api.responses import dumps, latest_record
+from fragility_monitor.monitor import MonitorResult
+
+LOGGER = logging.getLogger(__name__)
+
+KEEPALIVE_SECONDS = 15.0
+
+
+@dataclass(frozen=True)
+class Event:
+    id: str
+    name: str
+    data: bytes
+
+    def encode(self) -> bytes:
+        return (
+            b"id: " + self.id.encode() + b"\nevent: " + self.name.encode()
+            + b"\ndata: " + self.data + b"\n\n"
+        )
+
+
+def update_event(result: MonitorResult) -> Event:
+    components = result.components
+    deltas: dict[str, Any] = {}
+    if len(components) >= 2:
+        change = components.iloc[-1] - components.iloc[-2]
+        deltas = {key: (None if value != value else float(value)) for key, value in change.items()}
+    payload = {
+        "index": latest_record(result.composite),
+        "components": latest_record(components),
+        "deltas": deltas,
+    }
+    data = dumps(payload)
+    return Event(id=hashlib.sha256(data).hexdigest()[:16], name="update", data=data)
+
+
+class Subscription:
+    def __init__(self, maxsize: int) -> None:
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, message: bytes) -> None:
+        # Slow consumers lose their oldest pending update rather than
+        # growing without bound; only the newest state matters.
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+
+class EventBroadcaster:
+    def __init__(self, queue_size: int = 8) -> None:
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.latest: Event | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def publish(self, event: Event) -> None:
+        if self.latest is not None and self.latest.id == event.id:
+            return
+        self.latest = event
+        message = event.encode()
+        for subscription in tuple(self._subscribers):
+            subscription.offer(message)
+
+    def publish_result(self, result: MonitorResult) -> None:
+        event = update_event(result)
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self.latest = event
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self.publish(event)
+        else:
+            loop.call_soon_threadsafe(self.publish, event)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.queue_size)
+        if self.latest is not None:
+            subscription.offer(self.latest.encode())
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    async def stream(
+        self, subscription: Subscription, is_disconnected: Any
+    ) -> AsyncIterator[bytes]:
+        try:
+            yield b"retry: 5000\n\n"
+            while not await is_disconnected():
+                try:
+                    message = await asyncio.wait_for(subscription.queue.get(), KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield message
+        finally:
+            self.unsubscribe(subscription)
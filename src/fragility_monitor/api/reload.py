@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+from fragility_monitor.api.cache import ResultCache
+from fragility_monitor.api.universes import PanelStore, UniverseCache
+from fragility_monitor.config import Config, fetch_config, load_config
+from fragility_monitor.monitor import changed_sections, invalidated_stage, recompute_result
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConfigReloader:
+    def __init__(
+        self,
+        path: str | Path,
+        results: ResultCache,
+        panel: PanelStore,
+        universes: UniverseCache,
+        watch_seconds: float = 0.0,
+    ) -> None:
+        self.path = Path(path)
+        self.results = results
+        self.panel = panel
+        self.universes = universes
+        self.watch_seconds = watch_seconds
+        self._lock = threading.Lock()
+        self._mtime = self._stat()
+        self._task: asyncio.Task[None] | None = None
+        self.last_report: dict[str, Any] | None = None
+
+    def _stat(self) -> int | None:
+        try:
+            return self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def reload(self) -> dict[str, Any]:
+        return self.apply(load_config(self.path))
+
+    def apply(self, new: Config) -> dict[str, Any]:
+        with self._lock:
+            old = self.results.config
+            stage = invalidated_stage(old, new)
+            # The panel fetches every universe's tickers, so a universe change
+            # alone still has to reach it.
+            if stage == "inputs" or fetch_config(old).to_dict() != fetch_config(new).to_dict():
+                self.panel.reconfigure(new)
+            if stage == "inputs":
+                self.results.config = new
+                self.results.invalidate()
+            else:
+                entry = self.results.peek()
+                self.results.config = new
+                if stage is not None and entry is not None:
+                    self.results.publish(recompute_result(new, entry.result, stage))
+            universe_stages = self.universes.reconfigure(new)
+            report = {
+                "changed": sorted(changed_sections(old, new)),
+                "stage": stage,
+                "universes": universe_stages,
+            }
+            self.last_report = report
+            LOGGER.info("Config reloaded: %s", report)
+            return report
+
+    def start(self) -> None:
+        if self.watch_seconds <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._watch(), name="fragility-config-watch")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.watch_seconds)
+            mtime = self._stat()
+            if mtime == self._mtime:
+                continue
+            self._mtime = mtime
+            try:
+                await asyncio.to_thread(self.reload)
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Config reload failed; keeping the previous config")
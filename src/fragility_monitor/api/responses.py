@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+from fastapi import Request, Response
+
+from fragility_monitor.monitor import MonitorResult
+from fragility_monitor.report.explain import CALLOUT_MESSAGES, TRIGGER_MESSAGES, trigger_timeline
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":"), allow_nan=False).encode()
+
+
+def frame_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    values = df.astype(object).where(df.notna(), None)
+    values.insert(0, "date", pd.DatetimeIndex(df.index).strftime("%Y-%m-%d"))
+    records: list[dict[str, Any]] = values.to_dict(orient="records")
+    return records
+
+
+def latest_record(df: pd.DataFrame) -> dict[str, Any]:
+    record = frame_records(df.iloc[[-1]])[0]
+    date = record.pop("date")
+    record["date"] = date
+    return record
+
+
+def basket_record(result: MonitorResult) -> dict[str, Any]:
+    baskets = result.features.baskets if result.features is not None else pd.DataFrame()
+    if baskets.empty:
+        return {"date": None, "baskets": {}}
+    nested: dict[str, dict[str, float | None]] = {}
+    for (basket, feature), value in baskets.iloc[-1].items():
+        nested.setdefault(basket, {})[feature] = None if pd.isna(value) else float(value)
+    return {"date": baskets.index[-1].strftime("%Y-%m-%d"), "baskets": nested}
+
+
+def trigger_record(result: MonitorResult) -> dict[str, Any]:
+    if result.components.empty or result.composite.empty:
+        return {"rules": {}, "timeline": []}
+    timeline = trigger_timeline(result.components, result.composite)
+    return {
+        "rules": {**TRIGGER_MESSAGES, **CALLOUT_MESSAGES},
+        "timeline": frame_records(timeline),
+    }
+
+
+def _accepted_encodings(header: str | None) -> set[str]:
+    accepted = set()
+    for token in (header or "").split(","):
+        name, _, params = token.strip().partition(";")
+        if params.replace(" ", "") in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        if name:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+@dataclass(frozen=True)
+class PreparedBody:
+    identity: bytes
+    gzip: bytes
+    br: bytes | None
+    etag: str
+    media_type: str = JSON_MEDIA_TYPE
+
+    @classmethod
+    def build(cls, body: bytes, media_type: str = JSON_MEDIA_TYPE) -> PreparedBody:
+        etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        compressed = gzip.compress(body, compresslevel=6, mtime=0)
+        br = brotli.compress(body, quality=9) if brotli is not None else None
+        return cls(identity=body, gzip=compressed, br=br, etag=etag, media_type=media_type)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> PreparedBody:
+        return cls.build(dumps(payload))
+
+    def respond(self, request: Request) -> Response:
+        accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+        body, encoding = self.identity, None
+        if self.br is not None and "br" in accepted:
+            body, encoding = self.br, "br"
+        elif "gzip" in accepted:
+            body, encoding = self.gzip, "gzip"
+        etag = self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+        headers = {
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+            "Cache-Control": "no-cache",
+        }
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+def prepare_responses(result: MonitorResult) -> dict[str, PreparedBody]:
+    return {
+        "index": PreparedBody.from_payload(latest_record(result.composite)),
+        "components": PreparedBody.from_payload(latest_record(result.components)),
+        "baskets": PreparedBody.from_payload(basket_record(result)),
+        "triggers": PreparedBody.from_payload(trigger_record(result)),
+        "timeseries": PreparedBody.from_payload(
+            {
+                "composite": frame_records(result.composite),
+                "components": frame_records(result.components),
+            }
+        ),
+    }
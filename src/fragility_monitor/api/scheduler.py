@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from fragility_monitor.api.cache import ResultCache, served_components
+from fragility_monitor.monitor import MonitorResult, run_monitor
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+@dataclass
+class RefreshStatus:
+    state: str = "idle"
+    runs: int = 0
+    failures: int = 0
+    last_started: datetime | None = None
+    last_finished: datetime | None = None
+    last_success: datetime | None = None
+    last_error: str | None = None
+    next_run: datetime | None = None
+    interval_minutes: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        for key, value in payload.items():
+            if isinstance(value, datetime):
+                payload[key] = _isoformat(value)
+        return payload
+
+
+class RefreshScheduler:
+    def __init__(
+        self,
+        cache: ResultCache,
+        interval_minutes: float = 0.0,
+        refresh: Callable[[], MonitorResult] | None = None,
+    ) -> None:
+        self.cache = cache
+        self.interval = timedelta(minutes=interval_minutes)
+        self._refresh = refresh or (
+            lambda: run_monitor(
+                cache.config, refresh=True, components=served_components(cache.config)
+            )
+        )
+        self.status = RefreshStatus(interval_minutes=interval_minutes)
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def start(self) -> None:
+        if self.interval.total_seconds() <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop(), name="fragility-refresh")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            self.status.next_run = _now() + self.interval
+            await asyncio.sleep(self.interval.total_seconds())
+            await self.refresh_now()
+
+    def trigger(self) -> bool:
+        if self.running:
+            return False
+        task = asyncio.create_task(self.refresh_now())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return True
+
+    async def refresh_now(self) -> None:
+        if self.running:
+            return
+        async with self._lock:
+            self.status.state = "running"
+            self.status.last_started = _now()
+            self.status.runs += 1
+            try:
+                # The pipeline is blocking I/O and pandas work; keep it off
+                # the event loop and keep serving the previous result.
+                with self.cache.hold():
+                    result = await asyncio.to_thread(self._refresh)
+                    self.cache.publish(result)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.exception("Background refresh failed")
+                self.status.state = "failed"
+                self.status.failures += 1
+                self.status.last_error = str(exc)
+            else:
+                self.status.state = "idle"
+                self.status.last_success = _now()
+                self.status.last_error = None
+            finally:
+                self.status.last_finished = _now()
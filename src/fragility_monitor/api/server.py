@@ -1,53 +1,289 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import hmac
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable
 
-import pandas as pd
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
+from fragility_monitor.api.cache import CacheEntry, ResultCache, served_components
+from fragility_monitor.api.events import EventBroadcaster, update_event
+from fragility_monitor.api.reload import ConfigReloader
+from fragility_monitor.api.responses import PreparedBody, prepare_responses
+from fragility_monitor.api.scheduler import RefreshScheduler
+from fragility_monitor.api.timeseries import (
+    MEDIA_TYPES,
+    TimeseriesFormat,
+    TimeseriesQuery,
+    TimeseriesQueryError,
+    select_page,
+    stream_page,
+)
+from fragility_monitor.api.universes import PanelStore, UniverseCache
 from fragility_monitor.config import Config
-from fragility_monitor.monitor import run_monitor
+from fragility_monitor.metrics import (
+    HTTP_DURATION,
+    REGISTRY,
+    Gauge,
+    Registry,
+    install_stage_metrics,
+)
+from fragility_monitor.monitor import compute_monitor, publish_latest
 
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
-def _serialize(df: pd.DataFrame) -> list[dict[str, Any]]:
-    records = df.reset_index().rename(columns={"index": "date"}).to_dict(orient="records")
-    for row in records:
-        if "date" in row:
-            row["date"] = pd.to_datetime(row["date"]).date().isoformat()
-    return records
 
+def timeseries_query(
+    start: str | None = None,
+    end: str | None = None,
+    columns: str | None = Query(default=None, description="Comma-separated column names"),
+    cursor: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
+    format: TimeseriesFormat = "json",
+) -> TimeseriesQuery:
+    return TimeseriesQuery(
+        start=start, end=end, columns=columns, cursor=cursor, limit=limit, format=format
+    )
 
-def create_app(config: Config) -> FastAPI:
-    app = FastAPI(title="Fragility Monitor")
+
+def universe_entry(request: Request, universe: str) -> CacheEntry:
+    universes: UniverseCache = request.app.state.universes
+    if universe not in universes:
+        raise HTTPException(status_code=404, detail=f"Unknown universe: {universe}")
+    return universes.get_entry(universe)
+
+
+TimeseriesParams = Annotated[TimeseriesQuery, Depends(timeseries_query)]
+UniverseEntry = Annotated[CacheEntry, Depends(universe_entry)]
+
+
+def _prepared(entry: CacheEntry, name: str) -> PreparedBody:
+    bodies = entry.derive("responses", prepare_responses)
+    return bodies[name]
+
+
+def _timeseries_response(entry: CacheEntry, request: Request, query: TimeseriesQuery) -> Response:
+    if query.is_default:
+        return _prepared(entry, "timeseries").respond(request)
+    try:
+        page = select_page(entry.result, query)
+    except TimeseriesQueryError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else {}
+    return StreamingResponse(
+        stream_page(page, query.format), media_type=MEDIA_TYPES[query.format], headers=headers
+    )
+
+
+def _app_registry(results: ResultCache, refresher: RefreshScheduler) -> Registry:
+    def last_refresh() -> dict[tuple[str, ...], float | None]:
+        success = refresher.status.last_success
+        return {(): success.timestamp() if success is not None else None}
+
+    def staleness() -> dict[tuple[str, ...], float | None]:
+        entry = results.peek()
+        if entry is None or entry.result.composite.empty:
+            return {(): None}
+        latest = entry.result.composite.index[-1].to_pydatetime().timestamp()
+        return {(): time.time() - latest}
+
+    def file_age() -> dict[tuple[str, ...], float | None]:
+        now = time.time()
+        ages: dict[tuple[str, ...], float | None] = {}
+        for stamp in results.fingerprint():
+            if stamp is not None:
+                ages[(Path(stamp[0]).name,)] = now - stamp[1] / 1e9
+        return ages
+
+    return Registry(
+        [
+            *REGISTRY.metrics(),
+            Gauge(
+                "fragility_last_refresh_timestamp_seconds",
+                "Unix time of the last successful background refresh",
+                collect=last_refresh,
+            ),
+            Gauge(
+                "fragility_data_staleness_seconds",
+                "Seconds since the latest composite observation",
+                collect=staleness,
+            ),
+            Gauge(
+                "fragility_curated_file_age_seconds",
+                "Seconds since each curated parquet file was written",
+                ("file",),
+                collect=file_age,
+            ),
+        ]
+    )
+
+
+def create_app(
+    config: Config,
+    cache: ResultCache | None = None,
+    scheduler: RefreshScheduler | None = None,
+    panel: PanelStore | None = None,
+    config_path: str | Path = "config.toml",
+) -> FastAPI:
+    shared_panel = panel or PanelStore(config)
+    results = cache or ResultCache(
+        config,
+        compute=lambda cfg: compute_monitor(cfg, shared_panel.get()[1], served_components(cfg)),
+    )
+    refresher = scheduler or RefreshScheduler(
+        results,
+        interval_minutes=float(config.api.get("refresh_interval_minutes", 0) or 0),
+        refresh=lambda: publish_latest(
+            results.config,
+            compute_monitor(
+                results.config, shared_panel.refresh(), served_components(results.config)
+            ),
+        ),
+    )
+    universes = UniverseCache(
+        config,
+        shared_panel,
+        budget_bytes=int(float(config.api.get("universe_cache_mb", 256)) * 1024 * 1024),
+    )
+    reloader = ConfigReloader(
+        config_path,
+        results,
+        shared_panel,
+        universes,
+        watch_seconds=float(config.api.get("config_watch_seconds", 0) or 0),
+    )
+
+    broadcaster = EventBroadcaster(queue_size=int(config.api.get("event_queue_size", 8)))
+    results.add_listener(broadcaster.publish_result)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        broadcaster.bind(asyncio.get_running_loop())
+        refresher.start()
+        reloader.start()
+        yield
+        await reloader.stop()
+        await refresher.stop()
+
+    app = FastAPI(title="Fragility Monitor", lifespan=lifespan)
+    install_stage_metrics()
+    registry = _app_registry(results, refresher)
+
+    @app.middleware("http")
+    async def record_latency(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        start = time.perf_counter()
+        status = 500
+        try:
+            response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            HTTP_DURATION.observe(time.perf_counter() - start, path, request.method, str(status))
+    app.state.results = results
+    app.state.scheduler = refresher
+    app.state.events = broadcaster
+    app.state.universes = universes
+    app.state.reloader = reloader
 
     @app.get("/index")
-    def index() -> dict[str, Any]:
-        result = run_monitor(config, refresh=False)
-        latest = result.composite.iloc[-1].to_dict()
-        latest["date"] = result.composite.index[-1].date().isoformat()
-        return latest
+    def index(request: Request) -> Response:
+        return _prepared(results.get_entry(), "index").respond(request)
 
     @app.get("/components")
-    def components() -> dict[str, Any]:
-        result = run_monitor(config, refresh=False)
-        latest = result.components.iloc[-1].to_dict()
-        latest["date"] = result.components.index[-1].date().isoformat()
-        return latest
+    def components(request: Request) -> Response:
+        return _prepared(results.get_entry(), "components").respond(request)
+
+    @app.get("/baskets")
+    def baskets(request: Request) -> Response:
+        return _prepared(results.get_entry(), "baskets").respond(request)
+
+    @app.get("/triggers")
+    def triggers(request: Request) -> Response:
+        return _prepared(results.get_entry(), "triggers").respond(request)
 
     @app.get("/timeseries")
-    def timeseries() -> dict[str, Any]:
-        result = run_monitor(config, refresh=False)
-        payload = {
-            "composite": _serialize(result.composite),
-            "components": _serialize(result.components),
-        }
-        return payload
+    def timeseries(request: Request, query: TimeseriesParams) -> Response:
+        return _timeseries_response(results.get_entry(), request, query)
+
+    @app.get("/universes")
+    def universe_list() -> dict[str, Any]:
+        return {"universes": universes.names, "cached_bytes": universes.cached_bytes()}
+
+    @app.get("/u/{universe}/index")
+    def universe_index(request: Request, entry: UniverseEntry) -> Response:
+        return _prepared(entry, "index").respond(request)
+
+    @app.get("/u/{universe}/components")
+    def universe_components(request: Request, entry: UniverseEntry) -> Response:
+        return _prepared(entry, "components").respond(request)
+
+    @app.get("/u/{universe}/timeseries")
+    def universe_timeseries(
+        request: Request, entry: UniverseEntry, query: TimeseriesParams
+    ) -> Response:
+        return _timeseries_response(entry, request, query)
+
+    @app.get("/events")
+    async def events(request: Request) -> StreamingResponse:
+        if broadcaster.latest is None:
+            entry = results.peek()
+            if entry is not None:
+                broadcaster.latest = update_event(entry.result)
+        subscription = broadcaster.subscribe()
+        return StreamingResponse(
+            broadcaster.stream(subscription, request.is_disconnected),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/refresh/status")
+    def refresh_status() -> dict[str, Any]:
+        return {"running": refresher.running, **refresher.status.to_dict()}
+
+    def require_admin(x_admin_token: str | None = Header(default=None)) -> None:
+        token = str(results.config.api.get("admin_token") or "")
+        if not token:
+            raise HTTPException(status_code=403, detail="Admin routes are disabled")
+        if not hmac.compare_digest((x_admin_token or "").encode(), token.encode()):
+            raise HTTPException(status_code=403, detail="Invalid admin token")
+
+    @app.post("/refresh", status_code=202, dependencies=[Depends(require_admin)])
+    async def refresh() -> dict[str, Any]:
+        started = refresher.trigger()
+        return {"started": started, **refresher.status.to_dict()}
+
+    @app.get("/metrics")
+    def metrics() -> PlainTextResponse:
+        return PlainTextResponse(registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+    @app.post("/admin/reload", dependencies=[Depends(require_admin)])
+    def admin_reload() -> dict[str, Any]:
+        try:
+            return reloader.reload()
+        except (OSError, ValueError, KeyError) as exc:
+            raise HTTPException(status_code=400, detail=f"Config reload failed: {exc}") from exc
 
     return app
 
 
-def run(config: Config, host: str = "127.0.0.1", port: int = 8000) -> None:
+def run(
+    config: Config,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    refresh_interval: float | None = None,
+    config_path: str | Path | None = None,
+) -> None:
     import uvicorn
 
-    app = create_app(config)
+    if refresh_interval is not None:
+        config.api["refresh_interval_minutes"] = refresh_interval
+    app = create_app(config, config_path=config_path or "config.toml")
     uvicorn.run(app, host=host, port=port)
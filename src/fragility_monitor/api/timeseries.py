@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Iterator, Literal
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.api.responses import dumps, frame_records
+from fragility_monitor.monitor import MonitorResult
+
+TimeseriesFormat = Literal["json", "csv", "arrow"]
+
+CHUNK_ROWS = 512
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+MEDIA_TYPES = {"json": "application/json", "csv": "text/csv", "arrow": ARROW_MEDIA_TYPE}
+
+
+class TimeseriesQueryError(ValueError):
+    pass
+
+
+@dataclass
+class TimeseriesQuery:
+    start: str | None = None
+    end: str | None = None
+    columns: str | None = None
+    cursor: str | None = None
+    limit: int | None = None
+    format: TimeseriesFormat = "json"
+
+    @property
+    def is_default(self) -> bool:
+        return (
+            self.format == "json"
+            and self.start is None
+            and self.end is None
+            and self.columns is None
+            and self.cursor is None
+            and self.limit is None
+        )
+
+
+@dataclass
+class TimeseriesPage:
+    composite: pd.DataFrame
+    components: pd.DataFrame
+    next_cursor: str | None
+
+    @property
+    def joined(self) -> pd.DataFrame:
+        return self.composite.join(self.components, how="outer")
+
+
+def _timestamp(value: str, name: str) -> pd.Timestamp:
+    try:
+        stamp = pd.Timestamp(value)
+    except (TypeError, ValueError) as exc:
+        raise TimeseriesQueryError(f"Invalid {name}: {value!r}") from exc
+    # The index is naive dates; read aware values as UTC.
+    if stamp.tzinfo is not None:
+        stamp = stamp.tz_convert("UTC").tz_localize(None)
+    return stamp
+
+
+def select_page(result: MonitorResult, query: TimeseriesQuery) -> TimeseriesPage:
+    composite = result.composite
+    components = result.components
+    if query.columns is not None:
+        requested = [name.strip() for name in query.columns.split(",") if name.strip()]
+        known = set(composite.columns) | set(components.columns)
+        unknown = [name for name in requested if name not in known]
+        if unknown:
+            raise TimeseriesQueryError(f"Unknown columns: {', '.join(unknown)}")
+        composite = composite[[name for name in composite.columns if name in requested]]
+        components = components[[name for name in components.columns if name in requested]]
+
+    dates = composite.index.union(components.index)
+    lower = _timestamp(query.start, "start") if query.start else None
+    if query.cursor:
+        cursor = _timestamp(query.cursor, "cursor")
+        lower = cursor if lower is None else max(lower, cursor)
+    upper = _timestamp(query.end, "end") if query.end else None
+    mask = np.ones(len(dates), dtype=bool)
+    if lower is not None:
+        mask &= dates >= lower
+    if upper is not None:
+        mask &= dates <= upper
+    selected = dates[mask]
+
+    next_cursor = None
+    if query.limit is not None:
+        if query.limit < 1:
+            raise TimeseriesQueryError("limit must be positive")
+        if len(selected) > query.limit:
+            next_cursor = selected[query.limit].date().isoformat()
+        selected = selected[: query.limit]
+
+    return TimeseriesPage(
+        composite=composite.loc[composite.index.intersection(selected)],
+        components=components.loc[components.index.intersection(selected)],
+        next_cursor=next_cursor,
+    )
+
+
+def _json_rows(df: pd.DataFrame) -> Iterator[bytes]:
+    for offset in range(0, len(df), CHUNK_ROWS):
+        chunk = dumps(frame_records(df.iloc[offset : offset + CHUNK_ROWS]))[1:-1]
+        yield chunk if offset == 0 else b"," + chunk
+
+
+def stream_json(page: TimeseriesPage) -> Iterator[bytes]:
+    yield b'{"composite":['
+    yield from _json_rows(page.composite)
+    yield b'],"components":['
+    yield from _json_rows(page.components)
+    yield b'],"next_cursor":' + dumps(page.next_cursor) + b"}"
+
+
+def stream_csv(page: TimeseriesPage) -> Iterator[bytes]:
+    joined = page.joined
+    joined.index.name = "date"
+    for offset in range(0, max(len(joined), 1), CHUNK_ROWS):
+        buffer = io.StringIO()
+        joined.iloc[offset : offset + CHUNK_ROWS].to_csv(
+            buffer, header=offset == 0, date_format="%Y-%m-%d"
+        )
+        yield buffer.getvalue().encode()
+
+
+def stream_arrow(page: TimeseriesPage) -> Iterator[bytes]:
+    import pyarrow as pa
+
+    joined = page.joined
+    joined.index.name = "date"
+    schema = pa.Schema.from_pandas(joined, preserve_index=True)
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        yield _drain(sink)
+        for offset in range(0, len(joined), CHUNK_ROWS):
+            chunk = joined.iloc[offset : offset + CHUNK_ROWS]
+            batch = pa.RecordBatch.from_pandas(chunk, schema=schema, preserve_index=True)
+            writer.write_batch(batch)
+            yield _drain(sink)
+    yield _drain(sink)
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+def stream_page(page: TimeseriesPage, fmt: TimeseriesFormat) -> Iterator[bytes]:
+    if fmt == "csv":
+        return stream_csv(page)
+    if fmt == "arrow":
+        return stream_arrow(page)
+    return stream_json(page)
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable
+
+from fragility_monitor.api.cache import (
+    CacheEntry,
+    Fingerprint,
+    file_fingerprint,
+    served_components,
+)
+from fragility_monitor.config import Config, fetch_config, universe_config
+from fragility_monitor.features.narrative import NarrativeStore
+from fragility_monitor.metrics import CACHE_REQUESTS
+from fragility_monitor.monitor import (
+    MonitorInputs,
+    MonitorResult,
+    compute_monitor,
+    curated_paths,
+    invalidated_stage,
+    load_inputs,
+    recompute_result,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PanelStore:
+    def __init__(self, config: Config) -> None:
+        self.config = fetch_config(config)
+        self._lock = threading.Lock()
+        self._fingerprint: Fingerprint | None = None
+        self._inputs: MonitorInputs | None = None
+        self._narrative = NarrativeStore()
+
+    def fingerprint(self) -> Fingerprint:
+        return file_fingerprint(list(curated_paths(self.config).values()))
+
+    def get(self) -> tuple[Fingerprint, MonitorInputs]:
+        with self._lock:
+            fingerprint = self.fingerprint()
+            if self._inputs is None or fingerprint != self._fingerprint:
+                CACHE_REQUESTS.inc("panel", "miss")
+                self._inputs = self._with_narrative(load_inputs(self.config, refresh=False))
+                self._fingerprint = fingerprint
+                LOGGER.info("Loaded shared price/macro/filing panel")
+            return self._fingerprint, self._inputs
+
+    def reconfigure(self, config: Config) -> None:
+        with self._lock:
+            self.config = fetch_config(config)
+            self._inputs = None
+            self._fingerprint = None
+
+    def _with_narrative(self, inputs: MonitorInputs) -> MonitorInputs:
+        # Only filings not seen before update the running narrative state.
+        inputs.narrative = self._narrative.sync(inputs.filings)
+        return inputs
+
+    def refresh(self) -> MonitorInputs:
+        inputs = load_inputs(self.config, refresh=True)
+        with self._lock:
+            inputs = self._with_narrative(inputs)
+            self._inputs = inputs
+            self._fingerprint = self.fingerprint()
+        return inputs
+
+
+def entry_nbytes(entry: CacheEntry) -> int:
+    result = entry.result
+    total = int(result.composite.memory_usage(deep=True).sum())
+    total += int(result.components.memory_usage(deep=True).sum())
+    for bodies in entry.derived.values():
+        if isinstance(bodies, dict):
+            for body in bodies.values():
+                total += len(getattr(body, "identity", b"")) + len(getattr(body, "gzip", b""))
+                total += len(getattr(body, "br", None) or b"")
+    return total
+
+
+class UniverseCache:
+    def __init__(
+        self,
+        config: Config,
+        panel: PanelStore,
+        budget_bytes: int,
+        compute: Callable[[Config, MonitorInputs], MonitorResult] | None = None,
+    ) -> None:
+        self.config = config
+        self.panel = panel
+        self.budget_bytes = budget_bytes
+        self._compute = compute or (
+            lambda cfg, inputs: compute_monitor(cfg, inputs, served_components(cfg))
+        )
+        self._configs = {name: universe_config(config, name) for name in config.universes}
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Fingerprint], CacheEntry] = OrderedDict()
+        self._inflight: dict[tuple[str, Fingerprint], Future[CacheEntry]] = {}
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._configs)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._configs
+
+    def cached_bytes(self) -> int:
+        with self._lock:
+            return sum(entry_nbytes(entry) for entry in self._entries.values())
+
+    def _evict(self) -> None:
+        sizes = {key: entry_nbytes(entry) for key, entry in self._entries.items()}
+        total = sum(sizes.values())
+        # Always keep the most recently used entry, even when it alone exceeds
+        # the budget.
+        while total > self.budget_bytes and len(self._entries) > 1:
+            key, _ = self._entries.popitem(last=False)
+            total -= sizes[key]
+            LOGGER.info("Evicted universe %s from result cache", key[0])
+
+    def reconfigure(self, config: Config) -> dict[str, str | None]:
+        configs = {name: universe_config(config, name) for name in config.universes}
+        stages: dict[str, str | None] = {}
+        with self._lock:
+            for name in set(self._configs) - set(configs):
+                self._drop(name)
+            for name, universe in configs.items():
+                previous = self._configs.get(name)
+                stage = "inputs" if previous is None else invalidated_stage(previous, universe)
+                stages[name] = stage
+                if stage == "inputs":
+                    self._drop(name)
+                elif stage is not None:
+                    for key, entry in list(self._entries.items()):
+                        if key[0] != name:
+                            continue
+                        if entry.result.features is None:
+                            del self._entries[key]
+                            continue
+                        result = recompute_result(universe, entry.result, stage)
+                        self._entries[key] = CacheEntry(fingerprint=key[1], result=result)
+            self.config = config
+            self._configs = configs
+            self._evict()
+        return stages
+
+    def _drop(self, name: str) -> None:
+        for key in [key for key in self._entries if key[0] == name]:
+            del self._entries[key]
+
+    def get_entry(self, name: str) -> CacheEntry:
+        universe = self._configs[name]
+        fingerprint, inputs = self.panel.get()
+        key = (name, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                CACHE_REQUESTS.inc("universe", "hit")
+                return entry
+            CACHE_REQUESTS.inc("universe", "miss")
+            future = self._inflight.get(key)
+            leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+        if not leader:
+            return future.result()
+        try:
+            result = self._compute(universe, inputs)
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(exc)
+            raise
+        entry = CacheEntry(fingerprint=fingerprint, result=result)
+        with self._lock:
+            self._drop(name)
+            self._entries[key] = entry
+            self._inflight.pop(key, None)
+            self._evict()
+        future.set_result(entry)
+        return entry
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.bench.synthetic import SyntheticData, filing_text, generate
+
+LOGGER = logging.getLogger(__name__)
+
+FRED_COLUMNS = {"BAMLH0A0HYM2": "hy_spread", "VIXCLS": "vix"}
+FILING_WORDS = 4000
+
+
+@dataclass
+class FixtureBehaviour:
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    seed: int = 0
+
+
+class FixtureData:
+    def __init__(self, data: SyntheticData) -> None:
+        self.data = data
+        self.ciks = {
+            ticker: str(1_000_000 + index).zfill(10) for index, ticker in enumerate(data.tickers)
+        }
+        self.tickers_by_cik = {cik: ticker for ticker, cik in self.ciks.items()}
+        self._csv: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def stooq_csv(self, symbol: str) -> bytes | None:
+        ticker = symbol.removesuffix(".us").upper().replace("-", ".")
+        if ticker not in self.data.prices.columns:
+            return None
+        with self._lock:
+            if ticker not in self._csv:
+                self._csv[ticker] = self._render_csv(ticker)
+            return self._csv[ticker]
+
+    def _render_csv(self, ticker: str) -> bytes:
+        close = self.data.prices[ticker].dropna()
+        rng = np.random.default_rng(int(hashlib.sha256(ticker.encode()).hexdigest()[:8], 16))
+        spread = np.abs(rng.normal(0, 0.01, len(close)))
+        previous = close.shift(1).fillna(close)
+        frame = pd.DataFrame(
+            {
+                "Date": close.index.strftime("%Y-%m-%d"),
+                "Open": previous.to_numpy() * (1 + rng.normal(0, 0.003, len(close))),
+                "High": close.to_numpy() * (1 + spread),
+                "Low": close.to_numpy() * (1 - spread),
+                "Close": close.to_numpy(),
+                "Volume": rng.integers(1_000_000, 50_000_000, len(close)),
+            }
+        )
+        frame["High"] = frame[["Open", "High", "Close"]].max(axis=1)
+        frame["Low"] = frame[["Open", "Low", "Close"]].min(axis=1)
+        buffer = io.StringIO()
+        frame.to_csv(buffer, index=False, float_format="%.4f")
+        return buffer.getvalue().encode()
+
+    def fred_json(self, series_id: str) -> dict[str, Any]:
+        column = FRED_COLUMNS.get(series_id)
+        macro = self.data.macro
+        if column is None or column not in macro.columns:
+            rng = np.random.default_rng(int(hashlib.sha256(series_id.encode()).hexdigest()[:8], 16))
+            series = pd.Series(10 + rng.normal(0, 0.1, len(macro)).cumsum(), index=macro.index)
+        else:
+            series = macro[column]
+        observations = [
+            {"date": date.strftime("%Y-%m-%d"), "value": "." if pd.isna(value) else f"{value:.4f}"}
+            for date, value in series.items()
+        ]
+        return {"observations": observations}
+
+    def company_tickers(self) -> dict[str, Any]:
+        return {
+            str(index): {"cik_str": int(cik), "ticker": ticker, "title": f"{ticker} Corp"}
+            for index, (ticker, cik) in enumerate(self.ciks.items())
+        }
+
+    def submissions(self, cik: str) -> dict[str, Any] | None:
+        ticker = self.tickers_by_cik.get(cik.zfill(10))
+        if ticker is None:
+            return None
+        filings = self.data.filings
+        rows = filings[filings["ticker"] == ticker].sort_index(ascending=False)
+        dates = [date.strftime("%Y-%m-%d") for date in rows.index]
+        return {
+            "cik": cik,
+            "filings": {
+                "recent": {
+                    "form": ["10-K" if date.month == 12 else "10-Q" for date in rows.index],
+                    "accessionNumber": [
+                        f"{cik}-{date:%y}-{number:06d}" for number, date in enumerate(rows.index)
+                    ],
+                    "primaryDocument": [f"{ticker.lower()}-{date}.htm" for date in dates],
+                    "reportDate": dates,
+                    "filingDate": dates,
+                }
+            },
+        }
+
+    def filing(self, accession: str) -> bytes:
+        seed = int(hashlib.sha256(accession.encode()).hexdigest()[:8], 16)
+        return filing_text(FILING_WORDS, seed=seed).encode()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server: FixtureServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        LOGGER.debug("fixture %s - %s", self.address_string(), format % args)
+
+    def _send(
+        self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, payload: Any) -> None:
+        self._send(200, json.dumps(payload).encode(), "application/json")
+
+    def do_GET(self) -> None:  # noqa: N802
+        behaviour = self.server.behaviour
+        rng = self.server.rng()
+        delay = behaviour.latency + (rng.uniform(0, behaviour.jitter) if behaviour.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        roll = rng.random()
+        if roll < behaviour.throttle_rate:
+            self.server.count("throttled")
+            retry = {"Retry-After": str(behaviour.retry_after)}
+            self._send(429, b"Too Many Requests", "text/plain", retry)
+            return
+        if roll < behaviour.throttle_rate + behaviour.error_rate:
+            self.server.count("errors")
+            self._send(500, b"Internal Server Error", "text/plain")
+            return
+        self.server.count("requests")
+        self._route()
+
+    def _route(self) -> None:
+        fixtures = self.server.fixtures
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path
+        if path.startswith("/stooq/"):
+            body = fixtures.stooq_csv(query.get("s", [""])[0])
+            if body is None:
+                self._send(200, b"No data", "text/plain")
+            else:
+                self._send(200, body, "text/csv")
+            return
+        if path.startswith("/fred/"):
+            self._json(fixtures.fred_json(query.get("series_id", [""])[0]))
+            return
+        if path == "/sec/files/company_tickers.json":
+            self._json(fixtures.company_tickers())
+            return
+        match = re.fullmatch(r"/sec/submissions/CIK(\d+)\.json", path)
+        if match:
+            payload = fixtures.submissions(match.group(1))
+            if payload is None:
+                self._send(404, b"Not Found", "text/plain")
+            else:
+                self._json(payload)
+            return
+        match = re.fullmatch(r"/sec/Archives/edgar/data/\d+/([^/]+)/[^/]+", path)
+        if match:
+            self._send(200, fixtures.filing(match.group(1)), "text/html")
+            return
+        self._send(404, b"Not Found", "text/plain")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        fixtures: FixtureData,
+        behaviour: FixtureBehaviour | None = None,
+    ) -> None:
+        super().__init__(address, FixtureHandler)
+        self.fixtures = fixtures
+        self.behaviour = behaviour or FixtureBehaviour()
+        self.counters = {"requests": 0, "errors": 0, "throttled": 0}
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.behaviour.seed)
+
+    def rng(self) -> random.Random:
+        with self._lock:
+            return random.Random(self._rng.random())
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def sources(self) -> dict[str, str]:
+        base = self.base_url
+        return {
+            "stooq_url": f"{base}/stooq/q/d/l/",
+            "fred_url": f"{base}/fred/series/observations",
+            "sec_tickers_url": f"{base}/sec/files/company_tickers.json",
+            "sec_submissions_url": f"{base}/sec/submissions/CIK{{cik}}.json",
+            "sec_archives_url": (
+                f"{base}/sec/Archives/edgar/data/{{cik}}/{{accession}}/{{document}}"
+            ),
+        }
+
+
+def start_fixture_server(
+    tickers: int = 20,
+    days: int = 1500,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    behaviour: FixtureBehaviour | None = None,
+    seed: int = 0,
+) -> tuple[FixtureServer, threading.Thread]:
+    server = FixtureServer((host, port), FixtureData(generate(tickers, days, seed=seed)), behaviour)
+    thread = threading.Thread(target=server.serve_forever, name="fixture-server", daemon=True)
+    thread.start()
+    return server, thread
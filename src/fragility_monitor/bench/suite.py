@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import logging
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.bench.synthetic import (
+    BENCHMARKS,
+    SyntheticData,
+    filing_text,
+    generate,
+    write_curated,
+)
+from fragility_monitor.config import DEFAULT_CONFIG, Config
+from fragility_monitor.data.fetchers.sec_edgar import EdgarConfig, SecEdgarFetcher
+from fragility_monitor.features.divergence import compute_divergence_features
+from fragility_monitor.features.market import compute_market_features
+from fragility_monitor.monitor import run_monitor
+from fragility_monitor.report.html import generate_report
+from fragility_monitor.scoring.backtest import define_stress_events, evaluate_signals
+from fragility_monitor.scoring.composite import compute_composite, summarize
+from fragility_monitor.scoring.transforms import normalize_score
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SCALES = ["10x750", "50x1500"]
+
+
+@dataclass
+class Scale:
+    tickers: int
+    days: int
+
+    @property
+    def label(self) -> str:
+        return f"{self.tickers}x{self.days}"
+
+    @classmethod
+    def parse(cls, value: str) -> Scale:
+        tickers, _, days = value.lower().partition("x")
+        return cls(tickers=int(tickers), days=int(days))
+
+
+@dataclass
+class BenchResult:
+    name: str
+    scale: str
+    repeat: int
+    min_s: float
+    median_s: float
+
+
+def _time(func: Callable[[], Any], repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+def synthetic_config(data: SyntheticData, root: Path, base: Config | None = None) -> Config:
+    sections = json.loads(json.dumps(asdict(base) if base is not None else DEFAULT_CONFIG))
+    sections["data"] = {"raw_dir": str(root / "raw"), "curated_dir": str(root / "curated")}
+    sections["market"] = {"ai_tickers": data.tickers, "benchmarks": list(BENCHMARKS)}
+    return Config(**sections)
+
+
+def _cases(
+    data: SyntheticData, root: Path, base: Config | None = None
+) -> dict[str, Callable[[], Any]]:
+    config = synthetic_config(data, root, base)
+    write_curated(data, Path(config.data["curated_dir"]))
+    weights = dict(config.weights)
+    prices = data.prices
+    weekly_index = pd.date_range(prices.index[0], periods=max(len(prices) // 5, 2), freq="W-FRI")
+    rng = np.random.default_rng(1)
+    weekly = pd.Series(rng.normal(size=len(weekly_index)).cumsum(), index=weekly_index)
+    components = pd.DataFrame(
+        rng.uniform(0, 100, (len(weekly_index), len(weights))),
+        index=weekly_index,
+        columns=list(weights),
+    )
+    market = compute_market_features(prices, data.tickers)
+    events = define_stress_events(market["ai_returns"])
+    fetcher = SecEdgarFetcher(
+        EdgarConfig(user_agent="bench", max_filings_per_ticker=0, cache_dir=root)
+    )
+    text = filing_text(len(prices) * 20)
+    composite = compute_composite(components, weights)
+    summary = summarize(composite, components)
+    return {
+        "normalize_score": lambda: normalize_score(weekly, 104, 0.05, 0.95),
+        "compute_market_features": lambda: compute_market_features(prices, data.tickers),
+        "compute_divergence_features": lambda: compute_divergence_features(prices, data.tickers),
+        "compute_composite": lambda: compute_composite(components, weights),
+        "evaluate_signals": lambda: evaluate_signals(components["capital_flow"], events),
+        "_text_metrics": lambda: fetcher._text_metrics(text),
+        "run_monitor": lambda: run_monitor(config, refresh=False),
+        # Default workers, as the CLI runs it; force so every repeat renders.
+        "generate_report": lambda: generate_report(
+            root / "report", composite, components, summary, force=True
+        ),
+    }
+
+
+def run_suite(
+    scales: list[str] | None = None,
+    repeat: int = 3,
+    only: list[str] | None = None,
+    seed: int = 0,
+    config: Config | None = None,
+) -> dict[str, Any]:
+    results: list[BenchResult] = []
+    for label in scales or DEFAULT_SCALES:
+        scale = Scale.parse(label)
+        data = generate(scale.tickers, scale.days, seed=seed)
+        with tempfile.TemporaryDirectory(prefix="fragility-bench-") as tmp:
+            for name, case in _cases(data, Path(tmp), config).items():
+                if only and name not in only:
+                    continue
+                best, median = _time(case, repeat)
+                LOGGER.info("%s @ %s: median %.4fs", name, scale.label, median)
+                results.append(
+                    BenchResult(
+                        name=name, scale=scale.label, repeat=repeat, min_s=best, median_s=median
+                    )
+                )
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "seed": seed,
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+@dataclass
+class Comparison:
+    name: str
+    scale: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[Comparison]:
+    previous = {(row["name"], row["scale"]): row for row in baseline["results"]}
+    rows = []
+    for row in current["results"]:
+        match = previous.get((row["name"], row["scale"]))
+        if match is None:
+            continue
+        rows.append(
+            Comparison(
+                name=row["name"],
+                scale=row["scale"],
+                baseline_s=float(match["median_s"]),
+                current_s=float(row["median_s"]),
+            )
+        )
+    return rows
+
+
+def regressions(rows: list[Comparison], threshold: float) -> list[Comparison]:
+    return [row for row in rows if row.ratio > 1 + threshold]
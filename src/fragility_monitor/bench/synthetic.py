@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.data.cache import write_parquet
+from fragility_monitor.data.fetchers.sec_edgar import (
+    AI_TERMS,
+    EFFICIENCY_TERMS,
+    PRICING_PRESSURE_TERMS,
+    RISK_TERMS,
+    TRANSFORM_TERMS,
+)
+
+BENCHMARKS = ["SPY", "QQQ"]
+FILLER_WORDS = [
+    "revenue", "customers", "quarter", "growth", "operating", "segment", "results",
+    "capital", "expenses", "demand", "products", "services", "market", "fiscal",
+]
+
+
+@dataclass
+class SyntheticData:
+    tickers: list[str]
+    prices: pd.DataFrame
+    macro: pd.DataFrame
+    filings: pd.DataFrame
+
+
+def synthetic_tickers(count: int) -> list[str]:
+    return [f"T{index:04d}" for index in range(count)]
+
+
+def _prices(tickers: list[str], index: pd.DatetimeIndex, rng: np.random.Generator) -> pd.DataFrame:
+    days = len(index)
+    # One market factor with slowly switching volatility regimes, a shared
+    # "AI" factor and idiosyncratic noise, so correlations and vol move.
+    regime = np.repeat(rng.choice([0.7, 1.0, 1.8], size=days // 63 + 1), 63)[:days]
+    market = rng.normal(0.0003, 0.01, days) * regime
+    sector = rng.normal(0.0002, 0.012, days) * regime
+    betas = rng.uniform(0.6, 1.4, len(tickers))
+    loadings = rng.uniform(0.3, 1.2, len(tickers))
+    noise = rng.normal(0.0, 0.015, (days, len(tickers)))
+    returns = market[:, None] * betas + sector[:, None] * loadings + noise
+    prices = 100 * np.exp(np.cumsum(returns, axis=0))
+    frame = pd.DataFrame(prices, index=index, columns=tickers)
+    frame["SPY"] = 300 * np.exp(np.cumsum(market))
+    frame["QQQ"] = 250 * np.exp(np.cumsum(market * 1.1 + sector * 0.3))
+    # A few missing observations, as real feeds have.
+    mask = rng.random(frame.shape) < 0.002
+    frame = frame.mask(mask)
+    frame.index.name = "date"
+    return frame
+
+
+def _macro(index: pd.DatetimeIndex, rng: np.random.Generator) -> pd.DataFrame:
+    spread = 4 + np.cumsum(rng.normal(0, 0.03, len(index)))
+    vix = 18 + 6 * np.abs(np.sin(np.arange(len(index)) / 90)) + rng.normal(0, 1.5, len(index))
+    macro = pd.DataFrame({"hy_spread": np.clip(spread, 1.5, None), "vix": vix}, index=index)
+    macro.index.name = "date"
+    return macro
+
+
+def _filings(tickers: list[str], index: pd.DatetimeIndex, rng: np.random.Generator) -> pd.DataFrame:
+    quarters = pd.date_range(index[0], index[-1], freq="QE")
+    rows = []
+    for ticker in tickers:
+        for number, quarter in enumerate(quarters):
+            rows.append(
+                {
+                    "date": quarter,
+                    "ticker": ticker,
+                    "accession": f"{ticker}-{quarter:%Y%m%d}-{number:03d}",
+                    "ai_density": rng.gamma(2.0, 8.0),
+                    "efficiency_transform_ratio": rng.lognormal(0.0, 0.3),
+                    "pricing_pressure": rng.gamma(1.5, 1.0),
+                    "risk_language": rng.gamma(3.0, 4.0),
+                }
+            )
+    filings = pd.DataFrame(rows)
+    if filings.empty:
+        return filings
+    return filings.sort_values("date").set_index("date")
+
+
+def generate(tickers: int, days: int, seed: int = 0, start: str = "2012-01-02") -> SyntheticData:
+    rng = np.random.default_rng(seed)
+    names = synthetic_tickers(tickers)
+    index = pd.bdate_range(start, periods=days)
+    return SyntheticData(
+        tickers=names,
+        prices=_prices(names, index, rng),
+        macro=_macro(index, rng),
+        filings=_filings(names, index, rng),
+    )
+
+
+def filing_text(words: int, seed: int = 0) -> str:
+    rng = np.random.default_rng(seed)
+    vocabulary = FILLER_WORDS + [
+        term.strip()
+        for term in AI_TERMS
+        + EFFICIENCY_TERMS
+        + TRANSFORM_TERMS
+        + PRICING_PRESSURE_TERMS
+        + RISK_TERMS
+    ]
+    weights = np.where(np.arange(len(vocabulary)) < len(FILLER_WORDS), 20.0, 1.0)
+    chosen = rng.choice(vocabulary, size=words, p=weights / weights.sum())
+    return " ".join(chosen)
+
+
+def write_curated(data: SyntheticData, curated_dir: Path) -> None:
+    write_parquet(data.prices, curated_dir / "market_prices.parquet")
+    write_parquet(data.macro, curated_dir / "macro_series.parquet")
+    write_parquet(data.filings, curated_dir / "filing_signals.parquet")
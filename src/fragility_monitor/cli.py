@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import json
 import logging
-from datetime import datetime
+import math
+import sys
+from datetime import date, datetime
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
-import pandas as pd
-
-from fragility_monitor.config import load_config
+from fragility_monitor.config import Config, load_config, universe_config
+from fragility_monitor.latest import latest_path, read_latest
 from fragility_monitor.logging import setup_logging
-from fragility_monitor.monitor import run_monitor
-from fragility_monitor.report.html import generate_report
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Heavy dependencies (pandas, matplotlib, the pipeline) are imported inside the
+# commands that need them so ``--help`` and ``latest`` start instantly.
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,7 +26,7 @@ SPARK_CHARS = " .:-=+*#%@"
 
 
 def sparkline(series: Iterable[float], width: int = 40) -> str:
-    values = [float(value) for value in series if pd.notna(value)]
+    values = [float(value) for value in series if value is not None and not math.isnan(value)]
     if not values:
         return ""
     if len(values) > width:
@@ -46,35 +52,276 @@ def _parse_args() -> argparse.Namespace:
     monitor.add_argument("--refresh", action="store_true")
     monitor.add_argument("--report", type=str, default=None)
     monitor.add_argument("--config", type=str, default=None)
+    monitor.add_argument(
+        "--universe", type=str, default=None, help="Named [universes.<name>] profile"
+    )
+
+    latest = sub.add_parser("latest", help="Print the last computed index without recomputing")
+    latest.add_argument("--config", type=str, default=None)
+    latest.add_argument("--json", action="store_true", help="Print the raw summary")
+    latest.add_argument(
+        "--max-age-days", type=int, default=None, help="Exit 1 if the as-of date is older"
+    )
+
+    scenarios = sub.add_parser("scenarios", help="Monte Carlo fan of where the index could go")
+    scenarios.add_argument("--paths", type=int, default=1000)
+    scenarios.add_argument("--weeks", type=int, default=13)
+    scenarios.add_argument("--block-days", type=int, default=10, help="Bootstrap block length")
+    scenarios.add_argument(
+        "--vol-scale", type=float, default=1.0, help="Scale resampled returns around their mean"
+    )
+    scenarios.add_argument(
+        "--shock", type=float, default=0.0, help="Extra AI basket return on the first day"
+    )
+    scenarios.add_argument("--seed", type=int, default=None)
+    scenarios.add_argument("--json", action="store_true")
+    scenarios.add_argument("--config", type=str, default=None)
+
+    archive = sub.add_parser("archive", help="Render dated report snapshots for a date range")
+    archive.add_argument("--from", dest="start", type=str, default=None)
+    archive.add_argument("--to", dest="end", type=str, default=None)
+    archive.add_argument("--output", type=str, default="docs/archive")
+    archive.add_argument("--refresh", action="store_true")
+    archive.add_argument("--force", action="store_true", help="Re-render unchanged snapshots")
+    archive.add_argument("--config", type=str, default=None)
+
+    profile = sub.add_parser("profile", help="Profile a monitor run stage by stage")
+    profile.add_argument("--refresh", action="store_true")
+    profile.add_argument("--report", type=str, default=None)
+    profile.add_argument("--config", type=str, default=None)
+    profile.add_argument("--output", type=str, default="profile.json")
+    profile.add_argument(
+        "--trace", type=str, default="profile.trace.json", help="Chrome trace-event file"
+    )
+    profile.add_argument(
+        "--trace-memory", action="store_true", help="Record tracemalloc deltas per stage"
+    )
+
+    bench = sub.add_parser("bench", help="Offline benchmarks on synthetic data")
+    bench_sub = bench.add_subparsers(dest="bench_command", required=True)
+    bench_run = bench_sub.add_parser("run", help="Run the benchmark suite")
+    bench_run.add_argument("--scales", type=str, default=None, help="Comma-separated TICKERSxDAYS")
+    bench_run.add_argument("--repeat", type=int, default=3)
+    bench_run.add_argument("--only", type=str, default=None, help="Comma-separated benchmark names")
+    bench_run.add_argument("--output", type=str, default="bench.json")
+    bench_run.add_argument("--config", type=str, default=None)
+    bench_compare = bench_sub.add_parser("compare", help="Flag regressions against a baseline")
+    bench_compare.add_argument("baseline", type=str)
+    bench_compare.add_argument("current", type=str)
+    bench_compare.add_argument("--threshold", type=float, default=0.2)
+
+    fixtures = sub.add_parser("fixture-server", help="Serve synthetic Stooq/FRED/EDGAR responses")
+    fixtures.add_argument("--host", type=str, default="127.0.0.1")
+    fixtures.add_argument("--port", type=int, default=8765)
+    fixtures.add_argument("--tickers", type=int, default=20)
+    fixtures.add_argument("--days", type=int, default=1500)
+    fixtures.add_argument("--seed", type=int, default=0)
+    fixtures.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to every response"
+    )
+    fixtures.add_argument("--jitter", type=float, default=0.0, help="Extra uniform random latency")
+    fixtures.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction answered with 500"
+    )
+    fixtures.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="Fraction answered with 429"
+    )
 
     serve = sub.add_parser("serve", help="Run the API server")
     serve.add_argument("--host", type=str, default="127.0.0.1")
     serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=None,
+        help="Minutes between background data refreshes (0 disables)",
+    )
     serve.add_argument("--config", type=str, default=None)
 
     return parser.parse_args()
 
 
+def _print_latest(index: float, lower: float, upper: float, trend: Iterable[float]) -> None:
+    print("\nFragility Index")
+    print(f"Index: {index:.1f} | Band: [{lower:.1f}, {upper:.1f}]")
+    print(f"Trend: {sparkline(trend)}")
+    print("\nComponents")
+
+
 def _print_dashboard(composite: pd.DataFrame, components: pd.DataFrame) -> None:
     if composite.empty or components.empty:
         print("No data available for the requested window.")
         return
     latest = composite.iloc[-1]
-    print("\nFragility Index")
-    print(f"Index: {latest['index']:.1f} | Band: [{latest['band_lower']:.1f}, {latest['band_upper']:.1f}]")
-    print(f"Trend: {sparkline(composite['index'].tail(60))}")
-    print("\nComponents")
+    _print_latest(
+        latest["index"], latest["band_lower"], latest["band_upper"], composite["index"].tail(60)
+    )
     for name, value in components.iloc[-1].items():
         print(f"- {name.replace('_', ' ').title():<20} {value:>5.1f}")
 
 
+def _latest(args: argparse.Namespace, curated_dir: str) -> int:
+    path = latest_path(curated_dir)
+    summary = read_latest(path)
+    if summary is None:
+        print(f"No summary at {path}; run `fragility monitor` first.", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        _print_latest(
+            summary["index"], summary["band_lower"], summary["band_upper"], summary["trend"]
+        )
+        for name, value in summary["components"].items():
+            shown = "n/a" if value is None else f"{value:>5.1f}"
+            print(f"- {name.replace('_', ' ').title():<20} {shown:>5}")
+        print(f"\nAs of {summary['asof']} | Regime: {summary['regime']}")
+    age = (date.today() - date.fromisoformat(summary["asof"])).days
+    if args.max_age_days is not None and age > args.max_age_days:
+        print(f"Summary is {age} days old (limit {args.max_age_days})", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _scenarios(args: argparse.Namespace, config: Config) -> int:
+    from fragility_monitor.monitor import compute_monitor, compute_scenarios, load_inputs
+
+    inputs = load_inputs(config)
+    result = compute_monitor(config, inputs)
+    scenarios = compute_scenarios(
+        config,
+        inputs,
+        result,
+        n_paths=args.paths,
+        horizon_weeks=args.weeks,
+        block_days=args.block_days,
+        vol_scale=args.vol_scale,
+        shock=args.shock,
+        seed=args.seed,
+    )
+    if args.json:
+        payload = {
+            "start": scenarios.start,
+            "quantiles": {
+                str(date.date()): row.to_dict() for date, row in scenarios.quantiles.iterrows()
+            },
+            "regimes": scenarios.regimes.iloc[-1].to_dict(),
+            "transitions": scenarios.transitions.fillna(0.0).to_dict(orient="index"),
+        }
+        print(json.dumps(payload, indent=2))
+        return 0
+    print(f"\nIndex now {scenarios.start:.1f}; {args.paths} paths over {args.weeks} weeks")
+    print(f"\n{'Week':<12}" + "".join(f"{name:>7}" for name in scenarios.quantiles.columns))
+    for week, row in scenarios.quantiles.iterrows():
+        print(f"{week:%Y-%m-%d}  " + "".join(f"{value:>7.1f}" for value in row))
+    print(f"\nRegime at {scenarios.dates[-1]:%Y-%m-%d}")
+    for name, probability in scenarios.regimes.iloc[-1].items():
+        print(f"- {name:<10} {probability:>6.1%}")
+    return 0
+
+
+def _archive(args: argparse.Namespace, config: Config) -> int:
+    from fragility_monitor.monitor import run_monitor, worker_count
+    from fragility_monitor.report.explain import REPORT_COMPONENTS
+    from fragility_monitor.report.html import generate_archive
+
+    # A backfill must not replace the live latest.json.
+    result = run_monitor(
+        config, refresh=args.refresh, latest=False, components=REPORT_COMPONENTS
+    )
+    output_dir = Path(args.output)
+    written = generate_archive(
+        output_dir,
+        result.composite,
+        result.components,
+        start=args.start,
+        end=args.end,
+        workers=worker_count(config),
+        force=args.force,
+    )
+    if not written:
+        print("No composite weeks in the requested range.", file=sys.stderr)
+        return 1
+    fresh = sum(written.values())
+    print(
+        f"{fresh} snapshot(s) written, {len(written) - fresh} unchanged, "
+        f"{min(written)} to {max(written)} in {output_dir.resolve()}"
+    )
+    return 0
+
+
+def _print_profile(profile: dict[str, Any]) -> None:
+    print(f"\n{'Stage':<28} {'Wall ms':>9} {'CPU ms':>9} {'Rows in':>9} {'Rows out':>9}")
+    for record in profile["stages"]:
+        name = "  " * record["depth"] + record["name"]
+        rows_in = "" if record["rows_in"] is None else record["rows_in"]
+        rows_out = "" if record["rows_out"] is None else record["rows_out"]
+        print(
+            f"{name:<28} {record['wall_s'] * 1000:>9.1f} {record['cpu_s'] * 1000:>9.1f} "
+            f"{rows_in:>9} {rows_out:>9}"
+        )
+    print(
+        f"\nTotal: {profile['total_wall_s'] * 1000:.1f} ms | Peak RSS: {profile['peak_rss_kb']} KB"
+    )
+
+
+def _bench(args: argparse.Namespace, config: Config) -> int:
+    from fragility_monitor.bench.suite import compare, regressions, run_suite
+
+    if args.bench_command == "run":
+        scales = args.scales.split(",") if args.scales else None
+        only = args.only.split(",") if args.only else None
+        report = run_suite(
+            scales=scales, repeat=args.repeat, only=only, config=config if args.config else None
+        )
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        for row in report["results"]:
+            print(f"{row['name']:<30} {row['scale']:>10} {row['median_s'] * 1000:>10.1f} ms")
+        print(f"\nResults written to {Path(args.output).resolve()}")
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text())
+    current = json.loads(Path(args.current).read_text())
+    rows = compare(baseline, current)
+    flagged = regressions(rows, args.threshold)
+    for row in rows:
+        marker = "REGRESSION" if row in flagged else ""
+        print(
+            f"{row.name:<30} {row.scale:>10} {row.baseline_s * 1000:>10.1f} ms "
+            f"-> {row.current_s * 1000:>10.1f} ms ({row.ratio:>5.2f}x) {marker}"
+        )
+    if flagged:
+        print(f"\n{len(flagged)} benchmark(s) slower than {1 + args.threshold:.2f}x baseline")
+        return 1
+    return 0
+
+
 def main() -> None:
     args = _parse_args()
-    config = load_config(args.config)
+    config = load_config(getattr(args, "config", None))
     setup_logging(config.general.get("log_level", "INFO"))
 
-    if args.command == "monitor":
-        result = run_monitor(config, refresh=args.refresh)
+    if args.command == "latest":
+        raise SystemExit(_latest(args, config.data["curated_dir"]))
+    elif args.command == "monitor":
+        from fragility_monitor.monitor import load_inputs, run_monitor, window_sensitivity
+        from fragility_monitor.report.explain import REPORT_COMPONENTS
+        from fragility_monitor.report.html import generate_report
+
+        refresh = args.refresh
+        if args.universe:
+            if refresh:
+                # Refresh the shared store through the full config so the
+                # other universes keep their tickers.
+                load_inputs(config, refresh=True)
+                refresh = False
+            config = universe_config(config, args.universe)
+        result = run_monitor(
+            config,
+            refresh=refresh,
+            latest=not args.universe,
+            components=REPORT_COMPONENTS if args.report else (),
+        )
         if args.asof:
             asof_dt = datetime.fromisoformat(args.asof)
             result.composite = result.composite.loc[:asof_dt]
@@ -85,15 +332,91 @@ def main() -> None:
                 result.summary["components"] = {
                     k.replace("_", " ").title(): float(v) for k, v in result.components.iloc[-1].items()
                 }
+            features = result.features
+            if result.panel is not None and features is not None and not result.sensitivity.empty:
+                # Backtest only against stress events up to the as-of date.
+                result.sensitivity = window_sensitivity(
+                    config, features.ai_returns.loc[:asof_dt], result.panel.loc[:asof_dt]
+                )
         _print_dashboard(result.composite, result.components)
         if args.report:
             output_dir = Path(args.report)
-            generate_report(output_dir, result.composite, result.components, result.summary)
+            generate_report(
+                output_dir,
+                result.composite,
+                result.components,
+                result.summary,
+                sensitivity=result.sensitivity,
+            )
             print(f"\nReport written to {output_dir.resolve()}")
+    elif args.command == "scenarios":
+        raise SystemExit(_scenarios(args, config))
+    elif args.command == "archive":
+        raise SystemExit(_archive(args, config))
+    elif args.command == "profile":
+        from fragility_monitor.monitor import run_monitor
+        from fragility_monitor.profiling import profiling
+        from fragility_monitor.report.explain import REPORT_COMPONENTS
+        from fragility_monitor.report.html import generate_report
+
+        with profiling(trace_memory=args.trace_memory) as profiler:
+            result = run_monitor(
+                config,
+                refresh=args.refresh,
+                components=REPORT_COMPONENTS if args.report else (),
+            )
+            if args.report:
+                generate_report(
+                    Path(args.report),
+                    result.composite,
+                    result.components,
+                    result.summary,
+                    sensitivity=result.sensitivity,
+                )
+        profiler.write(Path(args.output), Path(args.trace))
+        _print_profile(profiler.to_dict())
+        print(
+            f"\nProfile written to {Path(args.output).resolve()} and {Path(args.trace).resolve()}"
+        )
+    elif args.command == "fixture-server":
+        from fragility_monitor.bench.fixture_server import FixtureBehaviour, start_fixture_server
+
+        behaviour = FixtureBehaviour(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            seed=args.seed,
+        )
+        server, thread = start_fixture_server(
+            tickers=args.tickers,
+            days=args.days,
+            host=args.host,
+            port=args.port,
+            behaviour=behaviour,
+            seed=args.seed,
+        )
+        print("Fixture server running; point config.toml at it with:\n\n[sources]")
+        for key, value in server.sources().items():
+            print(f'{key} = "{value}"')
+        print("\n[market]")
+        print(f"ai_tickers = {server.fixtures.data.tickers!r}".replace("'", '"'))
+        try:
+            thread.join()
+        except KeyboardInterrupt:
+            server.shutdown()
+    elif args.command == "bench":
+        raise SystemExit(_bench(args, config))
     elif args.command == "serve":
         from fragility_monitor.api.server import run
 
-        run(config, host=args.host, port=args.port)
+        run(
+            config,
+            host=args.host,
+            port=args.port,
+            refresh_interval=args.refresh_interval,
+            config_path=args.config,
+        )
 
 
 if __name__ == "__main__":
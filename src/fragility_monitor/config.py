@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import copy
 import os
-
 import tomllib
-
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
 
 DEFAULT_CONFIG = {
-    "general": {"base_currency": "USD", "log_level": "INFO"},
+    "general": {
+        "base_currency": "USD",
+        "log_level": "INFO",
+        "workers": 0,
+        "compact": False,
+        "chunk_days": 0,
+    },
     "data": {"raw_dir": "data/raw", "curated_dir": "data/curated"},
     "market": {
         "ai_tickers": [
@@ -31,7 +36,18 @@ DEFAULT_CONFIG = {
     "fred": {"api_key": "", "series": {"hy_spread": "BAMLH0A0HYM2", "vix": "VIXCLS"}},
     "sec": {"user_agent": "FragilityMonitor/0.1 (email@example.com)", "max_filings_per_ticker": 4},
     "report": {"output_dir": "out"},
-    "scoring": {"rolling_window_years": 2, "winsorize_quantiles": [0.05, 0.95]},
+    "sources": {
+        "stooq_url": "https://stooq.pl/q/d/l/",
+        "fred_url": "https://api.stlouisfed.org/fred/series/observations",
+        "sec_tickers_url": "https://www.sec.gov/files/company_tickers.json",
+        "sec_submissions_url": "https://data.sec.gov/submissions/CIK{cik}.json",
+        "sec_archives_url": "https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{document}",
+    },
+    "scoring": {
+        "rolling_window_years": 2,
+        "winsorize_quantiles": [0.05, 0.95],
+        "sensitivity_years": [],
+    },
     "weights": {
         "capital_flow": 0.2,
         "revenue_reality": 0.15,
@@ -39,8 +55,22 @@ DEFAULT_CONFIG = {
         "narrative": 0.2,
         "macro_liquidity": 0.3,
     },
+    "api": {
+        "refresh_interval_minutes": 0,
+        "event_queue_size": 8,
+        "universe_cache_mb": 256,
+        "config_watch_seconds": 0,
+        "admin_token": "",
+        "components": ["all"],
+    },
+    "components": {},
+    "universes": {},
 }
 
+# Sections a universe replaces wholesale instead of merging key by key, so a
+# weight profile can drop components the base profile uses.
+REPLACED_SECTIONS = ("weights",)
+
 
 @dataclass
 class Config:
@@ -52,10 +82,19 @@ class Config:
     report: dict[str, Any]
     scoring: dict[str, Any]
     weights: dict[str, float]
+    api: dict[str, Any] = field(default_factory=dict)
+    components: dict[str, dict[str, Any]] = field(default_factory=dict)
+    universes: dict[str, dict[str, Any]] = field(default_factory=dict)
+    sources: dict[str, str] = field(default_factory=dict)
 
     def path(self, *parts: str) -> Path:
         return Path(*parts)
 
+    def to_dict(self) -> dict[str, Any]:
+        sections = asdict(self)
+        sections.pop("universes", None)
+        return copy.deepcopy(sections)
+
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
     merged = dict(base)
@@ -82,6 +121,10 @@ def load_config(path: str | Path | None = None) -> Config:
     fred_key = os.getenv("FRED_API_KEY")
     if fred_key:
         config_data["fred"]["api_key"] = fred_key
+    return _from_dict(config_data)
+
+
+def _from_dict(config_data: dict[str, Any]) -> Config:
     return Config(
         data=config_data["data"],
         general=config_data["general"],
@@ -91,4 +134,34 @@ def load_config(path: str | Path | None = None) -> Config:
         report=config_data["report"],
         scoring=config_data["scoring"],
         weights=config_data["weights"],
+        api=config_data["api"],
+        components=config_data.get("components", {}),
+        universes=config_data.get("universes", {}),
+        sources=config_data.get("sources", {}),
     )
+
+
+def universe_config(config: Config, name: str) -> Config:
+    if name not in config.universes:
+        raise KeyError(f"Unknown universe: {name}")
+    overrides = config.universes[name]
+    merged = _deep_merge(config.to_dict(), overrides)
+    for section in REPLACED_SECTIONS:
+        if section in overrides:
+            merged[section] = dict(overrides[section])
+    return _from_dict({**merged, "universes": {}})
+
+
+def fetch_config(config: Config) -> Config:
+    # One config whose tickers cover the base basket and every universe, so a
+    # single refresh fills the shared panel.
+    merged = config.to_dict()
+    ai_tickers = list(config.market["ai_tickers"])
+    benchmarks = list(config.market["benchmarks"])
+    for name in config.universes:
+        market = universe_config(config, name).market
+        ai_tickers.extend(market["ai_tickers"])
+        benchmarks.extend(market["benchmarks"])
+    merged["market"]["ai_tickers"] = list(dict.fromkeys(ai_tickers))
+    merged["market"]["benchmarks"] = list(dict.fromkeys(benchmarks))
+    return _from_dict({**merged, "universes": {}})
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import os
+import uuid
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas is imported lazily so ``fragility latest`` can write through here
+# without loading it.
 
 
 def ensure_dirs(*paths: str | Path) -> None:
@@ -11,9 +17,26 @@ def ensure_dirs(*paths: str | Path) -> None:
         Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def write_raw(path: Path, content: bytes) -> None:
+def _atomic_target(path: Path) -> Path:
     ensure_dirs(path.parent)
-    path.write_bytes(content)
+    # Created like open() would (0666 less the umask) rather than mkstemp's
+    # 0600, so the published file keeps the usual permissions.
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+    return tmp_path
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    tmp_path = _atomic_target(path)
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def write_raw(path: Path, content: bytes) -> None:
+    atomic_write_bytes(path, content)
 
 
 def read_raw(path: Path) -> bytes | None:
@@ -23,13 +46,21 @@ def read_raw(path: Path) -> bytes | None:
 
 
 def write_parquet(df: pd.DataFrame, path: Path) -> None:
-    ensure_dirs(path.parent)
-    df.to_parquet(path, index=True)
+    # Readers (the API server, a concurrent report run) only ever see a
+    # complete file: write alongside and rename into place.
+    tmp_path = _atomic_target(path)
+    try:
+        df.to_parquet(tmp_path, index=True)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 
-def read_parquet(path: Path) -> pd.DataFrame | None:
+def read_parquet(path: Path, columns: list[str] | None = None) -> pd.DataFrame | None:
     if path.exists():
-        return pd.read_parquet(path)
+        import pandas as pd
+
+        return pd.read_parquet(path, columns=columns)
     return None
 
 
@@ -7,6 +7,8 @@ import pandas as pd
 import requests
 
 from fragility_monitor.data.fetchers.interfaces import MacroData
+from fragility_monitor.metrics import FETCH_ERRORS
+from fragility_monitor.profiling import profiled
 
 LOGGER = logging.getLogger(__name__)
 
@@ -14,8 +16,10 @@ LOGGER = logging.getLogger(__name__)
 class FredFetcher:
     base_url = "https://api.stlouisfed.org/fred/series/observations"
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(self, api_key: str | None = None, base_url: str | None = None) -> None:
         self.api_key = api_key or ""
+        if base_url:
+            self.base_url = base_url
 
     def _fetch_series(self, series_id: str) -> pd.DataFrame:
         params: dict[str, Any] = {
@@ -29,6 +33,7 @@ class FredFetcher:
             resp.raise_for_status()
         except requests.HTTPError as exc:
             LOGGER.warning("FRED request failed for %s: %s", series_id, exc)
+            FETCH_ERRORS.inc("fred")
             return pd.DataFrame()
         data = resp.json()
         observations = data.get("observations", [])
@@ -39,6 +44,7 @@ class FredFetcher:
         df["value"] = pd.to_numeric(df["value"], errors="coerce")
         return df[["date", "value"]]
 
+    @profiled("fetch.fred")
     def fetch_series(self, series_map: dict[str, str]) -> MacroData:
         frames = []
         for name, series_id in series_map.items():
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 
 import pandas as pd
@@ -9,6 +9,9 @@ import pandas as pd
 @dataclass
 class MarketData:
     prices: pd.DataFrame
+    # Field name ("open", "high", ...) -> dates x tickers frame; prices is
+    # the close.
+    ohlcv: dict[str, pd.DataFrame] = field(default_factory=dict)
 
 
 @dataclass
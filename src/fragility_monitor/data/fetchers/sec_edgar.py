@@ -11,6 +11,8 @@ import pandas as pd
 import requests
 
 from fragility_monitor.data.fetchers.interfaces import FilingSignals
+from fragility_monitor.metrics import FETCH_ERRORS
+from fragility_monitor.profiling import profiled
 
 LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +51,9 @@ class EdgarConfig:
     user_agent: str
     max_filings_per_ticker: int
     cache_dir: Path
+    tickers_url: str = SEC_TICKER_URL
+    submissions_url: str = SUBMISSIONS_URL
+    archives_url: str = ARCHIVES_URL
 
 
 class SecEdgarFetcher:
@@ -72,7 +77,7 @@ class SecEdgarFetcher:
         return data
 
     def _ticker_map(self) -> dict[str, str]:
-        data = self._get_json(SEC_TICKER_URL, "company_tickers.json")
+        data = self._get_json(self.config.tickers_url, "company_tickers.json")
         mapping = {}
         for _, entry in data.items():
             mapping[entry["ticker"].upper()] = str(entry["cik_str"]).zfill(10)
@@ -96,11 +101,14 @@ class SecEdgarFetcher:
         }
 
     def _fetch_filing_text(self, cik: str, accession: str, document: str) -> str:
-        url = ARCHIVES_URL.format(cik=str(int(cik)), accession=accession.replace("-", ""), document=document)
+        url = self.config.archives_url.format(
+            cik=str(int(cik)), accession=accession.replace("-", ""), document=document
+        )
         resp = self.session.get(url, timeout=30)
         resp.raise_for_status()
         return resp.text
 
+    @profiled("fetch.sec_edgar")
     def fetch_signals(self, tickers: list[str]) -> FilingSignals:
         ticker_map = self._ticker_map()
         rows = []
@@ -109,7 +117,9 @@ class SecEdgarFetcher:
             if not cik:
                 LOGGER.warning("No CIK found for %s", ticker)
                 continue
-            submissions = self._get_json(SUBMISSIONS_URL.format(cik=cik), f"submissions_{cik}.json")
+            submissions = self._get_json(
+                self.config.submissions_url.format(cik=cik), f"submissions_{cik}.json"
+            )
             filings = submissions.get("filings", {}).get("recent", {})
             forms = filings.get("form", [])
             accession = filings.get("accessionNumber", [])
@@ -128,12 +138,13 @@ class SecEdgarFetcher:
                     text = self._fetch_filing_text(cik, acc, doc)
                 except Exception as exc:  # noqa: BLE001
                     LOGGER.warning("Failed to fetch filing %s %s: %s", ticker, acc, exc)
+                    FETCH_ERRORS.inc("sec_edgar")
                     continue
                 metrics = self._text_metrics(text)
                 date = report_date or filing_date
                 if not date:
                     continue
-                rows.append({"date": date, "ticker": ticker, **metrics})
+                rows.append({"date": date, "ticker": ticker, "accession": acc, **metrics})
                 count += 1
             LOGGER.info("Fetched %s filings for %s", count, ticker)
         if not rows:
@@ -9,13 +9,28 @@ import requests
 from pandas.errors import EmptyDataError, ParserError
 
 from fragility_monitor.data.fetchers.interfaces import MarketData
+from fragility_monitor.metrics import FETCH_ERRORS
+from fragility_monitor.profiling import profiled
 
 LOGGER = logging.getLogger(__name__)
 
+# OHLCV field -> column names Stooq uses (English and Polish headers).
+STOOQ_FIELDS = {
+    "open": ("open", "otwarcie"),
+    "high": ("high", "najwyzszy"),
+    "low": ("low", "najnizszy"),
+    "close": ("close", "zamkniecie"),
+    "volume": ("volume", "wolumen"),
+}
+
 
 class StooqFetcher:
     base_url = "https://stooq.pl/q/d/l/"
 
+    def __init__(self, base_url: str | None = None) -> None:
+        if base_url:
+            self.base_url = base_url
+
     def _symbol(self, ticker: str) -> str:
         clean = ticker.replace(".", "-").lower()
         return f"{clean}.us"
@@ -34,6 +49,7 @@ class StooqFetcher:
             LOGGER.warning("Failed to parse Stooq response for %s: %s; preview=%r", ticker, exc, preview[:120])
             return None
 
+    @profiled("fetch.stooq")
     def fetch_prices(self, tickers: list[str]) -> MarketData:
         frames = []
         for ticker in tickers:
@@ -44,30 +60,40 @@ class StooqFetcher:
                 resp.raise_for_status()
             except requests.RequestException as exc:
                 LOGGER.warning("Failed to fetch %s from Stooq: %s", ticker, exc)
+                FETCH_ERRORS.inc("stooq")
                 continue
             df = self._parse_response(ticker, resp.content)
             if df is None or df.empty:
                 LOGGER.warning("Skipping %s due to unusable Stooq payload", ticker)
+                FETCH_ERRORS.inc("stooq")
                 continue
             columns = {col.lower(): col for col in df.columns}
             date_col = columns.get("date") or columns.get("data")
             close_col = columns.get("close") or columns.get("zamkniecie")
             if not date_col or not close_col:
                 LOGGER.warning("Stooq response missing columns for %s: %s", ticker, list(df.columns))
+                FETCH_ERRORS.inc("stooq")
                 continue
+            fields = {
+                name: next((columns[alias] for alias in aliases if alias in columns), None)
+                for name, aliases in STOOQ_FIELDS.items()
+            }
             df[date_col] = pd.to_datetime(df[date_col], utc=True, errors="coerce")
-            df = df.rename(columns={date_col: "date", close_col: ticker})[["date", ticker]]
-            df = df.dropna(subset=["date"])
-            frames.append(df)
+            df = df.dropna(subset=[date_col]).set_index(date_col)
+            df.index = df.index.tz_convert(None).rename("date")
+            df = df[~df.index.duplicated(keep="last")]
+            frames.append(
+                {name: df[column].rename(ticker) for name, column in fields.items() if column}
+            )
             LOGGER.info("Fetched %s (%s rows)", ticker, len(df))
         if not frames:
             return MarketData(prices=pd.DataFrame())
-        merged = frames[0]
-        for frame in frames[1:]:
-            merged = merged.merge(frame, on="date", how="outer")
-        merged = merged.sort_values("date").set_index("date")
-        merged.index = merged.index.tz_convert(None)
-        return MarketData(prices=merged)
+        ohlcv = {
+            name: pd.concat([frame[name] for frame in frames if name in frame], axis=1).sort_index()
+            for name in STOOQ_FIELDS
+            if any(name in frame for frame in frames)
+        }
+        return MarketData(prices=ohlcv["close"], ohlcv=ohlcv)
 
 
 def last_trading_date(df: pd.DataFrame) -> datetime | None:
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from fragility_monitor.data.cache import ensure_dirs, read_parquet, write_parquet
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def field_path(store_dir: Path, name: str) -> Path:
+    return store_dir / f"{name}.parquet"
+
+
+def write_ohlcv(store_dir: Path, frames: dict[str, pd.DataFrame]) -> None:
+    # One dates x tickers parquet per field, so a reader that needs only the
+    # high/low range never decodes open or volume.
+    ensure_dirs(store_dir)
+    for name, frame in frames.items():
+        if name not in OHLCV_FIELDS:
+            raise ValueError(f"Unknown OHLCV field {name!r}")
+        write_parquet(frame, field_path(store_dir, name))
+
+
+def read_ohlcv(
+    store_dir: Path, fields: Iterable[str] = OHLCV_FIELDS, tickers: list[str] | None = None
+) -> dict[str, pd.DataFrame]:
+    frames = {}
+    for name in fields:
+        path = field_path(store_dir, name)
+        if not path.exists():
+            continue
+        columns = None
+        if tickers is not None:
+            stored = set(pq.read_schema(path).names)
+            columns = [ticker for ticker in tickers if ticker in stored]
+        frame = read_parquet(path, columns=columns)
+        if frame is not None:
+            frames[name] = frame
+    return frames
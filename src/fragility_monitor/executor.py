@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from fragility_monitor.profiling import carry_stack
+
+LOGGER = logging.getLogger(__name__)
+
+IO_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class Task:
+    name: str
+    func: Callable[..., Any]
+    deps: tuple[str, ...] = ()
+    # "io" tasks (network, disk) and "cpu" tasks (pandas/NumPy, which release
+    # the GIL in their hot loops) get separate pools so one kind can't starve
+    # the other.
+    kind: str = "io"
+
+
+def cpu_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _check(tasks: list[Task]) -> None:
+    names = [task.name for task in tasks]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate task names: {names}")
+    for task in tasks:
+        missing = set(task.deps) - set(names)
+        if missing:
+            raise ValueError(f"Task {task.name!r} depends on unknown tasks {sorted(missing)}")
+
+
+def run_tasks(tasks: Iterable[Task], workers: int | None = None) -> dict[str, Any]:
+    # Runs each task once all of its deps have finished, passing their results
+    # positionally. The first failure cancels whatever has not started and is
+    # re-raised with the task name attached.
+    tasks = list(tasks)
+    _check(tasks)
+    if workers == 1:
+        return _run_serial(tasks)
+
+    results: dict[str, Any] = {}
+    pending = {task.name: task for task in tasks}
+    running: dict[Future[Any], Task] = {}
+    pools = {
+        kind: ThreadPoolExecutor(max_workers=workers or default, thread_name_prefix=f"stage-{kind}")
+        for kind, default in (("io", IO_WORKERS), ("cpu", cpu_workers()))
+    }
+    try:
+        while pending or running:
+            for name, task in list(pending.items()):
+                if all(dep in results for dep in task.deps):
+                    del pending[name]
+                    args = [results[dep] for dep in task.deps]
+                    future = pools[task.kind].submit(carry_stack(task.func), *args)
+                    running[future] = task
+            if not running:
+                raise ValueError(f"Task dependency cycle among {sorted(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    for other in running:
+                        other.cancel()
+                    error.add_note(f"in pipeline stage {task.name!r}")
+                    raise error
+                results[task.name] = future.result()
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def _run_serial(tasks: list[Task]) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    pending = list(tasks)
+    while pending:
+        ready = [task for task in pending if all(dep in results for dep in task.deps)]
+        if not ready:
+            raise ValueError(f"Task dependency cycle among {sorted(t.name for t in pending)}")
+        for task in ready:
+            pending.remove(task)
+            try:
+                results[task.name] = task.func(*[results[dep] for dep in task.deps])
+            except Exception as error:
+                error.add_note(f"in pipeline stage {task.name!r}")
+                raise
+    return results
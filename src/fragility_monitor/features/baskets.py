@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.features.divergence import basket_rolling_corr
+
+LOGGER = logging.getLogger(__name__)
+
+BASKET_FEATURES = (
+    "relative_strength",
+    "price_acceleration",
+    "volatility",
+    "vol_of_vol",
+    "returns",
+    "dispersion",
+    "crowding_corr",
+)
+
+
+def membership_matrix(baskets: dict[str, list[str]], tickers: list[str]) -> pd.DataFrame:
+    # tickers x baskets, 1.0 where the ticker belongs to the basket. Members
+    # missing from the price frame are dropped (and an empty basket warned
+    # about), as the single-basket features do.
+    membership = pd.DataFrame(0.0, index=pd.Index(tickers), columns=list(baskets))
+    for name, members in baskets.items():
+        present = [ticker for ticker in dict.fromkeys(members) if ticker in membership.index]
+        if not present:
+            LOGGER.warning("Basket %r has no tickers with price data", name)
+        membership.loc[present, name] = 1.0
+    return membership
+
+
+def _basket_mean(frame: pd.DataFrame, membership: pd.DataFrame) -> pd.DataFrame:
+    present = frame.notna()
+    totals = frame.where(present, 0.0).to_numpy() @ membership.to_numpy()
+    counts = present.to_numpy(dtype=float) @ membership.to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(counts > 0, totals / counts, np.nan)
+    return pd.DataFrame(mean, index=frame.index, columns=membership.columns)
+
+
+def _basket_std(frame: pd.DataFrame, membership: pd.DataFrame) -> pd.DataFrame:
+    # Sample std across each basket's members, matching DataFrame.std(axis=1).
+    present = frame.notna()
+    values = frame.where(present, 0.0).to_numpy()
+    matrix = membership.to_numpy()
+    counts = present.to_numpy(dtype=float) @ matrix
+    sums = values @ matrix
+    squares = np.square(values) @ matrix
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = (squares - np.square(sums) / counts) / (counts - 1)
+    variance = np.where(counts > 1, np.maximum(variance, 0.0), np.nan)
+    return pd.DataFrame(np.sqrt(variance), index=frame.index, columns=membership.columns)
+
+
+def compute_basket_features(
+    prices: pd.DataFrame, baskets: dict[str, list[str]], benchmark: str = "SPY"
+) -> pd.DataFrame:
+    # The per-basket equivalent of compute_market_features plus
+    # compute_divergence_features for every basket at once: returns are
+    # computed once and each basket statistic is a product with the
+    # membership matrix. Columns are (basket, feature). The one difference:
+    # a day on which every member of a basket is missing stays in the shared
+    # returns, so the crowding windows around it are NaN for that basket
+    # instead of skipping the day.
+    prices = prices.sort_index()
+    columns = pd.MultiIndex.from_product(
+        [list(baskets), BASKET_FEATURES], names=["basket", "feature"]
+    )
+    if not baskets or prices.empty:
+        return pd.DataFrame(index=prices.index, columns=columns, dtype=float)
+    membership = membership_matrix(baskets, list(prices.columns))
+    returns = prices.pct_change(fill_method=None).dropna(how="all")
+    bench_returns = returns[benchmark] if benchmark in returns else returns.mean(axis=1)
+
+    basket_returns = _basket_mean(returns, membership)
+    basket_price = _basket_mean(prices, membership)
+    # Forward-filled first, as the single-basket pct_change(fill_method="pad") does.
+    momentum = basket_price.ffill().pct_change(21, fill_method=None)
+    realized_vol = basket_returns.rolling(21).std() * (252**0.5)
+    features = {
+        "relative_strength": basket_returns.sub(bench_returns, axis=0).rolling(21).sum(),
+        "price_acceleration": momentum.diff(21),
+        "volatility": realized_vol,
+        "vol_of_vol": realized_vol.rolling(21).std(),
+        "returns": basket_returns,
+        "dispersion": _basket_std(returns, membership),
+        "crowding_corr": pd.DataFrame(
+            basket_rolling_corr(returns, membership.to_numpy()),
+            index=returns.index,
+            columns=membership.columns,
+        ),
+    }
+    frame = pd.concat(features, axis=1).swaplevel(axis=1)
+    return frame.reindex(index=prices.index, columns=columns)
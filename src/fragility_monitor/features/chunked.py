@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from fragility_monitor.features.divergence import CORR_WINDOW
+
+# Return rows a block must carry over from the previous one: the longest
+# rolling window (the 63-day crowding correlation) plus one spare.
+FEATURE_WARMUP = CORR_WINDOW + 1
+
+
+def parquet_columns(path: Path) -> list[str]:
+    schema = pq.read_schema(path)
+    index = _index_columns(schema)
+    return [name for name in schema.names if name not in index]
+
+
+def _index_columns(schema: pa.Schema) -> list[str]:
+    metadata = schema.pandas_metadata or {}
+    return [name for name in metadata.get("index_columns", []) if isinstance(name, str)]
+
+
+def iter_parquet_blocks(
+    path: Path, rows: int, columns: list[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    parquet = pq.ParquetFile(path)
+    if columns is not None:
+        columns = [*columns, *_index_columns(parquet.schema_arrow)]
+    for batch in parquet.iter_batches(batch_size=rows, columns=columns):
+        yield pa.Table.from_batches([batch]).to_pandas()
+
+
+def _warmup_tail(
+    prices: pd.DataFrame, warmup: int, columns: list[str] | None = None
+) -> pd.DataFrame:
+    # Rows whose returns are all NaN are dropped before the rolling windows
+    # run, so count the warm-up in return rows, not calendar rows, and only
+    # on the columns ``compute`` reads.
+    counted = prices if columns is None else prices[[c for c in columns if c in prices]]
+    has_return = counted.pct_change(fill_method=None).notna().any(axis=1).to_numpy()
+    positions = np.flatnonzero(has_return)
+    if len(positions) < warmup:
+        return prices
+    return prices.iloc[max(positions[-warmup] - 1, 0) :]
+
+
+def chunked_features(
+    blocks: Iterable[pd.DataFrame],
+    compute: Callable[[pd.DataFrame], pd.DataFrame],
+    warmup: int = FEATURE_WARMUP,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    # Runs ``compute`` over time-ordered price blocks, each prefixed with the
+    # tail of the previous one, and keeps only the rows the block itself adds.
+    # Windows never reach past the carried tail, so the stitched frame equals
+    # the single-pass result up to rolling-sum rounding.
+    parts: list[pd.DataFrame] = []
+    tail: pd.DataFrame | None = None
+    for block in blocks:
+        if block.empty:
+            continue
+        block = block.sort_index()
+        frame = block if tail is None else pd.concat([tail, block])
+        features = compute(frame)
+        if tail is not None:
+            features = features[features.index > tail.index[-1]]
+        parts.append(features)
+        tail = _warmup_tail(frame, warmup, columns)
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts)
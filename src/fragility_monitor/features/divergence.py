@@ -1,25 +1,109 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+DIVERGENCE_FEATURES = ("ai_dispersion", "ai_crowding_corr", "ai_absorption_ratio")
+CORR_WINDOW = 63
+CORR_CHUNK_BYTES = 32 * 1024 * 1024
+# Eigenvectors per ticker counted by the absorption ratio; Kritzman et al.
+# use a fifth of the universe.
+ABSORPTION_FRACTION = 0.2
+
+
+def basket_rolling_corr(
+    returns: pd.DataFrame,
+    membership: np.ndarray,
+    window: int = CORR_WINDOW,
+    chunk_bytes: int = CORR_CHUNK_BYTES,
+) -> np.ndarray:
+    # Mean of each basket's full pairwise correlation matrix in each window,
+    # without materialising rolling().corr()'s dates x tickers x tickers
+    # panel. With z the window's population z-scores, sum_ij corr_ij over a
+    # basket equals sum_t (sum_i z_it)^2 / window, and the inner sums for all
+    # baskets are one product with the tickers x baskets membership matrix.
+    # A ticker with any gap (or no variance) in the window drops out, as its
+    # pairs are NaN in the pandas version.
+    values = returns.to_numpy(dtype=np.float64)
+    rows, tickers = values.shape
+    output = np.full((rows, membership.shape[1]), np.nan)
+    if rows >= window and tickers:
+        windows = sliding_window_view(values, window, axis=0)
+        step = max(1, chunk_bytes // (tickers * window * 8))
+        for start in range(0, len(windows), step):
+            block = windows[start : start + step]
+            mean = block.mean(axis=2, keepdims=True)
+            std = block.std(axis=2, keepdims=True)
+            valid = np.isfinite(std) & (std > 0)
+            z = np.where(valid, (block - mean) / np.where(valid, std, 1.0), 0.0)
+            total = np.square(z.transpose(0, 2, 1) @ membership).sum(axis=1)
+            count = valid[:, :, 0] @ membership
+            with np.errstate(invalid="ignore", divide="ignore"):
+                average = total / (window * np.square(count))
+            output[start + window - 1 : start + window - 1 + len(block)] = average
+    return output
+
 
+def average_rolling_corr(
+    returns: pd.DataFrame, window: int = CORR_WINDOW, chunk_bytes: int = CORR_CHUNK_BYTES
+) -> pd.Series:
+    membership = np.ones((returns.shape[1], 1))
+    average = basket_rolling_corr(returns, membership, window, chunk_bytes)[:, 0]
+    return pd.Series(average, index=returns.index)
 
-def compute_divergence_features(prices: pd.DataFrame, ai_tickers: list[str]) -> pd.DataFrame:
+
+def absorption_ratio(
+    returns: pd.DataFrame, window: int = CORR_WINDOW, fraction: float = ABSORPTION_FRACTION
+) -> pd.Series:
+    # Share of the rolling covariance's total variance taken up by its top
+    # k = ceil(fraction * tickers) eigenvalues. A window of w days has rank
+    # below w, and its non-zero spectrum is that of the centred w x w day
+    # Gram matrix, so the cost per day is one new Gram row (w x tickers) and
+    # a w x w eigvalsh however wide the universe is. Gram entries are plain
+    # dot products shifted along, so nothing drifts. Gaps count as zero
+    # returns, which keeps every window the same shape.
+    values = np.nan_to_num(returns.to_numpy(dtype=np.float64))
+    rows, tickers = values.shape
+    output = np.full(rows, np.nan)
+    if rows < window or not tickers:
+        return pd.Series(output, index=returns.index)
+    k = min(tickers, max(1, int(np.ceil(fraction * tickers))))
+    gram = values[:window] @ values[:window].T
+    for end in range(window, rows + 1):
+        if end > window:
+            gram[:-1, :-1] = gram[1:, 1:]
+            gram[-1] = gram[:, -1] = values[end - window : end] @ values[end - 1]
+        means = gram.mean(axis=1)
+        centred = gram - means[:, None] - means[None, :] + means.mean()
+        trace = float(np.trace(centred))
+        if trace <= 0:
+            continue
+        eigenvalues = np.linalg.eigvalsh(centred)
+        output[end - 1] = eigenvalues[-k:].clip(min=0).sum() / trace
+    return pd.Series(output, index=returns.index)
+
+
+def compute_divergence_features(
+    prices: pd.DataFrame, ai_tickers: list[str], features: Iterable[str] | None = None
+) -> pd.DataFrame:
+    wanted = set(DIVERGENCE_FEATURES if features is None else features)
     prices = prices.sort_index()
     available = [ticker for ticker in ai_tickers if ticker in prices.columns]
-    if not available:
+    if not available or not wanted:
         return pd.DataFrame(index=prices.index)
     returns = prices[available].pct_change(fill_method=None).dropna(how="all")
 
-    dispersion = returns.std(axis=1)
+    columns = {}
+    if "ai_dispersion" in wanted:
+        columns["ai_dispersion"] = returns.std(axis=1)
+
+    if "ai_crowding_corr" in wanted:
+        columns["ai_crowding_corr"] = average_rolling_corr(returns)
 
-    rolling_corr = returns.rolling(63).corr()
-    avg_corr = rolling_corr.groupby(level=0).mean().mean(axis=1)
+    if "ai_absorption_ratio" in wanted:
+        columns["ai_absorption_ratio"] = absorption_ratio(returns)
 
-    features = pd.DataFrame(
-        {
-            "ai_dispersion": dispersion,
-            "ai_crowding_corr": avg_corr,
-        }
-    )
-    return features
+    return pd.DataFrame(columns, index=returns.index)
@@ -2,8 +2,17 @@ from __future__ import annotations
 
 import pandas as pd
 
+from fragility_monitor.features.volatility import VOLATILITY_ESTIMATORS
 
-def compute_market_features(prices: pd.DataFrame, ai_tickers: list[str], benchmark: str = "SPY") -> pd.DataFrame:
+
+def compute_market_features(
+    prices: pd.DataFrame,
+    ai_tickers: list[str],
+    benchmark: str = "SPY",
+    ohlcv: dict[str, pd.DataFrame] | None = None,
+    estimator: str = "close",
+    vol_window: int = 21,
+) -> pd.DataFrame:
     prices = prices.sort_index()
     available = [ticker for ticker in ai_tickers if ticker in prices.columns]
     if not available:
@@ -11,12 +20,21 @@ def compute_market_features(prices: pd.DataFrame, ai_tickers: list[str], benchma
     returns = prices.pct_change(fill_method=None).dropna(how="all")
     ai_returns = returns[available].mean(axis=1)
     bench_returns = returns[benchmark] if benchmark in returns else returns.mean(axis=1)
+    # The full returns panel is the largest intermediate; drop it once reduced.
+    del returns
 
     ai_price = prices[available].mean(axis=1)
     ai_momentum = ai_price.pct_change(21)
     ai_acceleration = ai_momentum.diff(21)
-    ai_realized_vol = ai_returns.rolling(21).std() * (252 ** 0.5)
-    vol_of_vol = ai_realized_vol.rolling(21).std()
+    if estimator == "close":
+        ai_realized_vol = ai_returns.rolling(vol_window).std() * (252 ** 0.5)
+    else:
+        # Range estimators run per ticker on the daily bars; the basket
+        # volatility is their cross-sectional mean.
+        bars = {name: frame.reindex(columns=available) for name, frame in (ohlcv or {}).items()}
+        ticker_vol = VOLATILITY_ESTIMATORS[estimator](bars, vol_window)
+        ai_realized_vol = ticker_vol.mean(axis=1).reindex(ai_returns.index)
+    vol_of_vol = ai_realized_vol.rolling(vol_window).std()
 
     relative_strength = (ai_returns - bench_returns).rolling(21).sum()
 
@@ -1,19 +1,16 @@
 from __future__ import annotations
 
+import threading
+from typing import Iterable
+
 import numpy as np
 import pandas as pd
 
+NORMALIZED_COLUMNS = ["ai_density", "pricing_pressure", "risk_language"]
+METRIC_COLUMNS = ["ai_density", "efficiency_transform_ratio", "pricing_pressure", "risk_language"]
 
-def compute_narrative_features(filings: pd.DataFrame) -> pd.DataFrame:
-    if filings.empty:
-        return pd.DataFrame()
-    filings = filings.sort_index()
-    normalized = filings.copy()
-    for column in ["ai_density", "pricing_pressure", "risk_language"]:
-        normalized[column] = normalized.groupby("ticker")[column].transform(
-            lambda series: (series - series.mean()) / (series.std(ddof=0) or 1.0)
-        )
-    grouped = normalized.groupby("date").mean(numeric_only=True).sort_index()
+
+def _weekly_features(grouped: pd.DataFrame) -> pd.DataFrame:
     grouped = grouped.resample("W-FRI").ffill(limit=13)
 
     ratio_smoothed = grouped["efficiency_transform_ratio"].rolling(4, min_periods=1).mean()
@@ -29,3 +26,122 @@ def compute_narrative_features(filings: pd.DataFrame) -> pd.DataFrame:
     )
     features = features.replace([np.inf, -np.inf], np.nan)
     return features.fillna(0.0)
+
+
+def compute_narrative_features(filings: pd.DataFrame) -> pd.DataFrame:
+    if filings.empty:
+        return pd.DataFrame()
+    filings = filings.sort_index()
+    normalized = filings.copy()
+    by_ticker = normalized.groupby("ticker")[NORMALIZED_COLUMNS]
+    std = by_ticker.transform("std", ddof=0)
+    normalized[NORMALIZED_COLUMNS] = (
+        normalized[NORMALIZED_COLUMNS] - by_ticker.transform("mean")
+    ) / std.mask(std == 0, 1.0)
+    grouped = normalized.groupby("date").mean(numeric_only=True).sort_index()
+    return _weekly_features(grouped)
+
+
+def filing_keys(filings: pd.DataFrame) -> pd.Index:
+    if "accession" in filings.columns:
+        return pd.Index(filings["accession"].astype(str), name="accession")
+    # Older curated files have no accession column; key on ticker and date.
+    base = filings["ticker"].astype(str) + "|" + filings.index.astype(str)
+    occurrence = base.groupby(base).cumcount().astype(str)
+    return pd.Index(base + "#" + occurrence, name="accession")
+
+
+class NarrativeStore:
+    # Filing rows keyed by accession, per-ticker running mean/M2 (Welford,
+    # merged a batch at a time) and per-(date, ticker) metric sums. Adding a
+    # filing touches only its ticker's statistics and its own cell; the
+    # weekly frame is then rebuilt from the small date x ticker cell table
+    # instead of re-normalising every filing.
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.keys = pd.Index([], name="accession")
+        self._count = pd.DataFrame(columns=NORMALIZED_COLUMNS, dtype=float)
+        self._mean = pd.DataFrame(columns=NORMALIZED_COLUMNS, dtype=float)
+        self._m2 = pd.DataFrame(columns=NORMALIZED_COLUMNS, dtype=float)
+        self._sums: pd.DataFrame | None = None
+        self._counts: pd.DataFrame | None = None
+        self._features: dict[tuple[str, ...] | None, pd.DataFrame] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def sync(self, filings: pd.DataFrame) -> NarrativeStore:
+        # Adds filings not seen before; if any known filing disappeared the
+        # store is rebuilt, since running statistics can't forget a value.
+        keys = filing_keys(filings) if not filings.empty else pd.Index([], name="accession")
+        with self._lock:
+            if not self.keys.isin(keys).all():
+                self._reset()
+            fresh = ~keys.isin(self.keys) & ~keys.duplicated()
+            if fresh.any():
+                self._add(filings[fresh], keys[fresh])
+        return self
+
+    def _add(self, rows: pd.DataFrame, keys: pd.Index) -> None:
+        rows = rows.rename_axis("date")
+        by_ticker = rows.groupby("ticker")[NORMALIZED_COLUMNS]
+        n_b = by_ticker.count().astype(float)
+        mean_b = by_ticker.mean().fillna(0.0)
+        m2_b = (by_ticker.var(ddof=0) * n_b).fillna(0.0)
+        n_a = self._count.reindex(n_b.index).fillna(0.0)
+        mean_a = self._mean.reindex(n_b.index).fillna(0.0)
+        m2_a = self._m2.reindex(n_b.index).fillna(0.0)
+        n = n_a + n_b
+        weight = n_b / n.where(n > 0, 1.0)
+        delta = mean_b - mean_a
+        self._count = _upsert(self._count, n)
+        self._mean = _upsert(self._mean, mean_a + delta * weight)
+        self._m2 = _upsert(self._m2, m2_a + m2_b + delta**2 * n_a * weight)
+
+        cells = rows.groupby(["date", "ticker"])[METRIC_COLUMNS]
+        sums, counts = cells.sum(), cells.count().astype(float)
+        if self._sums is None or self._counts is None:
+            self._sums, self._counts = sums, counts
+        else:
+            self._sums = self._sums.add(sums, fill_value=0.0)
+            self._counts = self._counts.add(counts, fill_value=0.0)
+        self.keys = self.keys.append(keys)
+        self._features.clear()
+
+    def features(self, tickers: Iterable[str] | None = None) -> pd.DataFrame:
+        key = None if tickers is None else tuple(sorted(set(tickers)))
+        with self._lock:
+            cached = self._features.get(key)
+            if cached is None:
+                cached = self._compute(key)
+                self._features[key] = cached
+            return cached
+
+    def _compute(self, tickers: tuple[str, ...] | None) -> pd.DataFrame:
+        sums, counts = self._sums, self._counts
+        if sums is None or counts is None:
+            return pd.DataFrame()
+        if tickers is not None:
+            mask = sums.index.get_level_values("ticker").isin(tickers)
+            sums, counts = sums[mask], counts[mask]
+        if sums.empty:
+            return pd.DataFrame()
+        ticker = sums.index.get_level_values("ticker")
+        std = np.sqrt(self._m2 / self._count.where(self._count > 0))
+        std = std.mask(std == 0, 1.0)
+        # Sum of (x - mean) / std over a cell's rows is (sum - n * mean) / std.
+        mean = self._mean.reindex(ticker).to_numpy()
+        scale = std.reindex(ticker).to_numpy()
+        totals = sums.copy()
+        totals[NORMALIZED_COLUMNS] = (
+            sums[NORMALIZED_COLUMNS].to_numpy() - counts[NORMALIZED_COLUMNS].to_numpy() * mean
+        ) / scale
+        by_date = totals.groupby(level=0).sum() / counts.groupby(level=0).sum()
+        return _weekly_features(by_date.sort_index())
+
+
+def _upsert(frame: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([frame.drop(rows.index, errors="ignore"), rows]).sort_index()
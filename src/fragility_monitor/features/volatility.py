@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+# Per-ticker annualised volatility from the daily bars; every frame is
+# dates x tickers and the window is in trading days.
+
+
+def parkinson(ohlcv: dict[str, pd.DataFrame], window: int) -> pd.DataFrame:
+    range_sq = np.square(np.log(ohlcv["high"] / ohlcv["low"]))
+    variance = range_sq.rolling(window).mean() / (4 * np.log(2))
+    return np.sqrt(variance * TRADING_DAYS)
+
+
+def garman_klass(ohlcv: dict[str, pd.DataFrame], window: int) -> pd.DataFrame:
+    range_sq = np.square(np.log(ohlcv["high"] / ohlcv["low"]))
+    body_sq = np.square(np.log(ohlcv["close"] / ohlcv["open"]))
+    daily = 0.5 * range_sq - (2 * np.log(2) - 1) * body_sq
+    return np.sqrt(daily.rolling(window).mean().clip(lower=0) * TRADING_DAYS)
+
+
+def yang_zhang(ohlcv: dict[str, pd.DataFrame], window: int) -> pd.DataFrame:
+    open_, high, low, close = (ohlcv[name] for name in ("open", "high", "low", "close"))
+    overnight = np.log(open_ / close.shift(1))
+    intraday = np.log(close / open_)
+    up, down = np.log(high / open_), np.log(low / open_)
+    rogers_satchell = up * (up - intraday) + down * (down - intraday)
+    k = 0.34 / (1.34 + (window + 1) / (window - 1))
+    variance = (
+        overnight.rolling(window).var()
+        + k * intraday.rolling(window).var()
+        + (1 - k) * rogers_satchell.rolling(window).mean()
+    )
+    return np.sqrt(variance.clip(lower=0) * TRADING_DAYS)
+
+
+VOLATILITY_ESTIMATORS: dict[str, Callable[[dict[str, pd.DataFrame], int], pd.DataFrame]] = {
+    "parkinson": parkinson,
+    "garman_klass": garman_klass,
+    "yang_zhang": yang_zhang,
+}
+# Bar fields each estimator reads.
+ESTIMATOR_FIELDS = {
+    "close": (),
+    "parkinson": ("high", "low"),
+    "garman_klass": ("open", "high", "low", "close"),
+    "yang_zhang": ("open", "high", "low", "close"),
+}
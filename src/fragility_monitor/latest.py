@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fragility_monitor.data.cache import atomic_write_bytes
+
+# Kept free of pandas/numpy imports: ``fragility latest`` reads this file on
+# every shell prompt and cron health check.
+
+LATEST_NAME = "latest.json"
+TREND_POINTS = 60
+
+
+def latest_path(curated_dir: str | Path) -> Path:
+    return Path(curated_dir) / LATEST_NAME
+
+
+def snapshot(composite: Any, components: Any, summary: dict[str, Any]) -> dict[str, Any]:
+    latest = composite.iloc[-1]
+    return {
+        "asof": summary["asof"],
+        "index": float(latest["index"]),
+        "band_lower": float(latest["band_lower"]),
+        "band_upper": float(latest["band_upper"]),
+        "regime": summary["regime"],
+        "components": {
+            str(name): None if value != value else float(value)
+            for name, value in components.iloc[-1].items()
+        },
+        "trend": [float(value) for value in composite["index"].tail(TREND_POINTS)],
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_latest(path: Path, payload: dict[str, Any]) -> None:
+    atomic_write_bytes(path, json.dumps(payload, separators=(",", ":")).encode())
+
+
+def read_latest(path: Path) -> dict[str, Any] | None:
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
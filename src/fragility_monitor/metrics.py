@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Sharded:
+    # Each thread writes to its own dict, so recording never takes a lock;
+    # shards are only summed when /metrics is scraped.
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[dict[LabelValues, list[float]]] = []
+        self._register = threading.Lock()
+
+    def _shard(self) -> dict[LabelValues, list[float]]:
+        shard: dict[LabelValues, list[float]] | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._register:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _merged(self, width: int) -> dict[LabelValues, list[float]]:
+        merged: dict[LabelValues, list[float]] = {}
+        with self._register:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, values in list(shard.items()):
+                totals = merged.setdefault(key, [0.0] * width)
+                for index, value in enumerate(values):
+                    totals[index] += value
+        return merged
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__()
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            shard[labels] = [amount]
+        else:
+            cell[0] += amount
+
+    def value(self, *labels: str) -> float:
+        return self._merged(1).get(labels, [0.0])[0]
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_number(values[0])}"
+            for key, values in sorted(self._merged(1).items())
+        ]
+
+
+class Histogram(_Sharded):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            # Per-bucket (non-cumulative) counts, then +Inf, sum and count.
+            cell = [0.0] * (len(self.buckets) + 3)
+            shard[labels] = cell
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-2] += value
+        cell[-1] += 1
+
+    def samples(self) -> list[str]:
+        lines = []
+        for key, values in sorted(self._merged(len(self.buckets) + 3).items()):
+            running = 0.0
+            for bound, count in zip((*self.buckets, math.inf), values, strict=False):
+                running += count
+                bucket = _labels(self.labelnames, key, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{bucket} {_number(running)}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(values[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {_number(values[-1])}")
+        return lines
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        collect: Callable[[], dict[LabelValues, float | None]] | None = None,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.collect = collect
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def samples(self) -> list[str]:
+        values: dict[LabelValues, float | None] = dict(self._values)
+        if self.collect is not None:
+            values.update(self.collect())
+        return [
+            f"{self.name}{_labels(self.labelnames, key)} {_number(value)}"
+            for key, value in sorted(values.items())
+            if value is not None
+        ]
+
+
+Metric = Counter | Histogram | Gauge
+
+
+class Registry:
+    def __init__(self, metrics: Iterable[Metric] = ()) -> None:
+        self._metrics: dict[str, Metric] = {metric.name: metric for metric in metrics}
+
+    def metrics(self) -> list[Metric]:
+        return list(self._metrics.values())
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.samples()
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+FETCH_ERRORS = Counter(
+    "fragility_fetch_errors_total",
+    "Fetcher failures by data source",
+    ("source",),
+)
+CACHE_REQUESTS = Counter(
+    "fragility_cache_requests_total",
+    "Result cache lookups by cache and outcome",
+    ("cache", "result"),
+)
+STAGE_DURATION = Histogram(
+    "fragility_stage_duration_seconds",
+    "Pipeline stage wall time",
+    ("stage",),
+)
+HTTP_DURATION = Histogram(
+    "fragility_http_request_duration_seconds",
+    "API request latency",
+    ("route", "method", "status"),
+)
+
+for _metric in (FETCH_ERRORS, CACHE_REQUESTS, STAGE_DURATION, HTTP_DURATION):
+    REGISTRY.register(_metric)
+
+
+def _observe_stage(name: str, seconds: float) -> None:
+    STAGE_DURATION.observe(seconds, name)
+
+
+def install_stage_metrics() -> None:
+    from fragility_monitor.profiling import add_sink
+
+    add_sink(_observe_stage)
@@ -1,27 +1,63 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 import numpy as np
 import pandas as pd
 
-from fragility_monitor.config import Config
+from fragility_monitor.config import Config, fetch_config
 from fragility_monitor.data.cache import ensure_dirs, read_parquet, write_parquet
 from fragility_monitor.data.fetchers.fred import FredFetcher
 from fragility_monitor.data.fetchers.sec_edgar import EdgarConfig, SecEdgarFetcher
 from fragility_monitor.data.fetchers.stooq import StooqFetcher
+from fragility_monitor.data.ohlcv import read_ohlcv, write_ohlcv
+from fragility_monitor.executor import Task, run_tasks
+from fragility_monitor.features.baskets import compute_basket_features
+from fragility_monitor.features.chunked import (
+    FEATURE_WARMUP,
+    chunked_features,
+    iter_parquet_blocks,
+    parquet_columns,
+)
 from fragility_monitor.features.divergence import compute_divergence_features
 from fragility_monitor.features.market import compute_market_features
-from fragility_monitor.features.narrative import compute_narrative_features
-from fragility_monitor.scoring.components import compute_component_scores
-from fragility_monitor.scoring.composite import compute_composite, label_regime
+from fragility_monitor.features.narrative import NarrativeStore, compute_narrative_features
+from fragility_monitor.features.volatility import ESTIMATOR_FIELDS
+from fragility_monitor.latest import latest_path, snapshot, write_latest
+from fragility_monitor.profiling import peak_rss_kb, stage
 from fragility_monitor.scoring.backtest import define_stress_events, evaluate_signals
+from fragility_monitor.scoring.components import compute_component_panel
+from fragility_monitor.scoring.composite import compute_composite, label_regime, summarize
+from fragility_monitor.scoring.registry import (
+    ComponentSpec,
+    component_specs,
+    required_features,
+    resolve_components,
+)
+from fragility_monitor.scoring.scenarios import ScenarioResult, run_scenarios
 
 LOGGER = logging.getLogger(__name__)
 
+SEC_SOURCE_KEYS = {
+    "tickers_url": "sec_tickers_url",
+    "submissions_url": "sec_submissions_url",
+    "archives_url": "sec_archives_url",
+}
+
+
+@dataclass
+class MonitorFeatures:
+    market: pd.DataFrame
+    divergence: pd.DataFrame
+    narrative: pd.DataFrame
+    macro: pd.DataFrame
+    ai_returns: pd.Series
+    # (basket, feature) columns for the [market.baskets] tables, if any.
+    baskets: pd.DataFrame = field(default_factory=pd.DataFrame)
+
 
 @dataclass
 class MonitorResult:
@@ -29,6 +65,61 @@ class MonitorResult:
     components: pd.DataFrame
     summary: dict[str, Any]
     backtest: dict[str, float]
+    features: MonitorFeatures | None = field(default=None, repr=False)
+    # (window, component) scores for the main and [scoring] sensitivity_years
+    # windows, and per window the latest index and backtest.
+    panel: pd.DataFrame | None = field(default=None, repr=False)
+    sensitivity: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+
+# Pipeline stages in order; a config change invalidates the first stage that
+# reads the changed section and everything after it.
+STAGES = ("inputs", "features", "scores", "composite")
+STAGE_SECTIONS = {
+    "inputs": ("data", "general", "market", "fred", "sec", "sources"),
+    "scores": ("scoring", "components"),
+    "composite": ("weights",),
+}
+
+
+def component_plan(config: Config, extra: Iterable[str] = ()) -> list[ComponentSpec]:
+    # Every weighted component (zero weights still shape the band), plus the
+    # ones [scoring] components and the caller (e.g. the report) ask for.
+    requested = [*config.weights, *config.scoring.get("components", []), *extra]
+    return resolve_components(requested, component_specs(config.components))
+
+
+def _feature_keys(config: Config) -> set[str]:
+    # What compute_features actually builds: market always, narrative and
+    # macro as whole groups, divergence column by column.
+    needs = required_features(component_plan(config))
+    keys = {"market"} | {group for group in ("narrative", "macro") if needs[group]}
+    return keys | {f"divergence.{name}" for name in needs["divergence"]}
+
+
+def changed_sections(old: Config, new: Config) -> set[str]:
+    old_dict, new_dict = old.to_dict(), new.to_dict()
+    keys = old_dict.keys() | new_dict.keys()
+    changed = {key for key in keys if old_dict.get(key) != new_dict.get(key)}
+    if old.universes != new.universes:
+        changed.add("universes")
+    return changed
+
+
+def invalidated_stage(old: Config, new: Config) -> str | None:
+    changed = changed_sections(old, new)
+    stage = next(
+        (stage for stage in STAGES if changed.intersection(STAGE_SECTIONS.get(stage, ()))), None
+    )
+    if stage in {"scores", "composite"}:
+        # Features are computed lazily per component plan and are not cached
+        # apart from the inputs, so needing a new one means starting over.
+        if not _feature_keys(new) <= _feature_keys(old):
+            return "inputs"
+        old_names = {spec.name for spec in component_plan(old)}
+        if stage == "composite" and not {spec.name for spec in component_plan(new)} <= old_names:
+            return "scores"
+    return stage
 
 
 def _weekly(df: pd.DataFrame) -> pd.DataFrame:
@@ -51,101 +142,520 @@ def _macro_features(macro: pd.DataFrame, prices: pd.DataFrame) -> pd.DataFrame:
     return features
 
 
-def _interpretation(score: float) -> str:
-    regime = label_regime(score)
-    if regime in {"Calm", "Warming"}:
-        return "Signals suggest stable positioning with contained stress; monitor for divergence shifts."
-    if regime == "Elevated":
-        return "Fragility is building; crowding or narrative decay may be increasing sensitivity."
-    if regime == "Stressed":
-        return "Stress indicators are high; risk appetite appears fragile and crowding elevated."
-    return "Market structure looks fragile; de-risking and narrative deterioration are pronounced."
+def curated_paths(config: Config) -> dict[str, Path]:
+    curated_dir = Path(config.data["curated_dir"])
+    return {
+        "market": curated_dir / "market_prices.parquet",
+        "macro": curated_dir / "macro_series.parquet",
+        "filings": curated_dir / "filing_signals.parquet",
+        "ohlcv": curated_dir / "market_ohlcv",
+    }
 
 
-def run_monitor(config: Config, refresh: bool = False) -> MonitorResult:
-    raw_dir = Path(config.data["raw_dir"])
-    curated_dir = Path(config.data["curated_dir"])
-    ensure_dirs(raw_dir, curated_dir)
+@dataclass
+class MonitorInputs:
+    prices: pd.DataFrame
+    macro: pd.DataFrame
+    filings: pd.DataFrame
+    # Long-lived callers (the API panel) keep narrative state across refreshes.
+    narrative: NarrativeStore | None = field(default=None, repr=False)
+    # Daily bars by field, loaded only for the range volatility estimators.
+    ohlcv: dict[str, pd.DataFrame] = field(default_factory=dict, repr=False)
+
+
+def price_tickers(config: Config) -> list[str]:
+    members = [ticker for basket in _baskets(config).values() for ticker in basket]
+    return list(dict.fromkeys(config.market["ai_tickers"] + config.market["benchmarks"] + members))
+
+
+def _baskets(config: Config) -> dict[str, list[str]]:
+    return {name: list(members) for name, members in config.market.get("baskets", {}).items()}
+
 
-    tickers = list(dict.fromkeys(config.market["ai_tickers"] + config.market["benchmarks"]))
+def volatility_estimator(config: Config) -> tuple[str, int]:
+    estimator = config.market.get("volatility_estimator", "close")
+    if estimator not in ESTIMATOR_FIELDS:
+        raise ValueError(f"Unknown volatility estimator {estimator!r}")
+    return estimator, int(config.market.get("volatility_window", 21))
 
-    market_path = curated_dir / "market_prices.parquet"
-    if refresh or not market_path.exists():
-        prices = StooqFetcher().fetch_prices(tickers).prices
-        write_parquet(prices, market_path)
+
+def _load_market(config: Config, path: Path, refresh: bool) -> pd.DataFrame:
+    tickers = price_tickers(config)
+    if refresh or not path.exists():
+        market = StooqFetcher(base_url=config.sources.get("stooq_url")).fetch_prices(tickers)
+        prices = market.prices
+        with stage("store.write_market", rows_in=len(prices)):
+            write_parquet(prices, path)
+            if market.ohlcv:
+                write_ohlcv(curated_paths(config)["ohlcv"], market.ohlcv)
     else:
-        prices = read_parquet(market_path)
-        if prices is None:
-            prices = pd.DataFrame()
+        with stage("store.read_market") as handle:
+            # Chunked runs stream the full panel from the store during the
+            # feature stage; only the benchmarks (for the macro fallback and
+            # the date index) are held in memory.
+            columns = None
+            if _chunk_days(config):
+                benchmarks = config.market["benchmarks"]
+                columns = [name for name in parquet_columns(path) if name in benchmarks]
+            prices = read_parquet(path, columns=columns)
+            if prices is None:
+                prices = pd.DataFrame()
+            handle.rows_out = len(prices)
     if prices.empty:
         raise RuntimeError("No market data fetched. Check network access or Stooq availability.")
+    return prices
+
+
+def _load_ohlcv(config: Config, store_dir: Path) -> dict[str, pd.DataFrame]:
+    estimator, _ = volatility_estimator(config)
+    fields = ESTIMATOR_FIELDS[estimator]
+    if not fields:
+        return {}
+    with stage("store.read_ohlcv") as handle:
+        bars = read_ohlcv(store_dir, fields, tickers=config.market["ai_tickers"])
+        handle.rows_out = max((len(frame) for frame in bars.values()), default=0)
+    missing = sorted(set(fields) - set(bars))
+    if missing:
+        LOGGER.warning(
+            "OHLCV store lacks %s; %s volatility falls back to close-to-close",
+            ", ".join(missing),
+            estimator,
+        )
+        return {}
+    return bars
+
 
-    fred_fetcher = FredFetcher(api_key=config.fred.get("api_key"))
-    macro_path = curated_dir / "macro_series.parquet"
-    if refresh or not macro_path.exists():
+def _load_macro(config: Config, path: Path, refresh: bool) -> pd.DataFrame:
+    if refresh or not path.exists():
+        fred_fetcher = FredFetcher(
+            api_key=config.fred.get("api_key"), base_url=config.sources.get("fred_url")
+        )
         macro = fred_fetcher.fetch_series(config.fred.get("series", {})).series
-        write_parquet(macro, macro_path)
+        with stage("store.write_macro", rows_in=len(macro)):
+            write_parquet(macro, path)
     else:
-        macro = read_parquet(macro_path)
-        if macro is None:
-            macro = pd.DataFrame()
+        with stage("store.read_macro") as handle:
+            macro = read_parquet(path)
+            if macro is None:
+                macro = pd.DataFrame()
+            handle.rows_out = len(macro)
+    return macro
 
-    sec_path = curated_dir / "filing_signals.parquet"
-    if refresh or not sec_path.exists():
+
+def _load_filings(config: Config, path: Path, refresh: bool) -> pd.DataFrame:
+    if refresh or not path.exists():
         edgar_config = EdgarConfig(
             user_agent=config.sec["user_agent"],
             max_filings_per_ticker=int(config.sec["max_filings_per_ticker"]),
-            cache_dir=raw_dir,
+            cache_dir=Path(config.data["raw_dir"]),
+            **{
+                field_name: config.sources[key]
+                for field_name, key in SEC_SOURCE_KEYS.items()
+                if config.sources.get(key)
+            },
         )
         filings = SecEdgarFetcher(edgar_config).fetch_signals(config.market["ai_tickers"]).metrics
-        write_parquet(filings, sec_path)
+        with stage("store.write_filings", rows_in=len(filings)):
+            write_parquet(filings, path)
     else:
-        filings = read_parquet(sec_path)
-        if filings is None:
-            filings = pd.DataFrame()
-
-    market_features = compute_market_features(prices, config.market["ai_tickers"], benchmark="SPY")
-    if market_features.empty:
-        raise RuntimeError("Market features could not be computed from available price data.")
-    divergence_features = compute_divergence_features(prices, config.market["ai_tickers"])
-    narrative_features = compute_narrative_features(filings)
-    macro_features = _macro_features(macro, prices)
-
-    market_weekly = _weekly(market_features)
-    divergence_weekly = _weekly(divergence_features)
-    narrative_weekly = narrative_features.reindex(market_weekly.index).ffill(limit=13)
-    macro_weekly = _weekly(macro_features)
-
-    window_weeks = int(config.scoring["rolling_window_years"] * 52)
-    lower_q, upper_q = config.scoring["winsorize_quantiles"]
+        with stage("store.read_filings") as handle:
+            filings = read_parquet(path)
+            if filings is None:
+                filings = pd.DataFrame()
+            handle.rows_out = len(filings)
+    return filings
+
+
+# Largest composite drift (index points) compact mode is allowed versus a
+# float64 run; synthetic benchmarks land around 1e-4.
+COMPACT_TOLERANCE = 0.01
+
+
+def compact_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    floats = frame.select_dtypes(include="float64").columns
+    if floats.empty:
+        return frame
+    return frame.astype(dict.fromkeys(floats, np.float32))
+
+
+def _compact(config: Config) -> bool:
+    return bool(config.general.get("compact", False))
+
+
+def _chunk_days(config: Config) -> int:
+    return int(config.general.get("chunk_days", 0) or 0)
+
+
+def worker_count(config: Config) -> int | None:
+    return int(config.general.get("workers", 0) or 0) or None
+
+
+def load_inputs(config: Config, refresh: bool = False) -> MonitorInputs:
+    ensure_dirs(Path(config.data["raw_dir"]), Path(config.data["curated_dir"]))
+    paths = curated_paths(config)
+    # The curated stores are shared by every universe, so writes fetch the
+    # union of their tickers; _universe_inputs narrows the panel later.
+    store = fetch_config(config)
+    # The three sources are independent I/O, so a refresh takes as long as
+    # the slowest one rather than the sum.
+    loaded = run_tasks(
+        [
+            Task("market", lambda: _load_market(store, paths["market"], refresh)),
+            Task("macro", lambda: _load_macro(store, paths["macro"], refresh)),
+            Task("filings", lambda: _load_filings(store, paths["filings"], refresh)),
+            # After "market", which writes the bars on a refresh.
+            Task("ohlcv", lambda _: _load_ohlcv(config, paths["ohlcv"]), deps=("market",)),
+        ],
+        workers=worker_count(config),
+    )
+    prices, macro, ohlcv = loaded.pop("market"), loaded.pop("macro"), loaded.pop("ohlcv")
+    if _compact(config):
+        prices, macro = compact_frame(prices), compact_frame(macro)
+        ohlcv = {name: compact_frame(frame) for name, frame in ohlcv.items()}
+    return MonitorInputs(prices=prices, macro=macro, filings=loaded["filings"], ohlcv=ohlcv)
+
+
+def _universe_inputs(config: Config, inputs: MonitorInputs) -> MonitorInputs:
+    # The loaded panel may be shared by several universes; only hand the
+    # pipeline the tickers this config asks for.
+    tickers = price_tickers(config)
+    prices = inputs.prices[[ticker for ticker in tickers if ticker in inputs.prices.columns]]
+    filings = inputs.filings
+    if not filings.empty and "ticker" in filings.columns:
+        filings = filings[filings["ticker"].isin(config.market["ai_tickers"])]
+    return MonitorInputs(
+        prices=prices,
+        macro=inputs.macro,
+        filings=filings,
+        narrative=inputs.narrative,
+        ohlcv=inputs.ohlcv,
+    )
+
+
+def compute_features(
+    config: Config, inputs: MonitorInputs, plan: list[ComponentSpec] | None = None
+) -> MonitorFeatures:
+    needs = required_features(component_plan(config) if plan is None else plan)
+    inputs = _universe_inputs(config, inputs)
+    prices, macro, filings = inputs.prices, inputs.macro, inputs.filings
+
+    tickers = config.market["ai_tickers"]
+    shrink = compact_frame if _compact(config) else (lambda frame: frame)
+
+    estimator, vol_window = volatility_estimator(config)
+    if estimator != "close" and not inputs.ohlcv:
+        estimator = "close"
+
+    def price_features(
+        compute: Callable[[pd.DataFrame], pd.DataFrame],
+        warmup: int = FEATURE_WARMUP,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        chunk_days = _chunk_days(config)
+        if not chunk_days:
+            return compute(prices)
+        path = curated_paths(config)["market"]
+        wanted = price_tickers(config)
+        stored = set(parquet_columns(path))
+        blocks = iter_parquet_blocks(path, chunk_days, [name for name in wanted if name in stored])
+        return chunked_features((shrink(block) for block in blocks), compute, warmup, columns)
+
+    def market() -> pd.DataFrame:
+        with stage("features.market", rows_in=len(prices)) as handle:
+            features = price_features(
+                lambda frame: compute_market_features(
+                    frame,
+                    tickers,
+                    benchmark="SPY",
+                    ohlcv={name: bars.reindex(frame.index) for name, bars in inputs.ohlcv.items()},
+                    estimator=estimator,
+                    vol_window=vol_window,
+                ),
+                # Volatility, then its own rolling std, behind one return.
+                warmup=max(FEATURE_WARMUP, 2 * vol_window + 1),
+                columns=tickers,
+            )
+            handle.rows_out = len(features)
+        if features.empty:
+            raise RuntimeError("Market features could not be computed from available price data.")
+        return features
+
+    def divergence() -> pd.DataFrame:
+        with stage("features.divergence", rows_in=len(prices)) as handle:
+            features = price_features(
+                lambda frame: compute_divergence_features(
+                    frame, tickers, features=needs["divergence"]
+                ),
+                columns=tickers,
+            )
+            handle.rows_out = len(features)
+        return features
+
+    def narrative() -> pd.DataFrame:
+        if not needs["narrative"]:
+            return pd.DataFrame()
+        with stage("features.narrative", rows_in=len(filings)) as handle:
+            if inputs.narrative is not None:
+                features = inputs.narrative.features(tickers)
+            else:
+                features = compute_narrative_features(filings)
+            handle.rows_out = len(features)
+        return features
+
+    def basket_group() -> pd.DataFrame:
+        baskets = _baskets(config)
+        if not baskets:
+            return pd.DataFrame()
+        with stage("features.baskets", rows_in=len(prices)) as handle:
+            features = price_features(
+                lambda frame: compute_basket_features(frame, baskets, benchmark="SPY")
+            )
+            handle.rows_out = len(features)
+        return features
+
+    def macro_group() -> pd.DataFrame:
+        if not needs["macro"]:
+            return pd.DataFrame(index=prices.index)
+        with stage("features.macro", rows_in=len(macro)) as handle:
+            features = _macro_features(macro, prices)
+            handle.rows_out = len(features)
+        return features
+
+    computed = run_tasks(
+        [
+            Task("market", lambda: shrink(market()), kind="cpu"),
+            Task("divergence", lambda: shrink(divergence()), kind="cpu"),
+            Task("narrative", lambda: shrink(narrative()), kind="cpu"),
+            Task("macro", lambda: shrink(macro_group()), kind="cpu"),
+            Task("baskets", lambda: shrink(basket_group()), kind="cpu"),
+        ],
+        workers=worker_count(config),
+    )
+    # Pop rather than index so each daily frame is freed once its weekly
+    # version exists.
+    market_features = computed.pop("market")
+    divergence_features = computed.pop("divergence")
+    narrative_features = computed.pop("narrative")
+    macro_features = computed.pop("macro")
+    basket_features = computed.pop("baskets")
+
+    with stage("features.weekly", rows_in=len(market_features)) as handle:
+        market_weekly = _weekly(market_features)
+        divergence_weekly = _weekly(divergence_features)
+        del divergence_features
+        narrative_weekly = narrative_features.reindex(market_weekly.index).ffill(limit=13)
+        macro_weekly = _weekly(macro_features)
+        del macro_features
+        basket_weekly = _weekly(basket_features)
+        del basket_features
+        handle.rows_out = len(market_weekly)
 
-    components = compute_component_scores(
-        market_weekly,
-        divergence_weekly,
-        narrative_weekly,
-        macro_weekly,
-        window_weeks,
-        lower_q,
-        upper_q,
+    ai_returns = market_features.get("ai_returns", pd.Series(dtype=float))
+    del market_features
+    return MonitorFeatures(
+        market=market_weekly,
+        divergence=divergence_weekly,
+        narrative=narrative_weekly,
+        macro=macro_weekly,
+        ai_returns=ai_returns,
+        baskets=basket_weekly,
     )
 
-    composite = compute_composite(components, config.weights)
-    composite = composite.dropna(subset=["index"])
+
+def scoring_window(config: Config) -> int:
+    return int(config.scoring["rolling_window_years"] * 52)
+
+
+def scoring_windows(config: Config) -> list[int]:
+    # The main window first, then the sensitivity windows in weeks.
+    years = config.scoring.get("sensitivity_years", [])
+    main = scoring_window(config)
+    return [main, *sorted({int(value * 52) for value in years} - {main})]
+
+
+def score_panel(
+    config: Config,
+    features: MonitorFeatures,
+    plan: list[ComponentSpec] | None = None,
+    windows: Iterable[int] | None = None,
+) -> pd.DataFrame:
+    windows = scoring_windows(config) if windows is None else list(windows)
+    lower_q, upper_q = config.scoring["winsorize_quantiles"]
+
+    with stage("scoring.components", rows_in=len(features.market)) as handle:
+        panel = compute_component_panel(
+            features.market,
+            features.divergence,
+            features.narrative,
+            features.macro,
+            windows,
+            lower_q,
+            upper_q,
+            plan=component_plan(config) if plan is None else plan,
+        )
+        handle.rows_out = len(panel)
+    return panel
+
+
+def score_features(
+    config: Config, features: MonitorFeatures, plan: list[ComponentSpec] | None = None
+) -> pd.DataFrame:
+    window = scoring_window(config)
+    return window_scores(score_panel(config, features, plan, [window]), window)
+
+
+def window_scores(panel: pd.DataFrame, window: int) -> pd.DataFrame:
+    return panel[window].rename_axis(columns=None)
+
+
+def window_sensitivity(
+    config: Config, ai_returns: pd.Series, panel: pd.DataFrame
+) -> pd.DataFrame:
+    # One row per scored window: the composite's latest value and regime and
+    # the stress-event backtest of that window's composite.
+    events = None
+    if not ai_returns.empty:
+        events = define_stress_events(ai_returns)
+    rows = []
+    for window in panel.columns.unique("window"):
+        index = compute_composite(window_scores(panel, window), config.weights)["index"].dropna()
+        if index.empty:
+            continue
+        row = {
+            "window_weeks": int(window),
+            "window_years": window / 52,
+            "index": float(index.iloc[-1]),
+            "regime": label_regime(float(index.iloc[-1])),
+        }
+        if events is not None:
+            row.update(evaluate_signals(index, events))
+        rows.append(row)
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).set_index("window_years").sort_index()
+
+
+def build_result(
+    config: Config,
+    features: MonitorFeatures,
+    components: pd.DataFrame,
+    panel: pd.DataFrame | None = None,
+) -> MonitorResult:
+    with stage("scoring.composite", rows_in=len(components)) as handle:
+        composite = compute_composite(components, config.weights)
+        composite = composite.dropna(subset=["index"])
+        handle.rows_out = len(composite)
     if composite.empty:
         raise RuntimeError("Composite index is empty after scoring; check input data coverage.")
 
-    index_value = float(composite["index"].iloc[-1])
-    summary = {
-        "asof": str(composite.index[-1].date()),
-        "index": index_value,
-        "regime": label_regime(index_value),
-        "components": {k.replace("_", " ").title(): float(v) for k, v in components.iloc[-1].items()},
-        "interpretation": _interpretation(index_value),
-    }
+    summary = summarize(composite, components)
 
     backtest = {}
-    if "ai_returns" in market_features.columns:
-        events = define_stress_events(market_features["ai_returns"])
-        backtest = evaluate_signals(composite["index"], events)
+    if not features.ai_returns.empty:
+        with stage("scoring.backtest", rows_in=len(features.ai_returns)):
+            events = define_stress_events(features.ai_returns)
+            backtest = evaluate_signals(composite["index"], events)
+
+    sensitivity = pd.DataFrame()
+    if panel is not None and len(panel.columns.unique("window")) > 1:
+        with stage("scoring.sensitivity", rows_in=len(panel)):
+            sensitivity = window_sensitivity(config, features.ai_returns, panel)
+
+    return MonitorResult(
+        composite=composite,
+        components=components,
+        summary=summary,
+        backtest=backtest,
+        features=features,
+        panel=panel,
+        sensitivity=sensitivity,
+    )
+
+
+def compute_monitor(
+    config: Config, inputs: MonitorInputs, components: Iterable[str] = ()
+) -> MonitorResult:
+    plan = component_plan(config, components)
+    features = compute_features(config, inputs, plan)
+    panel = score_panel(config, features, plan)
+    return build_result(config, features, window_scores(panel, scoring_window(config)), panel)
+
+
+def recompute_result(config: Config, previous: MonitorResult, stage: str) -> MonitorResult:
+    # Re-run the pipeline from ``stage`` onward, reusing the features and
+    # component scores cached on ``previous``. Rescoring keeps every component
+    # ``previous`` carried, not just the weighted ones.
+    if previous.features is None or stage not in {"scores", "composite"}:
+        raise ValueError(f"Cannot resume the pipeline at stage {stage!r} from a cached result")
+    components, panel = previous.components, previous.panel
+    if stage == "scores":
+        plan = component_plan(config, previous.components.columns)
+        panel = score_panel(config, previous.features, plan)
+        components = window_scores(panel, scoring_window(config))
+    return build_result(config, previous.features, components, panel)
+
+
+def compute_scenarios(
+    config: Config, inputs: MonitorInputs, result: MonitorResult, **options: Any
+) -> ScenarioResult:
+    # Monte Carlo fan around ``result``: see scoring.scenarios.run_scenarios
+    # for the options (n_paths, horizon_weeks, block_days, vol_scale, shock,
+    # seed).
+    if result.features is None:
+        raise ValueError("Scenarios need a result that carries its features")
+    estimator, vol_window = volatility_estimator(config)
+    if estimator != "close":
+        # Paths are resampled daily returns, without the bars a range
+        # estimator reads, so the simulated volatility would not be the
+        # quantity the history was scored on.
+        raise ValueError(
+            f"Scenarios support only the close volatility estimator, not {estimator!r}"
+        )
+    lower_q, upper_q = config.scoring["winsorize_quantiles"]
+    prices = _universe_inputs(config, inputs).prices.sort_index()
+    tickers = config.market["ai_tickers"]
+    available = [ticker for ticker in tickers if ticker in prices.columns]
+    with stage("scenarios.daily", rows_in=len(prices)):
+        market = compute_market_features(prices, tickers, benchmark="SPY")
+        daily = market[["ai_returns", "bench_returns"]].assign(
+            ai_price=prices[available].mean(axis=1)
+        )
+    features = result.features
+    with stage("scenarios.simulate") as handle:
+        scenarios = run_scenarios(
+            daily,
+            {
+                "market": features.market,
+                "divergence": features.divergence,
+                "narrative": features.narrative,
+                "macro": features.macro,
+            },
+            component_plan(config),
+            config.weights,
+            scoring_window(config),
+            lower_q=lower_q,
+            upper_q=upper_q,
+            start=float(result.composite["index"].iloc[-1]),
+            vol_window=vol_window,
+            **options,
+        )
+        handle.rows_out = scenarios.paths.size
+    return scenarios
+
+
+def publish_latest(config: Config, result: MonitorResult) -> MonitorResult:
+    path = latest_path(config.data["curated_dir"])
+    write_latest(path, snapshot(result.composite, result.components, result.summary))
+    return result
+
 
-    return MonitorResult(composite=composite, components=components, summary=summary, backtest=backtest)
+def run_monitor(
+    config: Config, refresh: bool = False, latest: bool = True, components: Iterable[str] = ()
+) -> MonitorResult:
+    with stage("monitor.run"):
+        result = compute_monitor(config, load_inputs(config, refresh=refresh), components)
+    peak = peak_rss_kb()
+    if peak is not None:
+        mode = " (compact mode)" if _compact(config) else ""
+        LOGGER.info("Peak RSS %.0f MB%s", peak / 1024, mode)
+    return publish_latest(config, result) if latest else result
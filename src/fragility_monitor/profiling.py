@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class StageRecord:
+    name: str
+    start_s: float
+    wall_s: float
+    cpu_s: float
+    thread: int
+    depth: int
+    rows_in: int | None = None
+    rows_out: int | None = None
+    peak_rss_kb: int | None = None
+    mem_delta_bytes: int | None = None
+    mem_peak_bytes: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class StageHandle:
+    rows_in: int | None = None
+    rows_out: int | None = None
+
+
+@dataclass
+class _Frame:
+    base: int
+    peak_seen: int = 0
+
+
+def row_count(value: Any) -> int | None:
+    if value is None:
+        return None
+    for attr in ("prices", "series", "metrics"):
+        inner = getattr(value, attr, None)
+        if inner is not None and hasattr(inner, "shape"):
+            return int(inner.shape[0])
+    shape = getattr(value, "shape", None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+def peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+@dataclass
+class Profiler:
+    trace_memory: bool = False
+    records: list[StageRecord] = field(default_factory=list)
+    origin: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+
+    def _stack(self) -> list[_Frame]:
+        stack: list[_Frame] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    @contextmanager
+    def stage(self, name: str, rows_in: int | None = None) -> Iterator[StageHandle]:
+        handle = StageHandle(rows_in=rows_in)
+        stack = self._stack()
+        frame = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            # Fold the running peak into the parent before resetting it so
+            # nested stages don't hide the outer stage's high-water mark.
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+            tracemalloc.reset_peak()
+            frame = _Frame(base=current)
+        stack.append(frame or _Frame(base=0))
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        error = None
+        try:
+            yield handle
+        except BaseException as exc:
+            error = type(exc).__name__
+            raise
+        finally:
+            wall = time.perf_counter() - start
+            cpu = time.thread_time() - cpu_start
+            stack.pop()
+            record = StageRecord(
+                name=name,
+                start_s=start - self.origin,
+                wall_s=wall,
+                cpu_s=cpu,
+                thread=threading.get_ident(),
+                depth=len(stack),
+                rows_in=handle.rows_in,
+                rows_out=handle.rows_out,
+                peak_rss_kb=peak_rss_kb(),
+                error=error,
+            )
+            if frame is not None:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame.peak_seen)
+                record.mem_delta_bytes = current - frame.base
+                record.mem_peak_bytes = peak - frame.base
+                if stack:
+                    stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+            with self._lock:
+                self.records.append(record)
+            for sink in _SINKS:
+                sink(name, wall)
+
+    def to_dict(self) -> dict[str, Any]:
+        records = sorted(self.records, key=lambda record: record.start_s)
+        top_level = [record for record in records if record.depth == 0]
+        return {
+            "total_wall_s": sum(record.wall_s for record in top_level),
+            "peak_rss_kb": peak_rss_kb(),
+            "stages": [asdict(record) for record in records],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        events = []
+        for record in sorted(self.records, key=lambda record: record.start_s):
+            args = {
+                key: value
+                for key, value in asdict(record).items()
+                if key not in {"name", "start_s", "wall_s", "thread", "depth"} and value is not None
+            }
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": record.start_s * 1e6,
+                    "dur": record.wall_s * 1e6,
+                    "pid": pid,
+                    "tid": record.thread,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, json_path: Path | None = None, trace_path: Path | None = None) -> None:
+        if json_path is not None:
+            json_path.write_text(json.dumps(self.to_dict(), indent=2))
+        if trace_path is not None:
+            trace_path.write_text(json.dumps(self.to_chrome_trace()))
+
+
+_ACTIVE: Profiler | None = None
+_SINKS: list[Callable[[str, float], None]] = []
+
+
+def active_profiler() -> Profiler | None:
+    return _ACTIVE
+
+
+def add_sink(sink: Callable[[str, float], None]) -> None:
+    # Sinks receive (stage name, wall seconds) for every stage, with or
+    # without an active profiler; the API server feeds its metrics this way.
+    if sink not in _SINKS:
+        _SINKS.append(sink)
+
+
+@contextmanager
+def profiling(trace_memory: bool = False) -> Iterator[Profiler]:
+    global _ACTIVE
+    previous = _ACTIVE
+    profiler = Profiler(trace_memory=trace_memory)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    _ACTIVE = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = previous
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def carry_stack(func: F) -> F:
+    # Stages recorded by ``func`` on a worker thread nest under the stage
+    # that was open on the submitting thread, so depths and totals stay right.
+    profiler = _ACTIVE
+    if profiler is None:
+        return func
+    depth = len(profiler._stack())
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stack = profiler._stack()
+        stack[:0] = [_Frame(base=0) for _ in range(depth)]
+        try:
+            return func(*args, **kwargs)
+        finally:
+            del stack[:depth]
+
+    return wrapper  # type: ignore[return-value]
+
+
+_NULL = StageHandle()
+
+
+@contextmanager
+def stage(name: str, rows_in: int | None = None) -> Iterator[StageHandle]:
+    profiler = _ACTIVE
+    if profiler is None:
+        if not _SINKS:
+            # Disabled: no clocks, no allocation beyond the generator itself.
+            yield _NULL
+            return
+        start = time.perf_counter()
+        try:
+            yield StageHandle(rows_in=rows_in)
+        finally:
+            elapsed = time.perf_counter() - start
+            for sink in _SINKS:
+                sink(name, elapsed)
+        return
+    with profiler.stage(name, rows_in=rows_in) as handle:
+        yield handle
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _ACTIVE is None and not _SINKS:
+                return func(*args, **kwargs)
+            rows_in = next((row_count(arg) for arg in args if hasattr(arg, "shape")), None)
+            with stage(name, rows_in=rows_in) as handle:
+                result = func(*args, **kwargs)
+                handle.rows_out = row_count(result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -6,6 +6,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from fragility_monitor.scoring.registry import BUILTIN_COMPONENTS
+
 COMPONENT_LABELS: dict[str, str] = {
     "capital_flow": "Capital Flow",
     "revenue_reality": "Revenue Reality",
@@ -19,6 +21,27 @@ COMPONENT_LABELS: dict[str, str] = {
     "expectation_load": "Expectation Load",
 }
 
+# Components the report reads regardless of the [weights] profile: the
+# movers, component snapshot and timeseries.csv cover every built-in one, and
+# the charts and triggers read a subset of them.
+REPORT_COMPONENTS = tuple(BUILTIN_COMPONENTS)
+
+# Stress triggers in report order, keyed by their timeline column.
+TRIGGER_MESSAGES = {
+    "crowding_persistent": "Crowding above 50 for three consecutive weeks.",
+    "volatility_high": "Volatility score above 55.",
+    "narrative_high": "Narrative score above 30.",
+    "capital_flow_rising": "Capital Flow above 75 with a rising 3-week trend.",
+    "composite_surge": "Composite index up 15+ points over three weeks.",
+    "revenue_reality_high": "Revenue Reality above 70.",
+}
+
+TRIGGER_HISTORY_ROWS = 12
+CALLOUT_MESSAGES = {
+    "contained": "A maxed component stayed contained.",
+    "sector_specific": "Fragility looked sector-specific with macro calm.",
+}
+
 PROPAGATION_CHANNELS = {
     "volatility": (35.0, "volatility"),
     "crowding": (35.0, "crowding"),
@@ -73,7 +96,10 @@ def containment_message(composite_value: float, components_latest: pd.Series) ->
         if value is not None and value < threshold:
             calm.append(label)
     if not calm:
-        return "One component is maxed, but propagation channels remain muted; the stress appears contained."
+        return (
+            "One component is maxed, but propagation channels remain muted; "
+            "the stress appears contained."
+        )
     calm_list = ", ".join(calm)
     return (
         "One component is maxed, but it has not yet propagated into "
@@ -100,41 +126,127 @@ def stressed_triggers(components: pd.DataFrame, composite: pd.DataFrame) -> list
     latest = components.iloc[-1]
     crowding = latest.get("crowding")
     if crowding is None or crowding < 50 or (components["crowding"].tail(3) <= 50).any():
-        triggers.append("Crowding above 50 for three consecutive weeks.")
+        triggers.append(TRIGGER_MESSAGES["crowding_persistent"])
 
     volatility = latest.get("volatility")
     if volatility is None or volatility < 55:
-        triggers.append("Volatility score above 55.")
+        triggers.append(TRIGGER_MESSAGES["volatility_high"])
 
     narrative = latest.get("narrative")
     if narrative is None or narrative < 30:
-        triggers.append("Narrative score above 30.")
+        triggers.append(TRIGGER_MESSAGES["narrative_high"])
 
     capital = latest.get("capital_flow")
     if capital is None or capital < 75 or components["capital_flow"].tail(3).diff().sum() <= 0:
-        triggers.append("Capital Flow above 75 with a rising 3-week trend.")
+        triggers.append(TRIGGER_MESSAGES["capital_flow_rising"])
 
     if len(composite) >= 4:
         trend_3w = composite["index"].iloc[-1] - composite["index"].iloc[-4]
         if trend_3w < 15:
-            triggers.append("Composite index up 15+ points over three weeks.")
+            triggers.append(TRIGGER_MESSAGES["composite_surge"])
 
     revenue = latest.get("revenue_reality")
     if revenue is None or revenue < 70:
-        triggers.append("Revenue Reality above 70.")
+        triggers.append(TRIGGER_MESSAGES["revenue_reality_high"])
 
     return triggers[:6]
 
 
-def report_context(composite: pd.DataFrame, components: pd.DataFrame, summary: dict[str, Any]) -> dict[str, Any]:
+def _column(components: pd.DataFrame, name: str) -> pd.Series | None:
+    return components[name] if name in components.columns else None
+
+
+def _met(series: pd.Series | None, threshold: float) -> pd.Series | bool:
+    # Unlike the latest-row rules, a NaN score or a missing component never
+    # counts as met.
+    return False if series is None else series >= threshold
+
+
+def trigger_timeline(
+    components: pd.DataFrame, composite: pd.DataFrame, mover_window: int = 104
+) -> pd.DataFrame:
+    # stressed_triggers, containment_message, macro_sector_callout and the
+    # top compute_movers entry for every week at once. Trigger columns are
+    # True once the condition is met (the trigger no longer appears in the
+    # list). Rows with every score present and four composite weeks behind
+    # them match those functions on the history up to that week; elsewhere a
+    # rule needs its scores observed, so warm-up weeks and gaps fire nothing.
+    index = components.index
+    frame = pd.DataFrame(index=index)
+    # The composite drops rows the components keep; each week reads the
+    # latest composite value on or before it.
+    value = composite["index"].reindex(index, method="ffill")
+    trend = composite["index"].diff(3).reindex(index, method="ffill")
+
+    crowding = _column(components, "crowding")
+    capital = _column(components, "capital_flow")
+    frame["crowding_persistent"] = False
+    if crowding is not None:
+        frame["crowding_persistent"] = (crowding > 50).astype(float).rolling(3).sum() == 3
+    frame["volatility_high"] = _met(_column(components, "volatility"), 55)
+    frame["narrative_high"] = _met(_column(components, "narrative"), 30)
+    frame["capital_flow_rising"] = _met(capital, 75)
+    if capital is not None:
+        observed = capital.rolling(3).count() == 3
+        frame["capital_flow_rising"] &= observed & (capital - capital.shift(2) > 0)
+    frame["composite_surge"] = trend >= 15
+    frame["revenue_reality_high"] = _met(_column(components, "revenue_reality"), 70)
+    frame["triggers_met"] = frame[list(TRIGGER_MESSAGES)].sum(axis=1)
+
+    frame["contained"] = (value < 50) & (components.max(axis=1, skipna=True) > 90)
+    macro = _column(components, "macro_liquidity")
+    revenue = _column(components, "revenue_reality")
+    if macro is None or capital is None or revenue is None:
+        frame["sector_specific"] = False
+    else:
+        frame["sector_specific"] = (macro < 35) & ((capital > 60) | (revenue > 60))
+
+    deltas = components.diff()
+    std = deltas.rolling(mover_window, min_periods=10).std()
+    sigma = (deltas / std).where(std != 0, 0.0)
+    magnitude = deltas.abs()
+    moved = magnitude.notna().any(axis=1)
+    top = magnitude[moved].idxmax(axis=1)
+    rows = np.flatnonzero(moved.to_numpy())
+    columns = components.columns.get_indexer(top)
+    frame["top_mover"] = pd.Series(
+        [label_component(name) for name in top], index=top.index, dtype=object
+    ).reindex(index)
+    frame["top_mover_delta"] = np.nan
+    frame["top_mover_sigma"] = np.nan
+    frame.loc[moved, "top_mover_delta"] = deltas.to_numpy()[rows, columns]
+    frame.loc[moved, "top_mover_sigma"] = sigma.to_numpy()[rows, columns]
+    return frame
+
+
+def timeline_events(timeline: pd.DataFrame) -> pd.DataFrame:
+    # Weeks on which a trigger or callout switched on, one row per switch.
+    messages = {**TRIGGER_MESSAGES, **CALLOUT_MESSAGES}
+    flags = timeline[list(messages)].astype(bool)
+    started = flags & ~flags.shift(1, fill_value=False)
+    events = started.stack()
+    events = events[events].reset_index()
+    events.columns = ["date", "rule", "fired"]
+    events["message"] = events["rule"].map(messages)
+    return events.drop(columns="fired").set_index("date")
+
+
+def report_context(
+    composite: pd.DataFrame, components: pd.DataFrame, summary: dict[str, Any]
+) -> dict[str, Any]:
     latest_components = components.iloc[-1]
     composite_value = float(composite["index"].iloc[-1])
     movers = compute_movers(components)
+    events = timeline_events(trigger_timeline(components, composite))
     return {
         "movers": movers,
         "containment_message": containment_message(composite_value, latest_components),
         "macro_sector_callout": macro_sector_callout(latest_components),
         "stress_triggers": stressed_triggers(components, composite),
+        "trigger_history": [
+            {"date": str(date.date()), "message": message}
+            for date, message in events["message"].tail(TRIGGER_HISTORY_ROWS).items()
+        ][::-1],
         "component_labels": {key: label_component(key) for key in components.columns},
         "summary_components": {
             label_component(key): float(value) for key, value in latest_components.items()
@@ -1,88 +1,289 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
+import io
 import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from jinja2 import Environment, FileSystemLoader
+from matplotlib.figure import Figure
 
+from fragility_monitor.data.cache import atomic_write_bytes
+from fragility_monitor.profiling import stage
 from fragility_monitor.report.explain import report_context
-from fragility_monitor.scoring.composite import label_regime
+from fragility_monitor.scoring.composite import label_regime, summarize
 
+LOGGER = logging.getLogger(__name__)
 
-def _plot_index(df: pd.DataFrame, path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 4))
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+MANIFEST_NAME = ".manifest.json"
+PLOT_DPI = 150
+PLOT_START = pd.Timestamp("2022-10-01")
+# Report pools can be started from the API server's threads, where forking
+# a process that holds other threads' locks can deadlock.
+POOL_CONTEXT = multiprocessing.get_context("spawn")
+# A spawned worker re-imports pandas and matplotlib (over a second), so the
+# archive only uses processes when each worker gets several snapshots.
+PROCESS_MIN_JOBS = 8
+COMPONENT_COLUMNS = [
+    "capital_flow",
+    "revenue_reality",
+    "model_economics",
+    "narrative",
+    "macro_liquidity",
+    "expectation_load",
+]
+
+
+def _png(fig: Figure) -> bytes:
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=PLOT_DPI)
+    return buffer.getvalue()
+
+
+def _plot_index(df: pd.DataFrame) -> bytes:
+    # Figure without pyplot: no global state, so workers and threads are safe.
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
     ax.plot(df.index, df["index"], label="Fragility Index", color="#1f4e5f")
     ax.fill_between(df.index, df["band_lower"], df["band_upper"], color="#9ecae1", alpha=0.4)
     ax.set_title("Fragility Index")
     ax.set_ylim(0, 100)
     ax.grid(True, alpha=0.3)
-    fig.tight_layout()
-    fig.savefig(path, dpi=150)
-    plt.close(fig)
-
-
-def _plot_components(components: pd.DataFrame, path: Path) -> None:
-    fig, ax = plt.subplots(figsize=(10, 4))
-    for column in [
-        "capital_flow",
-        "revenue_reality",
-        "model_economics",
-        "narrative",
-        "macro_liquidity",
-        "expectation_load",
-    ]:
+    return _png(fig)
+
+
+def _plot_components(components: pd.DataFrame) -> bytes:
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    for column in COMPONENT_COLUMNS:
         if column in components.columns:
             ax.plot(components.index, components[column], label=column.replace("_", " ").title())
     ax.set_title("Component Scores")
     ax.set_ylim(0, 100)
     ax.grid(True, alpha=0.3)
     ax.legend(ncol=3, fontsize=8)
-    fig.tight_layout()
-    fig.savefig(path, dpi=150)
-    plt.close(fig)
+    return _png(fig)
 
 
-def generate_report(
-    output_dir: Path,
+PLOTS: dict[str, tuple[Callable[[pd.DataFrame], bytes], str]] = {
+    "index.png": (_plot_index, "composite"),
+    "components.png": (_plot_components, "components"),
+}
+
+
+def _digest(*parts: Any) -> str:
+    hasher = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            hasher.update(json.dumps([str(column) for column in part.columns]).encode())
+            hasher.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+        elif isinstance(part, bytes):
+            hasher.update(part)
+        else:
+            hasher.update(json.dumps(part, sort_keys=True, default=str).encode())
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+
+def _read_manifest(output_dir: Path) -> dict[str, str]:
+    path = output_dir / MANIFEST_NAME
+    try:
+        manifest = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict):
+        return {}
+    return {str(name): str(digest) for name, digest in manifest.items()}
+
+
+def _plot_frames(composite: pd.DataFrame, components: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    frames = {"composite": composite, "components": components}
+    for key, frame in list(frames.items()):
+        recent = frame.loc[frame.index >= PLOT_START]
+        frames[key] = frame if recent.empty else recent
+    return frames
+
+
+@functools.lru_cache(maxsize=1)
+def _environment() -> Environment:
+    # One per process, so archive workers compile the template once.
+    return Environment(loader=FileSystemLoader(TEMPLATE_DIR))
+
+
+def render_html(
     composite: pd.DataFrame,
     components: pd.DataFrame,
     summary: dict[str, Any],
-) -> None:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    index_plot = output_dir / "index.png"
-    comp_plot = output_dir / "components.png"
-    plot_start = pd.Timestamp("2022-10-01")
-    plot_composite = composite.loc[composite.index >= plot_start]
-    plot_components = components.loc[components.index >= plot_start]
-    if plot_composite.empty:
-        plot_composite = composite
-    if plot_components.empty:
-        plot_components = components
-    _plot_index(plot_composite, index_plot)
-    _plot_components(plot_components, comp_plot)
-
-    summary_path = output_dir / "summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2))
-
-    timeseries_path = output_dir / "timeseries.csv"
-    joined = composite.join(components, how="left")
-    joined.to_csv(timeseries_path)
-
-    env = Environment(loader=FileSystemLoader(Path(__file__).parent / "templates"))
-    template = env.get_template("report.html")
+    index_plot: str = "index.png",
+    components_plot: str = "components.png",
+    sensitivity: pd.DataFrame | None = None,
+) -> str:
+    sensitivity = pd.DataFrame() if sensitivity is None else sensitivity
     explain = report_context(composite, components, summary)
-    html = template.render(
-        index_plot=index_plot.name,
-        components_plot=comp_plot.name,
+    return _environment().get_template("report.html").render(
+        index_plot=index_plot,
+        components_plot=components_plot,
         summary=summary,
         regime=label_regime(summary["index"]),
         movers=explain["movers"],
         containment_message=explain["containment_message"],
         macro_sector_callout=explain["macro_sector_callout"],
         stress_triggers=explain["stress_triggers"],
+        trigger_history=explain["trigger_history"],
         summary_components=explain["summary_components"],
+        sensitivity=sensitivity.reset_index().to_dict("records"),
     )
-    (output_dir / "report.html").write_text(html)
+
+
+def _render_plots(jobs: dict[str, pd.DataFrame], workers: int | None) -> dict[str, bytes]:
+    # Serial unless asked otherwise: a couple of plots never pay for a pool.
+    if len(jobs) <= 1 or not workers or workers == 1:
+        return {name: PLOTS[name][0](frame) for name, frame in jobs.items()}
+    with ThreadPoolExecutor(max_workers=min(len(jobs), workers)) as pool:
+        futures = {name: pool.submit(PLOTS[name][0], frame) for name, frame in jobs.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def generate_report(
+    output_dir: Path,
+    composite: pd.DataFrame,
+    components: pd.DataFrame,
+    summary: dict[str, Any],
+    workers: int | None = None,
+    force: bool = False,
+    sensitivity: pd.DataFrame | None = None,
+) -> dict[str, bool]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = {} if force else _read_manifest(output_dir)
+    manifest: dict[str, str] = {}
+    written: dict[str, bool] = {}
+
+    def current(name: str, digest: str) -> bool:
+        manifest[name] = digest
+        fresh = previous.get(name) == digest and (output_dir / name).exists()
+        written[name] = not fresh
+        return fresh
+
+    plot_frames = _plot_frames(composite, components)
+
+    jobs = {}
+    for name, (plot, source) in PLOTS.items():
+        frame = plot_frames[source]
+        if not current(name, _digest(inspect.getsource(plot), PLOT_DPI, frame)):
+            jobs[name] = frame
+    if jobs:
+        with stage("report.plots", rows_in=len(composite)):
+            for name, content in _render_plots(jobs, workers).items():
+                atomic_write_bytes(output_dir / name, content)
+
+    with stage("report.write_data", rows_in=len(composite)):
+        summary_json = json.dumps(summary, indent=2).encode()
+        if not current("summary.json", _digest(summary_json)):
+            atomic_write_bytes(output_dir / "summary.json", summary_json)
+
+        frames_digest = _digest(composite, components)
+        if not current("timeseries.csv", frames_digest):
+            joined = composite.join(components, how="left")
+            atomic_write_bytes(output_dir / "timeseries.csv", joined.to_csv().encode())
+
+    with stage("report.render_html"):
+        template_source = (TEMPLATE_DIR / "report.html").read_bytes()
+        sensitivity = pd.DataFrame() if sensitivity is None else sensitivity
+        html_digest = _digest(template_source, frames_digest, summary, sensitivity)
+        if not current("report.html", html_digest):
+            html = render_html(composite, components, summary, sensitivity=sensitivity)
+            atomic_write_bytes(output_dir / "report.html", html.encode())
+
+    atomic_write_bytes(output_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+    skipped = [name for name, changed in written.items() if not changed]
+    if skipped:
+        LOGGER.info("Report artifacts unchanged: %s", ", ".join(skipped))
+    return written
+
+
+def snapshot_files(day: str) -> dict[str, str]:
+    # Archive file names per dated snapshot, as in docs/archive.
+    return {
+        "index.png": f"index-{day}.png",
+        "components.png": f"components-{day}.png",
+        "summary.json": f"summary-{day}.json",
+        "report.html": f"{day}.html",
+    }
+
+
+def _render_snapshot(
+    day: str, composite: pd.DataFrame, components: pd.DataFrame, summary: dict[str, Any]
+) -> dict[str, bytes]:
+    names = snapshot_files(day)
+    frames = _plot_frames(composite, components)
+    html = render_html(composite, components, summary, names["index.png"], names["components.png"])
+    return {
+        names["index.png"]: _plot_index(frames["composite"]),
+        names["components.png"]: _plot_components(frames["components"]),
+        names["summary.json"]: json.dumps(summary, indent=2).encode(),
+        names["report.html"]: html.encode(),
+    }
+
+
+def generate_archive(
+    output_dir: Path,
+    composite: pd.DataFrame,
+    components: pd.DataFrame,
+    start: str | pd.Timestamp | None = None,
+    end: str | pd.Timestamp | None = None,
+    workers: int | None = None,
+    force: bool = False,
+) -> dict[str, bool]:
+    # A dated snapshot per composite week in [start, end], each what a report
+    # run as of that week would show, rendered from slices of the one set of
+    # frames. Snapshots whose inputs match the manifest and whose files exist
+    # are skipped. Returns {date: written}.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    previous = _read_manifest(output_dir)
+    manifest = dict(previous)
+    sources = [inspect.getsource(plot) for plot, _ in PLOTS.values()]
+    template_source = (TEMPLATE_DIR / "report.html").read_bytes()
+    dates = composite.loc[start:end].index
+
+    jobs = {}
+    written: dict[str, bool] = {}
+    with stage("archive.plan", rows_in=len(dates)):
+        for date in dates:
+            day = str(date.date())
+            history, scores = composite.loc[:date], components.loc[:date]
+            summary = summarize(history, scores)
+            digest = _digest(sources, PLOT_DPI, template_source, history, scores, summary)
+            manifest[day] = digest
+            fresh = previous.get(day) == digest and all(
+                (output_dir / name).exists() for name in snapshot_files(day).values()
+            )
+            written[day] = force or not fresh
+            if written[day]:
+                jobs[day] = (history, scores, summary)
+
+    def save(files: dict[str, bytes]) -> None:
+        for name, content in files.items():
+            atomic_write_bytes(output_dir / name, content)
+
+    with stage("archive.render", rows_in=len(jobs)):
+        if not workers or workers == 1 or len(jobs) < PROCESS_MIN_JOBS:
+            for day, args in jobs.items():
+                save(_render_snapshot(day, *args))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT) as pool:
+                futures = [pool.submit(_render_snapshot, day, *args) for day, args in jobs.items()]
+                for future in as_completed(futures):
+                    save(future.result())
+
+    atomic_write_bytes(output_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+    LOGGER.info("Archive: %d snapshots written, %d unchanged", len(jobs), len(dates) - len(jobs))
+    return written
@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+from typing import Iterable, Sequence
+
 import pandas as pd
 
-from fragility_monitor.scoring.transforms import normalize_score
+from fragility_monitor.scoring.registry import (
+    BUILTIN_COMPONENTS,
+    COMPONENT_GROUP,
+    ComponentSpec,
+    resolve_components,
+)
+from fragility_monitor.scoring.transforms import normalize_scores
+
+# Transforms score a raw series for a set of windows: (series, windows,
+# lower_q, upper_q) -> frame with one column per window.
+TRANSFORM_FUNCTIONS = {"normalize": normalize_scores}
 
 
-def _apply_score(series: pd.Series, window: int, lower_q: float, upper_q: float, invert: bool = False) -> pd.Series:
+def _apply_score(
+    series: pd.Series,
+    windows: Sequence[int],
+    lower_q: float,
+    upper_q: float,
+    invert: bool = False,
+    transform: str = "normalize",
+) -> pd.DataFrame:
+    # Compact mode hands over float32 features; score in float64.
+    series = series.astype(float)
     if invert:
         series = -series
-    return normalize_score(series, window, lower_q, upper_q)
+    return TRANSFORM_FUNCTIONS[transform](series, windows, lower_q, upper_q)
 
 
 def _safe_series(df: pd.DataFrame, name: str, index: pd.Index) -> pd.Series:
@@ -17,74 +38,86 @@ def _safe_series(df: pd.DataFrame, name: str, index: pd.Index) -> pd.Series:
     return pd.Series(index=index, dtype=float)
 
 
-def compute_component_scores(
+def compute_component_panel(
     market_features: pd.DataFrame,
     divergence_features: pd.DataFrame,
     narrative_features: pd.DataFrame,
     macro_features: pd.DataFrame,
-    rolling_window: int,
+    windows: Sequence[int],
     lower_q: float,
     upper_q: float,
+    plan: Iterable[ComponentSpec] | None = None,
 ) -> pd.DataFrame:
-    df = pd.DataFrame(index=market_features.index)
-
-    df["capital_flow"] = _apply_score(
-        market_features["ai_relative_strength"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
+    # Component scores for every rolling window, columns (window, component).
+    # Components built from features share one scoring pass across all the
+    # windows; those built from other components score each window against
+    # that window's inputs.
+    if plan is None:
+        plan = resolve_components(BUILTIN_COMPONENTS, BUILTIN_COMPONENTS)
+    windows = sorted(set(windows))
+    index = market_features.index
+    sources = {
+        "market": market_features,
+        "divergence": divergence_features,
+        "narrative": narrative_features,
+        "macro": macro_features,
+    }
+    scored = {window: pd.DataFrame(index=index) for window in windows}
+
+    for spec in plan:
+        raws: dict[int, pd.Series] = {}
+        for window in windows:
+            raw = None
+            for key in spec.inputs:
+                group, _, name = key.partition(".")
+                frame = scored[window] if group == COMPONENT_GROUP else sources[group]
+                series = _safe_series(frame, name, index)
+                raw = series if raw is None else raw + series
+            raws[window] = raw
+        if not any(key.startswith(f"{COMPONENT_GROUP}.") for key in spec.inputs):
+            panel = _apply_score(
+                raws[windows[0]],
+                windows,
+                lower_q,
+                upper_q,
+                invert=spec.invert,
+                transform=spec.transform,
+            )
+            for window in windows:
+                scored[window][spec.name] = panel[window]
+            continue
+        for window in windows:
+            scored[window][spec.name] = _apply_score(
+                raws[window],
+                [window],
+                lower_q,
+                upper_q,
+                invert=spec.invert,
+                transform=spec.transform,
+            )[window]
+
+    panel = pd.concat(scored, axis=1, names=["window", "component"])
+    return panel.sort_index()
 
-    df["revenue_reality"] = _apply_score(
-        market_features["ai_price_acceleration"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
-
-    df["model_economics"] = _apply_score(
-        market_features["ai_vol_of_vol"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
-
-    df["narrative"] = _apply_score(
-        _safe_series(narrative_features, "efficiency_transform_trend", df.index),
-        window=rolling_window,
-        lower_q=lower_q,
-        upper_q=upper_q,
-        invert=True,
-    )
-
-    df["macro_liquidity"] = _apply_score(
-        _safe_series(macro_features, "hy_spread", df.index),
-        window=rolling_window,
-        lower_q=lower_q,
-        upper_q=upper_q,
-    )
-
-    df["dispersion"] = _apply_score(
-        divergence_features["ai_dispersion"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
 
-    df["crowding"] = _apply_score(
-        divergence_features["ai_crowding_corr"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
-
-    df["volatility"] = _apply_score(
-        market_features["ai_volatility"], window=rolling_window, lower_q=lower_q, upper_q=upper_q
-    )
-
-    df["pricing_pressure"] = _apply_score(
-        _safe_series(narrative_features, "pricing_pressure", df.index),
-        window=rolling_window,
-        lower_q=lower_q,
-        upper_q=upper_q,
-    )
-
-    expectation_raw = (
-        _safe_series(market_features, "ai_relative_strength", df.index)
-        + _safe_series(narrative_features, "ai_density", df.index)
-        + _safe_series(divergence_features, "ai_crowding_corr", df.index)
-    )
-    df["expectation_load"] = _apply_score(
-        expectation_raw,
-        window=rolling_window,
-        lower_q=lower_q,
-        upper_q=upper_q,
+def compute_component_scores(
+    market_features: pd.DataFrame,
+    divergence_features: pd.DataFrame,
+    narrative_features: pd.DataFrame,
+    macro_features: pd.DataFrame,
+    rolling_window: int,
+    lower_q: float,
+    upper_q: float,
+    plan: Iterable[ComponentSpec] | None = None,
+) -> pd.DataFrame:
+    panel = compute_component_panel(
+        market_features,
+        divergence_features,
+        narrative_features,
+        macro_features,
+        [rolling_window],
+        lower_q,
+        upper_q,
+        plan=plan,
     )
-
-    df = df.sort_index()
-    return df
+    return panel.droplevel("window", axis=1).rename_axis(columns=None)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pandas as pd
 
 REGIME_LABELS = [
@@ -40,3 +42,30 @@ def label_regime(value: float) -> str:
         if low <= value < high:
             return label
     return REGIME_LABELS[-1][2]
+
+
+def _interpretation(score: float) -> str:
+    regime = label_regime(score)
+    if regime in {"Calm", "Warming"}:
+        return (
+            "Signals suggest stable positioning with contained stress; "
+            "monitor for divergence shifts."
+        )
+    if regime == "Elevated":
+        return "Fragility is building; crowding or narrative decay may be increasing sensitivity."
+    if regime == "Stressed":
+        return "Stress indicators are high; risk appetite appears fragile and crowding elevated."
+    return "Market structure looks fragile; de-risking and narrative deterioration are pronounced."
+
+
+def summarize(composite: pd.DataFrame, components: pd.DataFrame) -> dict[str, Any]:
+    index_value = float(composite["index"].iloc[-1])
+    return {
+        "asof": str(composite.index[-1].date()),
+        "index": index_value,
+        "regime": label_regime(index_value),
+        "components": {
+            k.replace("_", " ").title(): float(v) for k, v in components.iloc[-1].items()
+        },
+        "interpretation": _interpretation(index_value),
+    }
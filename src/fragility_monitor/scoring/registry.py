@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+FEATURE_GROUPS = ("market", "divergence", "narrative", "macro")
+COMPONENT_GROUP = "components"
+TRANSFORMS = ("normalize",)
+
+
+@dataclass(frozen=True)
+class ComponentSpec:
+    name: str
+    # "<group>.<feature>" keys, summed before the transform; the group is one
+    # of FEATURE_GROUPS, or "components" to build on another component score.
+    inputs: tuple[str, ...]
+    transform: str = "normalize"
+    invert: bool = False
+
+    def dependencies(self) -> list[str]:
+        prefix = f"{COMPONENT_GROUP}."
+        return [key.partition(".")[2] for key in self.inputs if key.startswith(prefix)]
+
+
+BUILTIN_COMPONENTS: dict[str, ComponentSpec] = {
+    spec.name: spec
+    for spec in [
+        ComponentSpec("capital_flow", ("market.ai_relative_strength",)),
+        ComponentSpec("revenue_reality", ("market.ai_price_acceleration",)),
+        ComponentSpec("model_economics", ("market.ai_vol_of_vol",)),
+        ComponentSpec("narrative", ("narrative.efficiency_transform_trend",), invert=True),
+        ComponentSpec("macro_liquidity", ("macro.hy_spread",)),
+        ComponentSpec("dispersion", ("divergence.ai_dispersion",)),
+        ComponentSpec("crowding", ("divergence.ai_crowding_corr",)),
+        ComponentSpec("volatility", ("market.ai_volatility",)),
+        ComponentSpec("pricing_pressure", ("narrative.pricing_pressure",)),
+        ComponentSpec(
+            "expectation_load",
+            (
+                "market.ai_relative_strength",
+                "narrative.ai_density",
+                "divergence.ai_crowding_corr",
+            ),
+        ),
+    ]
+}
+
+
+def _parse_spec(name: str, table: dict[str, Any]) -> ComponentSpec:
+    inputs = table.get("inputs")
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    if not inputs:
+        raise ValueError(f"Component {name!r} needs at least one input")
+    for key in inputs:
+        group, _, feature = key.partition(".")
+        if group not in (*FEATURE_GROUPS, COMPONENT_GROUP) or not feature:
+            raise ValueError(f"Component {name!r} has an invalid input {key!r}")
+    transform = table.get("transform", "normalize")
+    if transform not in TRANSFORMS:
+        raise ValueError(f"Component {name!r} uses unknown transform {transform!r}")
+    invert = bool(table.get("invert", False))
+    return ComponentSpec(name=name, inputs=tuple(inputs), transform=transform, invert=invert)
+
+
+def component_specs(custom: dict[str, dict[str, Any]] | None = None) -> dict[str, ComponentSpec]:
+    specs = dict(BUILTIN_COMPONENTS)
+    for name, table in (custom or {}).items():
+        specs[name] = _parse_spec(name, table)
+    return specs
+
+
+def resolve_components(
+    requested: Iterable[str], specs: dict[str, ComponentSpec]
+) -> list[ComponentSpec]:
+    wanted = set(requested)
+    if "all" in wanted:
+        wanted = set(specs)
+    for name in sorted(wanted - set(specs)):
+        LOGGER.warning("Unknown component %r requested; skipping", name)
+
+    plan: list[ComponentSpec] = []
+    state: dict[str, str] = {}
+
+    def visit(name: str, path: tuple[str, ...]) -> None:
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Component dependency cycle: {' -> '.join((*path, name))}")
+        if name not in specs:
+            raise ValueError(f"Component {path[-1]!r} depends on unknown component {name!r}")
+        state[name] = "visiting"
+        for dependency in specs[name].dependencies():
+            visit(dependency, (*path, name))
+        state[name] = "done"
+        plan.append(specs[name])
+
+    # Registry order keeps the output columns stable; dependencies go first.
+    for name in specs:
+        if name in wanted:
+            visit(name, ())
+    return plan
+
+
+def required_features(plan: Iterable[ComponentSpec]) -> dict[str, set[str]]:
+    needs: dict[str, set[str]] = {group: set() for group in FEATURE_GROUPS}
+    for spec in plan:
+        for key in spec.inputs:
+            group, _, feature = key.partition(".")
+            if group in needs:
+                needs[group].add(feature)
+    return needs
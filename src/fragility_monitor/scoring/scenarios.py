@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from fragility_monitor.scoring.composite import REGIME_LABELS
+from fragility_monitor.scoring.registry import COMPONENT_GROUP, ComponentSpec
+from fragility_monitor.scoring.transforms import normalize_score
+
+FAN_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+# Daily history carried in front of every path so the 21-day windows (and
+# the 21-day change of a 21-day change) are full from the first simulated day;
+# longer volatility windows carry more.
+WARMUP_DAYS = 63
+REGIME_EDGES = [high for _, high, _ in REGIME_LABELS[:-1]]
+REGIME_NAMES = [label for _, _, label in REGIME_LABELS]
+
+
+@dataclass
+class ScenarioResult:
+    dates: pd.DatetimeIndex
+    # scenarios x weeks composite index values.
+    paths: np.ndarray
+    quantiles: pd.DataFrame
+    regimes: pd.DataFrame
+    transitions: pd.DataFrame
+    start: float
+
+
+def _rolling(values: np.ndarray, window: int, reduce: str) -> np.ndarray:
+    # Trailing window along the time axis of a scenarios x days array, NaN
+    # until the window is full, as pandas rolling() does.
+    output = np.full(values.shape, np.nan)
+    windows = sliding_window_view(values, window, axis=1)
+    if reduce == "sum":
+        output[:, window - 1 :] = windows.sum(axis=2)
+    else:
+        output[:, window - 1 :] = windows.std(axis=2, ddof=1)
+    return output
+
+
+def bootstrap_returns(
+    history: np.ndarray, days: int, n_paths: int, block_days: int, rng: np.random.Generator
+) -> np.ndarray:
+    # Moving-block bootstrap of whole history rows (days x series), so each
+    # path keeps the cross-series correlation and short-range dependence.
+    block_days = max(1, min(block_days, len(history)))
+    blocks = -(-days // block_days)
+    starts = rng.integers(0, len(history) - block_days + 1, size=(n_paths, blocks))
+    rows = (starts[:, :, None] + np.arange(block_days)).reshape(n_paths, -1)[:, :days]
+    draws: np.ndarray = history[rows]
+    return draws
+
+
+def simulate_market_features(
+    daily: pd.DataFrame,
+    days: int,
+    n_paths: int,
+    block_days: int,
+    rng: np.random.Generator,
+    vol_scale: float = 1.0,
+    shock: float = 0.0,
+    vol_window: int = 21,
+) -> dict[str, np.ndarray]:
+    # ``daily`` holds ai_returns, bench_returns and ai_price. Returns the
+    # market features compute_market_features would produce along every
+    # path with the close-to-close volatility estimator, as scenarios x days
+    # arrays over the simulated days only.
+    clean = daily[["ai_returns", "bench_returns"]].dropna()
+    draws = bootstrap_returns(clean.to_numpy(), days, n_paths, block_days, rng)
+    mean = clean.to_numpy().mean(axis=0)
+    draws = mean + (draws - mean) * vol_scale
+    draws[:, 0, 0] += shock
+
+    tail = daily.iloc[-max(WARMUP_DAYS, 2 * vol_window + 1) :]
+    ai_returns = np.concatenate(
+        [np.broadcast_to(tail["ai_returns"].to_numpy(), (n_paths, len(tail))), draws[:, :, 0]],
+        axis=1,
+    )
+    bench_returns = np.concatenate(
+        [np.broadcast_to(tail["bench_returns"].to_numpy(), (n_paths, len(tail))), draws[:, :, 1]],
+        axis=1,
+    )
+    last_price = tail["ai_price"].ffill().iloc[-1]
+    ai_price = np.concatenate(
+        [
+            np.broadcast_to(tail["ai_price"].to_numpy(), (n_paths, len(tail))),
+            last_price * np.cumprod(1 + draws[:, :, 0], axis=1),
+        ],
+        axis=1,
+    )
+
+    momentum = np.full(ai_price.shape, np.nan)
+    momentum[:, 21:] = ai_price[:, 21:] / ai_price[:, :-21] - 1
+    acceleration = np.full(ai_price.shape, np.nan)
+    acceleration[:, 21:] = momentum[:, 21:] - momentum[:, :-21]
+    volatility = _rolling(ai_returns, vol_window, "std") * (252**0.5)
+    features = {
+        "ai_relative_strength": _rolling(ai_returns - bench_returns, 21, "sum"),
+        "ai_price_acceleration": acceleration,
+        "ai_volatility": volatility,
+        "ai_vol_of_vol": _rolling(volatility, vol_window, "std"),
+        "ai_returns": ai_returns,
+        "bench_returns": bench_returns,
+    }
+    return {name: values[:, len(tail) :] for name, values in features.items()}
+
+
+def score_paths(
+    history: pd.Series, paths: np.ndarray, window: int, lower_q: float, upper_q: float
+) -> np.ndarray:
+    # normalize_score for every path at once: each path is the shared
+    # history followed by its simulated weeks, and only the simulated weeks
+    # are scored. Winsorisation bounds come from each full path.
+    n_paths, weeks = paths.shape
+    full = np.concatenate(
+        [np.broadcast_to(history.to_numpy(float), (n_paths, len(history))), paths], axis=1
+    )
+    finite = np.isfinite(full).any(axis=1)
+    low = np.full(n_paths, np.nan)
+    high = np.full(n_paths, np.nan)
+    low[finite] = np.nanquantile(full[finite], lower_q, axis=1)
+    high[finite] = np.nanquantile(full[finite], upper_q, axis=1)
+    full = np.clip(full, low[:, None], high[:, None])
+
+    padded = np.concatenate(
+        [np.full((n_paths, max(0, window - full.shape[1])), np.nan), full], axis=1
+    )
+    windows = sliding_window_view(padded, window, axis=1)[:, -weeks:]
+    enough = np.isfinite(windows).sum(axis=2) >= max(10, window // 4)
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        # All-NaN windows (too little history) are expected here.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        median = np.nanmedian(windows, axis=2)
+        mad = np.nanmedian(np.abs(windows - median[..., None]), axis=2)
+        scale = np.where(mad > 0, 1.4826 * mad, np.nanstd(windows, axis=2))
+        z = np.where((scale == 0) | np.isnan(scale), 0.0, (windows[..., -1] - median) / scale)
+    z = np.where(enough, z, np.nan)
+    scores: np.ndarray = 100 / (1 + np.exp(-np.clip(z, -20, 20)))
+    return scores
+
+
+def _composite(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    # compute_composite over scenarios x weeks x components: weights are
+    # renormalised over the components present in each cell.
+    present = np.isfinite(scores)
+    weight = np.where(present, weights, 0.0)
+    total = weight.sum(axis=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        index = np.where(present, scores, 0.0) @ weights / total
+    return np.where(total > 0, index, np.nan)
+
+
+def _regime_codes(values: np.ndarray) -> np.ndarray:
+    codes = np.digitize(values, REGIME_EDGES)
+    return np.where(np.isfinite(values), codes, -1)
+
+
+def run_scenarios(
+    daily: pd.DataFrame,
+    weekly: dict[str, pd.DataFrame],
+    plan: Iterable[ComponentSpec],
+    weights: dict[str, float],
+    window: int,
+    lower_q: float,
+    upper_q: float,
+    start: float,
+    n_paths: int = 1000,
+    horizon_weeks: int = 13,
+    block_days: int = 10,
+    vol_scale: float = 1.0,
+    shock: float = 0.0,
+    seed: int | None = None,
+    vol_window: int = 21,
+) -> ScenarioResult:
+    # ``weekly`` holds the history feature groups (market, divergence,
+    # narrative, macro) on the weekly grid the components were scored on.
+    # Market features are re-derived along each simulated path; the other
+    # groups hold their last observed value over the horizon.
+    rng = np.random.default_rng(seed)
+    last_day = daily.index[-1]
+    days = horizon_weeks * 5 + 5
+    calendar = pd.bdate_range(last_day + pd.offsets.BDay(), periods=days)
+    positions = pd.Series(np.arange(days), index=calendar).resample("W-FRI").last()
+    positions = positions[positions.index > weekly["market"].index[-1]].iloc[:horizon_weeks]
+    dates = pd.DatetimeIndex(positions.index)
+
+    simulated = simulate_market_features(
+        daily, days, n_paths, block_days, rng, vol_scale, shock, vol_window
+    )
+    shape = (n_paths, len(dates))
+
+    def feature_paths(group: str, name: str) -> np.ndarray:
+        if group == "market" and name in simulated:
+            return simulated[name][:, positions.to_numpy()]
+        frame = weekly.get(group, pd.DataFrame())
+        last = frame[name].iloc[-1] if name in frame.columns and len(frame) else np.nan
+        return np.full(shape, float(last))
+
+    index = weekly["market"].index
+    history: dict[str, pd.Series] = {}
+    scores: dict[str, np.ndarray] = {}
+    for spec in plan:
+        raw_history: pd.Series | None = None
+        raw_paths: np.ndarray | None = None
+        for key in spec.inputs:
+            group, _, name = key.partition(".")
+            values: np.ndarray
+            if group == COMPONENT_GROUP:
+                series, values = history[name], scores[name]
+            else:
+                frame = weekly.get(group, pd.DataFrame())
+                series = (
+                    frame[name].reindex(index)
+                    if name in frame.columns
+                    else pd.Series(np.nan, index=index)
+                )
+                values = feature_paths(group, name)
+            raw_history = series if raw_history is None else raw_history + series
+            raw_paths = values if raw_paths is None else raw_paths + values
+        if raw_history is None or raw_paths is None:
+            raise ValueError(f"Component {spec.name!r} has no inputs")
+        sign = -1.0 if spec.invert else 1.0
+        # Components that read this one see its scores, as in the panel.
+        history[spec.name] = normalize_score(sign * raw_history, window, lower_q, upper_q)
+        scores[spec.name] = score_paths(
+            sign * raw_history, sign * raw_paths, window, lower_q, upper_q
+        )
+
+    names = [name for name in weights if name in scores]
+    if not names:
+        raise ValueError("No components available for composite scoring")
+    stacked = np.stack([scores[name] for name in names], axis=2)
+    paths = _composite(stacked, np.array([weights[name] for name in names], dtype=float))
+
+    quantiles = pd.DataFrame(
+        np.nanquantile(paths, FAN_QUANTILES, axis=0).T,
+        index=dates,
+        columns=[f"p{round(q * 100):02d}" for q in FAN_QUANTILES],
+    )
+    codes = _regime_codes(np.concatenate([np.full((n_paths, 1), start), paths], axis=1))
+    regimes = pd.DataFrame(
+        [(codes[:, 1:] == code).mean(axis=0) for code in range(len(REGIME_NAMES))],
+        index=REGIME_NAMES,
+        columns=dates,
+    ).T
+    before, after = codes[:, :-1].ravel(), codes[:, 1:].ravel()
+    observed = (before >= 0) & (after >= 0)
+    counts = np.zeros((len(REGIME_NAMES), len(REGIME_NAMES)))
+    np.add.at(counts, (before[observed], after[observed]), 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        transitions = counts / counts.sum(axis=1, keepdims=True)
+    return ScenarioResult(
+        dates=dates,
+        paths=paths,
+        quantiles=quantiles,
+        regimes=regimes,
+        transitions=pd.DataFrame(transitions, index=REGIME_NAMES, columns=REGIME_NAMES),
+        start=start,
+    )
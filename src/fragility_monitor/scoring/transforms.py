@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import warnings
+from typing import Iterable
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 def winsorize(series: pd.Series, lower: float, upper: float) -> pd.Series:
@@ -10,16 +14,33 @@ def winsorize(series: pd.Series, lower: float, upper: float) -> pd.Series:
     return series.clip(lower=low, upper=high)
 
 
-def rolling_robust_zscore(series: pd.Series, window: int) -> pd.Series:
-    def _robust_z(x: pd.Series) -> float:
-        median = x.median()
-        mad = (x - median).abs().median()
-        scale = 1.4826 * mad if mad > 0 else x.std(ddof=0)
-        if scale == 0 or np.isnan(scale):
-            return 0.0
-        return (x.iloc[-1] - median) / scale
+def rolling_robust_zscores(series: pd.Series, windows: Iterable[int]) -> pd.DataFrame:
+    # Trailing median/MAD z-scores for several window lengths in one pass:
+    # every window is the tail of the widest one, so a single NaN-padded view
+    # serves them all. Matches series.rolling(window, min_periods=max(10,
+    # window // 4)) with the median/MAD (std fallback) reducer.
+    windows = sorted(set(windows))
+    values = series.to_numpy(dtype=float)
+    widest = sliding_window_view(
+        np.concatenate([np.full(windows[-1] - 1, np.nan), values]), windows[-1]
+    )
+    scores = {}
+    for window in windows:
+        view = widest[:, -window:]
+        with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+            # All-NaN windows ahead of the first observations are expected.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            median = np.nanmedian(view, axis=1)
+            mad = np.nanmedian(np.abs(view - median[:, None]), axis=1)
+            scale = np.where(mad > 0, 1.4826 * mad, np.nanstd(view, axis=1))
+            z = np.where((scale == 0) | np.isnan(scale), 0.0, (values - median) / scale)
+        enough = np.isfinite(view).sum(axis=1) >= max(10, window // 4)
+        scores[window] = np.where(enough, z, np.nan)
+    return pd.DataFrame(scores, index=series.index)
 
-    return series.rolling(window, min_periods=max(10, window // 4)).apply(_robust_z, raw=False)
+
+def rolling_robust_zscore(series: pd.Series, window: int) -> pd.Series:
+    return rolling_robust_zscores(series, [window])[window].rename(series.name)
 
 
 def logistic_scale(z: pd.Series) -> pd.Series:
@@ -27,10 +48,17 @@ def logistic_scale(z: pd.Series) -> pd.Series:
     return 100 * (1 / (1 + np.exp(-clipped)))
 
 
-def normalize_score(series: pd.Series, window: int, lower_q: float, upper_q: float) -> pd.Series:
+def normalize_scores(
+    series: pd.Series, windows: Iterable[int], lower_q: float, upper_q: float
+) -> pd.DataFrame:
+    # normalize_score for each window, columns keyed by window. Winsorising
+    # does not depend on the window, so it runs once.
     clean = winsorize(series.dropna(), lower_q, upper_q)
     aligned = series.copy()
     aligned.loc[clean.index] = clean
-    z = rolling_robust_zscore(aligned, window)
-    score = logistic_scale(z)
-    return score.replace([np.inf, -np.inf], np.nan)
+    scores = logistic_scale(rolling_robust_zscores(aligned, windows))
+    return scores.replace([np.inf, -np.inf], np.nan)
+
+
+def normalize_score(series: pd.Series, window: int, lower_q: float, upper_q: float) -> pd.Series:
+    return normalize_scores(series, [window], lower_q, upper_q)[window].rename(series.name)
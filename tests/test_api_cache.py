@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from fragility_monitor.api.cache import ResultCache
+from fragility_monitor.config import load_config
+from fragility_monitor.monitor import MonitorResult, curated_paths
+
+
+def _result() -> MonitorResult:
+    frame = pd.DataFrame({"index": [1.0]}, index=pd.DatetimeIndex(["2024-01-05"]))
+    return MonitorResult(composite=frame, components=frame, summary={}, backtest={})
+
+
+def test_result_cache_single_flight_and_invalidation(tmp_path: Path) -> None:
+    config = load_config(tmp_path / "missing.toml")
+    config.data = {"raw_dir": str(tmp_path / "raw"), "curated_dir": str(tmp_path / "curated")}
+    market_path = curated_paths(config)["market"]
+    market_path.parent.mkdir(parents=True)
+    market_path.write_bytes(b"v1")
+
+    calls = []
+
+    def compute(_config: object) -> MonitorResult:
+        calls.append(1)
+        time.sleep(0.05)
+        return _result()
+
+    cache = ResultCache(config, compute=compute)
+    threads = [threading.Thread(target=cache.get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+
+    cache.get()
+    assert len(calls) == 1
+
+    market_path.write_bytes(b"version-2")
+    stat = market_path.stat()
+    os.utime(market_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    cache.get()
+    assert len(calls) == 2
@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from fragility_monitor.api.cache import ResultCache
+from fragility_monitor.api.server import create_app
+from fragility_monitor.bench.suite import synthetic_config
+from fragility_monitor.bench.synthetic import generate, write_curated
+from fragility_monitor.config import Config, load_config
+from fragility_monitor.monitor import MonitorFeatures, MonitorResult
+from fragility_monitor.scoring.registry import BUILTIN_COMPONENTS
+
+
+def _result() -> MonitorResult:
+    index = pd.date_range("2024-01-05", periods=4, freq="W-FRI")
+    composite = pd.DataFrame(
+        {"index": [40.0, 42.0, 45.0, 50.0], "band_lower": 30.0, "band_upper": 60.0}, index=index
+    )
+    components = pd.DataFrame(
+        {"capital_flow": [10.0, np.nan, 30.0, 40.0], "volatility": [50.0, 55.0, 60.0, 65.0]},
+        index=index,
+    )
+    return MonitorResult(composite=composite, components=components, summary={}, backtest={})
+
+
+def _config(tmp_path: Path) -> Config:
+    config = load_config(tmp_path / "missing.toml")
+    config.data = {"raw_dir": str(tmp_path / "raw"), "curated_dir": str(tmp_path / "curated")}
+    return config
+
+
+def _client(tmp_path: Path) -> TestClient:
+    config = _config(tmp_path)
+    return TestClient(create_app(config, cache=ResultCache(config, compute=lambda _: _result())))
+
+
+def test_index_latest_values(tmp_path: Path) -> None:
+    response = _client(tmp_path).get("/index")
+    assert response.status_code == 200
+    assert response.json() == {
+        "index": 50.0,
+        "band_lower": 30.0,
+        "band_upper": 60.0,
+        "date": "2024-01-26",
+    }
+
+
+def test_baskets_latest_values(tmp_path: Path) -> None:
+    config = _config(tmp_path)
+    result = _result()
+    index = result.composite.index
+    columns = pd.MultiIndex.from_product([["chips", "cloud"], ["returns", "dispersion"]])
+    baskets = pd.DataFrame(np.arange(16.0).reshape(4, 4), index=index, columns=columns)
+    baskets.iloc[-1, 3] = np.nan
+    empty = pd.DataFrame()
+    result.features = MonitorFeatures(empty, empty, empty, empty, pd.Series(dtype=float), baskets)
+    client = TestClient(create_app(config, cache=ResultCache(config, compute=lambda _: result)))
+    assert client.get("/baskets").json() == {
+        "date": "2024-01-26",
+        "baskets": {
+            "chips": {"returns": 12.0, "dispersion": 13.0},
+            "cloud": {"returns": 14.0, "dispersion": None},
+        },
+    }
+    assert _client(tmp_path).get("/baskets").json() == {"date": None, "baskets": {}}
+
+
+def test_default_compute_serves_every_builtin_component(tmp_path: Path) -> None:
+    data = generate(6, 900, seed=2)
+    config = synthetic_config(data, tmp_path)
+    write_curated(data, Path(config.data["curated_dir"]))
+    payload = TestClient(create_app(config)).get("/components").json()
+    assert set(payload) == {"date", *BUILTIN_COMPONENTS}
+
+
+def test_triggers_timeline(tmp_path: Path) -> None:
+    payload = _client(tmp_path).get("/triggers").json()
+    assert payload["rules"]["volatility_high"] == "Volatility score above 55."
+    assert [row["date"] for row in payload["timeline"]][-1] == "2024-01-26"
+    assert [row["volatility_high"] for row in payload["timeline"]] == [False, True, True, True]
+    assert payload["timeline"][0]["top_mover"] is None
+
+
+def test_timeseries_etag_and_encoding(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    first = client.get("/timeseries", headers={"Accept-Encoding": "identity"})
+    assert first.status_code == 200
+    payload = first.json()
+    assert payload["components"][1]["capital_flow"] is None
+    assert payload["composite"][0]["date"] == "2024-01-05"
+
+    etag = first.headers["etag"]
+    cached = client.get(
+        "/timeseries", headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    compressed = client.get(
+        "/timeseries", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["etag"] == etag[:-1] + '-gzip"'
+    assert json.loads(compressed.content) == payload
+    revalidated = client.get(
+        "/timeseries",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
+def test_timeseries_range_columns_and_cursor(tmp_path: Path) -> None:
+    client = _client(tmp_path)
+    response = client.get(
+        "/timeseries",
+        params={"start": "2024-01-12", "columns": "index,volatility", "limit": 2},
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert [row["date"] for row in payload["composite"]] == ["2024-01-12", "2024-01-19"]
+    assert set(payload["components"][0]) == {"date", "volatility"}
+    assert payload["next_cursor"] == "2024-01-26"
+    assert response.headers["x-next-cursor"] == "2024-01-26"
+
+    rest = client.get(
+        "/timeseries", params={"cursor": payload["next_cursor"], "columns": "index"}
+    ).json()
+    assert [row["index"] for row in rest["composite"]] == [50.0]
+    assert rest["next_cursor"] is None
+
+    assert client.get("/timeseries", params={"columns": "bogus"}).status_code == 400
+
+    aware = client.get(
+        "/timeseries",
+        params={"start": "2024-01-19T00:00:00Z", "end": "2024-01-19T05:00:00+05:00"},
+    )
+    assert aware.status_code == 200
+    assert [row["date"] for row in aware.json()["composite"]] == ["2024-01-19"]
+    assert client.get("/timeseries", params={"cursor": "2024-01-19T00:00:00Z"}).status_code == 200
+
+
+def test_timeseries_csv_and_arrow(tmp_path: Path) -> None:
+    import pyarrow as pa
+
+    client = _client(tmp_path)
+    csv = client.get("/timeseries", params={"format": "csv", "end": "2024-01-12"})
+    assert csv.headers["content-type"].startswith("text/csv")
+    assert csv.text.splitlines()[0] == "date,index,band_lower,band_upper,capital_flow,volatility"
+    assert len(csv.text.splitlines()) == 3
+
+    arrow = client.get("/timeseries", params={"format": "arrow", "columns": "index"})
+    table = pa.ipc.open_stream(arrow.content).read_all()
+    assert table.column("index").to_pylist() == [40.0, 42.0, 45.0, 50.0]
+
+
+def test_refresh_scheduler_swaps_result(tmp_path: Path) -> None:
+    import asyncio
+
+    from fragility_monitor.api.scheduler import RefreshScheduler
+
+    config = _config(tmp_path)
+    cache = ResultCache(config, compute=lambda _: _result())
+    stale = cache.get()
+    fresh = _result()
+    scheduler = RefreshScheduler(cache, refresh=lambda: fresh)
+
+    asyncio.run(scheduler.refresh_now())
+
+    assert cache.get() is fresh
+    assert cache.get() is not stale
+    assert scheduler.status.state == "idle"
+    assert scheduler.status.runs == 1
+
+    client = TestClient(create_app(config, cache=cache, scheduler=scheduler))
+    status = client.get("/refresh/status").json()
+    assert status["running"] is False
+    assert status["last_success"] is not None
+
+
+def test_admin_routes_require_a_configured_token(tmp_path: Path) -> None:
+    from fragility_monitor.api.scheduler import RefreshScheduler
+
+    config = _config(tmp_path)
+    cache = ResultCache(config, compute=lambda _: _result())
+    scheduler = RefreshScheduler(cache, refresh=_result)
+    client = TestClient(create_app(config, cache=cache, scheduler=scheduler))
+    assert client.post("/refresh").status_code == 403
+    assert client.post("/admin/reload", headers={"X-Admin-Token": ""}).status_code == 403
+
+    config.api["admin_token"] = "secret"
+    assert client.post("/refresh", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.post("/refresh", headers={"X-Admin-Token": "secret"}).status_code == 202
+
+
+def test_event_broadcaster_bounded_fanout() -> None:
+    import asyncio
+
+    from fragility_monitor.api.events import EventBroadcaster, update_event
+
+    async def scenario() -> None:
+        broadcaster = EventBroadcaster(queue_size=2)
+        broadcaster.bind(asyncio.get_running_loop())
+        fast = broadcaster.subscribe()
+        slow = broadcaster.subscribe()
+
+        result = _result()
+        broadcaster.publish_result(result)
+        broadcaster.publish_result(result)
+        assert fast.queue.qsize() == 1
+
+        for value in (60.0, 70.0, 80.0):
+            result.composite.iloc[-1, 0] = value
+            broadcaster.publish_result(result)
+        assert slow.queue.qsize() == 2
+        assert slow.dropped == 2
+        message = slow.queue.get_nowait()
+        assert message.startswith(b"id: ")
+        assert b"event: update" in message
+
+        event = update_event(result)
+        assert b'"deltas":{"capital_flow":10.0,"volatility":5.0}' in event.data
+
+    asyncio.run(scenario())
+
+
+def test_universe_cache_shares_panel_and_respects_budget(tmp_path: Path) -> None:
+    from fragility_monitor.api.universes import PanelStore, UniverseCache
+    from fragility_monitor.monitor import MonitorInputs, curated_paths
+
+    config = _config(tmp_path)
+    config.universes = {
+        "semis": {"market": {"ai_tickers": ["NVDA", "AMD"]}},
+        "cloud": {"market": {"ai_tickers": ["MSFT"]}, "weights": {"capital_flow": 1.0}},
+    }
+    paths = curated_paths(config)
+    paths["market"].parent.mkdir(parents=True)
+    index = pd.date_range("2024-01-01", periods=5, freq="B")
+    pd.DataFrame({"NVDA": 1.0, "AMD": 2.0, "MSFT": 3.0, "SPY": 4.0}, index=index).to_parquet(
+        paths["market"]
+    )
+    pd.DataFrame().to_parquet(paths["macro"])
+    pd.DataFrame().to_parquet(paths["filings"])
+
+    seen: list[tuple[list[str], dict[str, float], int]] = []
+
+    def compute(universe: Config, inputs: MonitorInputs) -> MonitorResult:
+        seen.append((universe.market["ai_tickers"], universe.weights, id(inputs)))
+        return _result()
+
+    panel = PanelStore(config)
+    cache = UniverseCache(config, panel, budget_bytes=1, compute=compute)
+    assert cache.names == ["semis", "cloud"]
+
+    cache.get_entry("semis")
+    cache.get_entry("semis")
+    cache.get_entry("cloud")
+    assert [tickers for tickers, _, _ in seen] == [["NVDA", "AMD"], ["MSFT"]]
+    assert seen[1][1] == {"capital_flow": 1.0}
+    assert seen[0][2] == seen[1][2]
+
+    # The one-byte budget keeps only the most recently used universe.
+    cache.get_entry("semis")
+    assert len(seen) == 3
+
+    base = ResultCache(config, compute=lambda _: _result())
+    client = TestClient(create_app(config, cache=base, panel=panel))
+    assert client.get("/u/unknown/index").status_code == 404
+
+
+def test_reload_reconfigures_the_panel_for_universe_and_general_changes(tmp_path: Path) -> None:
+    import copy
+
+    from fragility_monitor.api.reload import ConfigReloader
+    from fragility_monitor.api.universes import PanelStore, UniverseCache
+
+    config = _config(tmp_path)
+    config.universes = {"semis": {"market": {"ai_tickers": ["NVDA"]}}}
+    panel = PanelStore(config)
+    results = ResultCache(config, compute=lambda _: _result())
+    universes = UniverseCache(config, panel, budget_bytes=1 << 20)
+    reloader = ConfigReloader(tmp_path / "config.toml", results, panel, universes)
+
+    new = copy.deepcopy(config)
+    new.universes = {"semis": {"market": {"ai_tickers": ["NVDA", "AMD"]}}}
+    report = reloader.apply(new)
+    assert report["changed"] == ["universes"]
+    assert report["stage"] is None
+    assert "AMD" in panel.config.market["ai_tickers"]
+
+    newer = copy.deepcopy(new)
+    newer.general = {**new.general, "compact": True}
+    report = reloader.apply(newer)
+    assert report["stage"] == "inputs"
+    assert panel.config.general["compact"] is True
+    assert results.config is newer
+
+
+def test_metrics_endpoint_reports_routes_and_cache(tmp_path: Path) -> None:
+    from fragility_monitor.metrics import HTTP_DURATION
+
+    client = _client(tmp_path)
+    before = HTTP_DURATION._merged(len(HTTP_DURATION.buckets) + 3).get(("/index", "GET", "200"))
+    client.get("/index")
+    client.get("/index")
+    body = client.get("/metrics").text
+    assert "# TYPE fragility_http_request_duration_seconds histogram" in body
+    after = HTTP_DURATION._merged(len(HTTP_DURATION.buckets) + 3)[("/index", "GET", "200")]
+    assert after[-1] - (before[-1] if before else 0) == 2
+    bucket = 'route="/index",method="GET",status="200",le="+Inf"'
+    assert f"fragility_http_request_duration_seconds_bucket{{{bucket}}}" in body
+    assert 'fragility_cache_requests_total{cache="result",result="hit"}' in body
+    assert "fragility_data_staleness_seconds " in body
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.features.baskets import compute_basket_features, membership_matrix
+from fragility_monitor.features.divergence import compute_divergence_features
+from fragility_monitor.features.market import compute_market_features
+
+SINGLE_BASKET = {
+    "relative_strength": "ai_relative_strength",
+    "price_acceleration": "ai_price_acceleration",
+    "volatility": "ai_volatility",
+    "vol_of_vol": "ai_vol_of_vol",
+    "returns": "ai_returns",
+    "dispersion": "ai_dispersion",
+    "crowding_corr": "ai_crowding_corr",
+}
+
+
+def test_basket_features_match_single_basket_calls() -> None:
+    data = generate(12, 400, seed=6)
+    baskets = {"first": data.tickers[:5], "overlap": data.tickers[3:9], "pair": data.tickers[-2:]}
+    features = compute_basket_features(data.prices, baskets)
+    assert features.columns.names == ["basket", "feature"]
+
+    for name, members in baskets.items():
+        single = pd.concat(
+            [
+                compute_market_features(data.prices, members),
+                compute_divergence_features(data.prices, members),
+            ],
+            axis=1,
+        )
+        for feature, column in SINGLE_BASKET.items():
+            pd.testing.assert_series_equal(
+                features[(name, feature)],
+                single[column].reindex(features.index),
+                check_names=False,
+                check_freq=False,
+                rtol=1e-9,
+            )
+
+
+def test_membership_matrix_drops_unknown_tickers() -> None:
+    membership = membership_matrix({"a": ["X", "Y", "Q"], "b": ["Q"]}, ["X", "Y", "Z"])
+    assert membership.to_numpy().tolist() == [[1.0, 0.0], [1.0, 0.0], [0.0, 0.0]]
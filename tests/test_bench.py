@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from fragility_monitor.bench.suite import (
+    Comparison,
+    compare,
+    regressions,
+    run_suite,
+    synthetic_config,
+)
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.config import load_config
+
+
+def test_synthetic_data_is_deterministic() -> None:
+    first = generate(4, 300, seed=3)
+    second = generate(4, 300, seed=3)
+    pd.testing.assert_frame_equal(first.prices, second.prices)
+    assert list(first.prices.columns) == ["T0000", "T0001", "T0002", "T0003", "SPY", "QQQ"]
+    assert set(first.filings["ticker"]) == set(first.tickers)
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = {"results": [{"name": "a", "scale": "1x1", "median_s": 1.0}]}
+    current = {"results": [{"name": "a", "scale": "1x1", "median_s": 1.5}]}
+    rows = compare(baseline, current)
+    assert rows == [Comparison(name="a", scale="1x1", baseline_s=1.0, current_s=1.5)]
+    assert regressions(rows, threshold=0.2) == rows
+    assert regressions(rows, threshold=0.6) == []
+
+
+def test_run_suite_offline_small_scale() -> None:
+    report = run_suite(scales=["3x300"], repeat=1, only=["normalize_score", "run_monitor"])
+    assert [row["name"] for row in report["results"]] == ["normalize_score", "run_monitor"]
+
+
+def test_synthetic_config_keeps_base_settings(tmp_path: Path) -> None:
+    base = load_config(tmp_path / "missing.toml")
+    base.scoring["rolling_window_years"] = 3
+    config = synthetic_config(generate(3, 300), tmp_path, base)
+    assert config.scoring["rolling_window_years"] == 3
+    assert config.data["curated_dir"] == str(tmp_path / "curated")
+    assert base.data["curated_dir"] != config.data["curated_dir"]
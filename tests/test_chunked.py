@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.features.chunked import chunked_features, iter_parquet_blocks
+from fragility_monitor.features.divergence import compute_divergence_features
+from fragility_monitor.features.market import compute_market_features
+
+
+def test_chunked_features_match_in_memory(tmp_path: Path) -> None:
+    data = generate(8, 700, seed=4)
+    prices = data.prices.copy()
+    prices.iloc[300:304] = np.nan
+    prices.iloc[480:520, prices.columns.get_indexer(data.tickers)] = np.nan
+    path = tmp_path / "prices.parquet"
+    prices.to_parquet(path)
+
+    for compute in (
+        lambda frame: compute_market_features(frame, data.tickers),
+        lambda frame: compute_divergence_features(frame, data.tickers),
+    ):
+        expected = compute(prices)
+        for rows in (70, 150, 1000):
+            blocks = iter_parquet_blocks(path, rows)
+            result = chunked_features(blocks, compute, columns=data.tickers)
+            pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-10)
+
+
+def test_iter_parquet_blocks_reads_selected_columns(tmp_path: Path) -> None:
+    index = pd.bdate_range("2022-01-03", periods=10, name="date")
+    frame = pd.DataFrame({"A": range(10), "B": range(10)}, index=index, dtype=float)
+    frame.to_parquet(tmp_path / "prices.parquet")
+    blocks = list(iter_parquet_blocks(tmp_path / "prices.parquet", 4, ["B"]))
+    assert [len(block) for block in blocks] == [4, 4, 2]
+    assert all(list(block.columns) == ["B"] for block in blocks)
+    pd.testing.assert_frame_equal(pd.concat(blocks), frame[["B"]], check_freq=False)
@@ -1,6 +1,13 @@
+import numpy as np
 import pandas as pd
+import pytest
 
-from fragility_monitor.scoring.components import compute_component_scores
+from fragility_monitor.scoring.components import compute_component_panel, compute_component_scores
+from fragility_monitor.scoring.registry import (
+    component_specs,
+    required_features,
+    resolve_components,
+)
 
 
 def test_component_scores_shape() -> None:
@@ -26,3 +33,66 @@ def test_component_scores_shape() -> None:
     scores = compute_component_scores(market, divergence, narrative, macro, 12, 0.05, 0.95)
     assert not scores.empty
     assert "capital_flow" in scores.columns
+
+
+def test_plan_includes_dependencies_and_custom_components() -> None:
+    specs = component_specs(
+        {
+            "stress_mix": {"inputs": ["components.crowding", "components.volatility"]},
+            "calm_macro": {"inputs": "macro.hy_spread", "invert": True},
+        }
+    )
+    plan = resolve_components(["stress_mix", "capital_flow"], specs)
+    assert [spec.name for spec in plan] == ["capital_flow", "crowding", "volatility", "stress_mix"]
+    assert required_features(plan)["divergence"] == {"ai_crowding_corr"}
+    assert not required_features(plan)["narrative"]
+
+
+def test_plan_rejects_cycles_and_bad_inputs() -> None:
+    specs = component_specs({"a": {"inputs": ["components.b"]}, "b": {"inputs": ["components.a"]}})
+    with pytest.raises(ValueError, match="cycle"):
+        resolve_components(["a"], specs)
+    with pytest.raises(ValueError, match="invalid input"):
+        component_specs({"bad": {"inputs": ["prices.close"]}})
+
+
+def test_custom_component_scores_from_plan() -> None:
+    index = pd.date_range("2020-01-03", periods=30, freq="W-FRI")
+    market = pd.DataFrame({"ai_volatility": range(30)}, index=index, dtype=float)
+    divergence = pd.DataFrame({"ai_crowding_corr": range(30)}, index=index, dtype=float)
+    specs = component_specs(
+        {"stress_mix": {"inputs": ["components.crowding", "components.volatility"]}}
+    )
+    plan = resolve_components(["stress_mix"], specs)
+
+    scores = compute_component_scores(
+        market, divergence, pd.DataFrame(), pd.DataFrame(), 12, 0.05, 0.95, plan=plan
+    )
+    assert list(scores.columns) == ["crowding", "volatility", "stress_mix"]
+    assert scores["stress_mix"].dropna().between(0, 100).all()
+
+
+def test_component_panel_matches_single_window_scores() -> None:
+    index = pd.date_range("2020-01-03", periods=80, freq="W-FRI")
+    rng = np.random.default_rng(4)
+    market = pd.DataFrame({"ai_volatility": rng.normal(size=80)}, index=index)
+    divergence = pd.DataFrame({"ai_crowding_corr": rng.normal(size=80)}, index=index)
+    specs = component_specs(
+        {"stress_mix": {"inputs": ["components.crowding", "components.volatility"]}}
+    )
+    plan = resolve_components(["stress_mix"], specs)
+    empty = pd.DataFrame()
+
+    panel = compute_component_panel(market, divergence, empty, empty, [26, 12], 0.05, 0.95, plan)
+    assert list(panel.columns.unique("window")) == [12, 26]
+    for window in (12, 26):
+        expected = compute_component_scores(
+            market, divergence, empty, empty, window, 0.05, 0.95, plan=plan
+        )
+        pd.testing.assert_frame_equal(panel[window].rename_axis(columns=None), expected)
+
+
+def test_crowding_can_use_the_absorption_ratio() -> None:
+    specs = component_specs({"crowding": {"inputs": ["divergence.ai_absorption_ratio"]}})
+    plan = resolve_components(["crowding"], specs)
+    assert required_features(plan)["divergence"] == {"ai_absorption_ratio"}
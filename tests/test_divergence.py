@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.features.divergence import absorption_ratio, average_rolling_corr
+
+
+def _reference(returns: pd.DataFrame, window: int) -> pd.Series:
+    corr = returns.rolling(window).corr()
+    return corr.groupby(level=0).mean().mean(axis=1)
+
+
+def test_average_rolling_corr_matches_pandas_with_gaps() -> None:
+    rng = np.random.default_rng(5)
+    index = pd.bdate_range("2021-01-01", periods=200)
+    common = rng.normal(size=(200, 1))
+    returns = pd.DataFrame(common + rng.normal(size=(200, 6)), index=index)
+    returns.iloc[40:45, 2] = np.nan
+    returns.iloc[:30, 4] = np.nan
+
+    expected = _reference(returns, 20)
+    for chunk_bytes in (1, 10_000, 1 << 30):
+        result = average_rolling_corr(returns, window=20, chunk_bytes=chunk_bytes)
+        pd.testing.assert_series_equal(result, expected, check_names=False, check_freq=False)
+
+
+def test_absorption_ratio_matches_full_eigendecomposition() -> None:
+    rng = np.random.default_rng(8)
+    index = pd.bdate_range("2021-01-01", periods=120)
+    for tickers in (6, 40):
+        factor = rng.normal(size=(120, 1)) * np.linspace(0.5, 2, 120)[:, None]
+        returns = pd.DataFrame(factor + rng.normal(size=(120, tickers)), index=index)
+        returns.iloc[50, 1] = np.nan
+        k = int(np.ceil(0.2 * tickers))
+
+        values = returns.fillna(0.0).to_numpy()
+        expected = np.full(120, np.nan)
+        for end in range(20, 121):
+            eigenvalues = np.linalg.eigvalsh(np.cov(values[end - 20 : end].T))
+            expected[end - 1] = eigenvalues[-k:].sum() / eigenvalues.sum()
+
+        result = absorption_ratio(returns, window=20)
+        np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-10)
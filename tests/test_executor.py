@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from fragility_monitor.executor import Task, run_tasks
+from fragility_monitor.profiling import profiling, stage
+
+
+def _sleep(name: str, seconds: float) -> str:
+    with stage(f"test.{name}"):
+        time.sleep(seconds)
+    return name
+
+
+def test_independent_tasks_run_concurrently() -> None:
+    start = time.perf_counter()
+    results = run_tasks(
+        [
+            Task("a", lambda: _sleep("a", 0.2)),
+            Task("b", lambda: _sleep("b", 0.2)),
+            Task("c", lambda: _sleep("c", 0.2)),
+            Task("joined", lambda a, b, c: a + b + c, deps=("a", "b", "c"), kind="cpu"),
+        ]
+    )
+    assert time.perf_counter() - start < 0.5
+    assert results["joined"] == "abc"
+
+
+def test_failures_propagate_with_the_stage_name() -> None:
+    def boom() -> None:
+        raise RuntimeError("no data")
+
+    for workers in (None, 1):
+        with pytest.raises(RuntimeError, match="no data") as info:
+            run_tasks([Task("ok", lambda: 1), Task("bad", boom)], workers=workers)
+        assert "in pipeline stage 'bad'" in info.value.__notes__
+
+
+def test_cycles_are_rejected() -> None:
+    with pytest.raises(ValueError, match="cycle"):
+        run_tasks([Task("a", lambda b: b, deps=("b",)), Task("b", lambda a: a, deps=("a",))])
+
+
+def test_worker_stages_nest_under_the_caller() -> None:
+    with profiling() as profiler:
+        with stage("outer"):
+            run_tasks([Task("a", lambda: _sleep("a", 0.05)), Task("b", lambda: _sleep("b", 0.05))])
+    depths = {record.name: record.depth for record in profiler.records}
+    assert depths == {"outer": 0, "test.a": 1, "test.b": 1}
+    assert len({record.thread for record in profiler.records}) >= 2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+from fragility_monitor.bench.fixture_server import FixtureBehaviour, start_fixture_server
+from fragility_monitor.config import load_config
+from fragility_monitor.monitor import load_inputs
+
+
+def test_fetchers_refresh_against_fixture_server(tmp_path: Path) -> None:
+    server, _ = start_fixture_server(tickers=3, days=300)
+    try:
+        config = load_config(tmp_path / "missing.toml")
+        config.data = {"raw_dir": str(tmp_path / "raw"), "curated_dir": str(tmp_path / "curated")}
+        config.market = {
+            "ai_tickers": server.fixtures.data.tickers,
+            "benchmarks": ["SPY"],
+            "volatility_estimator": "parkinson",
+        }
+        config.sec = {**config.sec, "max_filings_per_ticker": 2}
+        config.sources = server.sources()
+
+        inputs = load_inputs(config, refresh=True)
+
+        assert list(inputs.prices.columns) == ["T0000", "T0001", "T0002", "SPY"]
+        assert len(inputs.prices) > 250
+        assert sorted(inputs.ohlcv) == ["high", "low"]
+        assert list(inputs.ohlcv["high"].columns) == server.fixtures.data.tickers
+        high, low = inputs.ohlcv["high"], inputs.ohlcv["low"]
+        assert ((high >= low) | high.isna()).all().all()
+        assert sorted(path.name for path in (tmp_path / "curated" / "market_ohlcv").iterdir()) == [
+            "close.parquet",
+            "high.parquet",
+            "low.parquet",
+            "open.parquet",
+            "volume.parquet",
+        ]
+        assert list(inputs.macro.columns) == ["hy_spread", "vix"]
+        assert inputs.filings["accession"].is_unique
+        assert inputs.filings.groupby("ticker").size().to_dict() == {
+            "T0000": 2,
+            "T0001": 2,
+            "T0002": 2,
+        }
+    finally:
+        server.shutdown()
+
+
+def test_refresh_keeps_universe_tickers_in_the_shared_store(tmp_path: Path) -> None:
+    server, _ = start_fixture_server(tickers=3, days=120)
+    try:
+        config = load_config(tmp_path / "missing.toml")
+        config.data = {"raw_dir": str(tmp_path / "raw"), "curated_dir": str(tmp_path / "curated")}
+        tickers = server.fixtures.data.tickers
+        config.market = {"ai_tickers": tickers[:2], "benchmarks": ["SPY"]}
+        config.universes = {"alt": {"market": {"ai_tickers": tickers[2:]}}}
+        config.sec = {**config.sec, "max_filings_per_ticker": 1}
+        config.sources = server.sources()
+
+        load_inputs(config, refresh=True)
+
+        stored = pd.read_parquet(tmp_path / "curated" / "market_prices.parquet")
+        assert sorted(stored.columns) == sorted([*tickers, "SPY"])
+        filings = pd.read_parquet(tmp_path / "curated" / "filing_signals.parquet")
+        assert sorted(filings["ticker"].unique()) == tickers
+    finally:
+        server.shutdown()
+
+
+def test_fixture_server_throttles() -> None:
+    server, _ = start_fixture_server(
+        tickers=1, days=50, behaviour=FixtureBehaviour(throttle_rate=1.0, retry_after=7)
+    )
+    try:
+        response = requests.get(server.sources()["stooq_url"], params={"s": "t0000.us"}, timeout=5)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        assert server.counters["throttled"] == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from fragility_monitor.cli import sparkline
+from fragility_monitor.latest import latest_path, read_latest, snapshot, write_latest
+
+
+def test_snapshot_round_trip(tmp_path: Path) -> None:
+    index = pd.date_range("2024-01-05", periods=3, freq="W-FRI")
+    composite = pd.DataFrame(
+        {"index": [40.0, 45.0, 50.0], "band_lower": [30.0] * 3, "band_upper": [60.0] * 3},
+        index=index,
+    )
+    components = pd.DataFrame({"capital_flow": [1.0, 2.0, 3.0], "narrative": [1.0, 2.0, None]})
+    summary = {"asof": "2024-01-19", "regime": "Elevated"}
+
+    path = latest_path(tmp_path)
+    write_latest(path, snapshot(composite, components, summary))
+    latest = read_latest(path)
+
+    assert latest is not None
+    assert latest["index"] == 50.0
+    assert latest["components"] == {"capital_flow": 3.0, "narrative": None}
+    assert latest["trend"] == [40.0, 45.0, 50.0]
+    # Published files follow the umask, not the temp file's 0600.
+    plain = tmp_path / "plain.json"
+    plain.write_text("{}")
+    assert path.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+    assert read_latest(tmp_path / "missing.json") is None
+
+
+def test_sparkline_skips_missing_values() -> None:
+    assert sparkline([1.0, float("nan"), None, 2.0]) == " @"
+
+
+def test_cli_import_does_not_load_pandas() -> None:
+    code = "import sys, fragility_monitor.cli; print('pandas' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
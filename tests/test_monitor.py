@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fragility_monitor.bench.suite import synthetic_config
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.config import load_config
+from fragility_monitor.monitor import (
+    COMPACT_TOLERANCE,
+    MonitorFeatures,
+    MonitorInputs,
+    build_result,
+    compact_frame,
+    compute_features,
+    compute_monitor,
+    invalidated_stage,
+    recompute_result,
+    score_features,
+)
+
+
+def _features() -> MonitorFeatures:
+    index = pd.date_range("2020-01-03", periods=60, freq="W-FRI")
+    rng = np.random.default_rng(7)
+
+    def frame(*columns: str) -> pd.DataFrame:
+        return pd.DataFrame(rng.normal(size=(60, len(columns))), index=index, columns=list(columns))
+
+    return MonitorFeatures(
+        market=frame(
+            "ai_relative_strength", "ai_price_acceleration", "ai_vol_of_vol", "ai_volatility"
+        ),
+        divergence=frame("ai_dispersion", "ai_crowding_corr"),
+        narrative=frame("efficiency_transform_trend", "pricing_pressure", "ai_density"),
+        macro=frame("hy_spread"),
+        ai_returns=pd.Series(
+            rng.normal(scale=0.01, size=300), index=pd.bdate_range("2020-01-01", periods=300)
+        ),
+    )
+
+
+def test_invalidated_stage_picks_earliest_stage(tmp_path: Path) -> None:
+    old = load_config(tmp_path / "missing.toml")
+    new = copy.deepcopy(old)
+    assert invalidated_stage(old, new) is None
+    new.weights = {"capital_flow": 1.0}
+    assert invalidated_stage(old, new) == "composite"
+    new.scoring = {**new.scoring, "rolling_window_years": 1}
+    assert invalidated_stage(old, new) == "scores"
+    new.market = {**new.market, "ai_tickers": ["NVDA"]}
+    assert invalidated_stage(old, new) == "inputs"
+
+
+def test_invalidated_stage_covers_general_and_sources(tmp_path: Path) -> None:
+    old = load_config(tmp_path / "missing.toml")
+    new = copy.deepcopy(old)
+    new.general = {**old.general, "chunk_days": 250}
+    assert invalidated_stage(old, new) == "inputs"
+    new = copy.deepcopy(old)
+    new.sources = {**old.sources, "stooq_url": "http://127.0.0.1:8765/stooq/q/d/l/"}
+    assert invalidated_stage(old, new) == "inputs"
+
+
+def test_invalidated_stage_follows_the_component_plan(tmp_path: Path) -> None:
+    old = load_config(tmp_path / "missing.toml")
+    new = copy.deepcopy(old)
+    new.weights = {**old.weights, "volatility": 0.1}
+    assert invalidated_stage(old, new) == "scores"
+    new.weights = {**old.weights, "crowding": 0.1}
+    assert invalidated_stage(old, new) == "inputs"
+
+
+def test_recompute_result_reuses_cached_stages(tmp_path: Path) -> None:
+    config = load_config(tmp_path / "missing.toml")
+    config.scoring = {"rolling_window_years": 0.5, "winsorize_quantiles": [0.05, 0.95]}
+    features = _features()
+    previous = build_result(config, features, score_features(config, features))
+
+    reweighted = copy.deepcopy(config)
+    reweighted.weights = {"capital_flow": 1.0}
+    result = recompute_result(reweighted, previous, "composite")
+    assert result.components is previous.components
+    pd.testing.assert_series_equal(
+        result.composite["index"], previous.components["capital_flow"].dropna(), check_names=False
+    )
+
+    rescored = copy.deepcopy(config)
+    rescored.scoring = {"rolling_window_years": 0.25, "winsorize_quantiles": [0.05, 0.95]}
+    result = recompute_result(rescored, previous, "scores")
+    assert result.features is features
+    pd.testing.assert_frame_equal(result.components, score_features(rescored, features))
+
+
+def test_compact_mode_stays_within_tolerance(tmp_path: Path) -> None:
+    data = generate(12, 900, seed=3)
+    config = synthetic_config(data, tmp_path)
+    full = compute_monitor(config, MonitorInputs(data.prices, data.macro, data.filings))
+
+    config.general = {**config.general, "compact": True}
+    inputs = MonitorInputs(compact_frame(data.prices), compact_frame(data.macro), data.filings)
+    assert inputs.prices.dtypes.eq(np.float32).all()
+    compact = compute_monitor(config, inputs)
+
+    drift = (compact.composite["index"] - full.composite["index"]).abs().max()
+    assert drift < COMPACT_TOLERANCE
+
+
+def test_compute_features_adds_configured_baskets(tmp_path: Path) -> None:
+    data = generate(8, 400, seed=2)
+    config = synthetic_config(data, tmp_path)
+    config.market = {
+        **config.market,
+        "baskets": {"head": data.tickers[:3], "tail": data.tickers[5:]},
+    }
+    features = compute_features(config, MonitorInputs(data.prices, data.macro, data.filings))
+    assert list(features.baskets.columns.get_level_values("basket").unique()) == ["head", "tail"]
+    assert features.baskets.index.equals(features.market.index)
+
+
+def test_sensitivity_windows_share_one_scoring_pass(tmp_path: Path) -> None:
+    data = generate(6, 900, seed=5)
+    config = synthetic_config(data, tmp_path)
+    config.scoring = {**config.scoring, "sensitivity_years": [0.5, 1]}
+    result = compute_monitor(config, MonitorInputs(data.prices, data.macro, data.filings))
+
+    windows = sorted(result.panel.columns.unique("window"))
+    assert windows == sorted({26, 52, int(config.scoring["rolling_window_years"] * 52)})
+    main = int(config.scoring["rolling_window_years"] * 52)
+    pd.testing.assert_frame_equal(
+        result.panel[main].rename_axis(columns=None), result.components
+    )
+    assert list(result.sensitivity["window_weeks"]) == windows
+    row = result.sensitivity.set_index("window_weeks").loc[main]
+    assert row["index"] == result.summary["index"]
+    assert row["precision"] == result.backtest["precision"]
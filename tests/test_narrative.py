@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.features.narrative import NarrativeStore, compute_narrative_features
+
+
+def _filings() -> pd.DataFrame:
+    return generate(6, 1200, seed=4).filings
+
+
+def _assert_close(left: pd.DataFrame, right: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(left, right, check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_vectorized_normalisation_matches_per_ticker_zscores() -> None:
+    filings = _filings().sort_index()
+    reference = filings.copy()
+    for column in ["ai_density", "pricing_pressure", "risk_language"]:
+        reference[column] = reference.groupby("ticker")[column].transform(
+            lambda series: (series - series.mean()) / (series.std(ddof=0) or 1.0)
+        )
+    grouped = reference.groupby("date").mean(numeric_only=True)
+    weekly = grouped.resample("W-FRI").ffill(limit=13)
+
+    features = compute_narrative_features(filings)
+    pd.testing.assert_series_equal(features["ai_density"], weekly["ai_density"].fillna(0.0))
+    pd.testing.assert_series_equal(
+        features["risk_language"], weekly["risk_language"].fillna(0.0)
+    )
+
+
+def test_store_updates_incrementally_to_the_batch_result() -> None:
+    filings = _filings()
+    store = NarrativeStore()
+    dates = sorted(filings.index.unique())
+    for cutoff in dates[::2] + [dates[-1]]:
+        store.sync(filings[filings.index <= cutoff])
+        _assert_close(
+            store.features(), compute_narrative_features(filings[filings.index <= cutoff])
+        )
+    assert len(store) == len(filings)
+
+    subset = ["T0001", "T0004"]
+    _assert_close(
+        store.features(subset), compute_narrative_features(filings[filings["ticker"].isin(subset)])
+    )
+
+
+def test_store_rebuilds_when_a_filing_disappears() -> None:
+    filings = _filings()
+    store = NarrativeStore().sync(filings)
+    trimmed = filings[filings["accession"] != filings["accession"].iloc[3]]
+    _assert_close(store.sync(trimmed).features(), compute_narrative_features(trimmed))
+    assert len(store) == len(trimmed)
+
+
+def test_store_keys_filings_without_accessions() -> None:
+    filings = _filings().drop(columns="accession")
+    store = NarrativeStore().sync(filings.iloc[:40])
+    _assert_close(store.sync(filings).features(), compute_narrative_features(filings))
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from fragility_monitor.profiling import active_profiler, profiled, profiling, stage
+
+
+@profiled("test.double")
+def _double(frame: pd.DataFrame) -> pd.DataFrame:
+    return pd.concat([frame, frame])
+
+
+def test_stages_disabled_by_default() -> None:
+    assert active_profiler() is None
+    with stage("noop") as handle:
+        handle.rows_out = 3
+    assert len(_double(pd.DataFrame({"a": [1]}))) == 2
+
+
+def test_profiler_records_nested_stages_and_trace() -> None:
+    with profiling(trace_memory=True) as profiler:
+        with stage("outer", rows_in=1):
+            _double(pd.DataFrame({"a": range(10)}))
+    names = [record.name for record in profiler.records]
+    assert names == ["test.double", "outer"]
+    inner, outer = profiler.records
+    assert inner.rows_in == 10 and inner.rows_out == 20
+    assert inner.depth == 1 and outer.depth == 0
+    assert outer.wall_s >= inner.wall_s
+    assert outer.mem_peak_bytes is not None and outer.mem_peak_bytes >= 0
+
+    trace = profiler.to_chrome_trace()
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+    assert profiler.to_dict()["total_wall_s"] == outer.wall_s
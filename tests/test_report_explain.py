@@ -1,11 +1,16 @@
+import numpy as np
 import pandas as pd
 
 from fragility_monitor.report.explain import (
     COMPONENT_LABELS,
+    TRIGGER_MESSAGES,
     compute_movers,
     containment_message,
     label_component,
+    macro_sector_callout,
     stressed_triggers,
+    timeline_events,
+    trigger_timeline,
 )
 
 
@@ -58,3 +63,70 @@ def test_stressed_triggers_non_empty() -> None:
     composite = pd.DataFrame({"index": [40.0] * 10}, index=index)
     triggers = stressed_triggers(components, composite)
     assert triggers
+
+
+def test_trigger_timeline_matches_latest_row_rules() -> None:
+    index = pd.date_range("2022-01-07", periods=80, freq="W-FRI")
+    rng = np.random.default_rng(3)
+    components = pd.DataFrame(
+        rng.uniform(0, 100, size=(80, 6)),
+        index=index,
+        columns=[
+            "capital_flow",
+            "revenue_reality",
+            "macro_liquidity",
+            "crowding",
+            "volatility",
+            "narrative",
+        ],
+    )
+    components.iloc[27:30, 3] = 10.0
+    components.iloc[30:36, 3] = 80.0
+    components.iloc[40:45, 0] = np.nan
+    composite = pd.DataFrame({"index": components.mean(axis=1)}, index=index).drop(index[10:12])
+
+    timeline = trigger_timeline(components, composite)
+    for date in index[4:]:
+        history = components.loc[:date]
+        latest = composite.loc[:date]
+        row = timeline.loc[date]
+        if history.tail(3).isna().any().any():
+            assert not row["capital_flow_rising"]
+            continue
+        listed = stressed_triggers(history, latest)
+        assert {key for key in TRIGGER_MESSAGES if not row[key]} == {
+            key for key, message in TRIGGER_MESSAGES.items() if message in listed
+        }
+        message = containment_message(float(latest["index"].iloc[-1]), history.iloc[-1])
+        assert row["contained"] == (message is not None)
+        assert row["sector_specific"] == (macro_sector_callout(history.iloc[-1]) is not None)
+        top = compute_movers(history)[0]
+        assert row["top_mover"] == top.name
+        assert np.isclose(row["top_mover_delta"], top.delta)
+
+    events = timeline_events(timeline)
+    assert "crowding_persistent" in set(events.loc[[index[32]], "rule"])
+
+
+def test_trigger_timeline_warm_up_fires_nothing() -> None:
+    index = pd.date_range("2022-01-07", periods=20, freq="W-FRI")
+    components = pd.DataFrame(
+        {
+            "capital_flow": 80.0 + np.arange(20.0),
+            "revenue_reality": 90.0,
+            "macro_liquidity": 10.0,
+            "crowding": 95.0,
+            "volatility": 90.0,
+            "narrative": 90.0,
+        },
+        index=index,
+    )
+    components.iloc[:8] = np.nan
+    composite = pd.DataFrame({"index": 10.0 * np.arange(12.0)}, index=index[8:])
+
+    timeline = trigger_timeline(components, composite)
+    assert not timeline.iloc[:8][[*TRIGGER_MESSAGES, "contained", "sector_specific"]].any().any()
+    assert (timeline["triggers_met"].iloc[:8] == 0).all()
+    events = timeline_events(timeline)
+    assert events.index.min() == index[8]
+    assert not events.loc[: index[7]].size
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fragility_monitor.report import html as report_html
+from fragility_monitor.report.html import PROCESS_MIN_JOBS, generate_archive, generate_report
+
+
+def _frames() -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    index = pd.date_range("2023-01-06", periods=80, freq="W-FRI")
+    rng = np.random.default_rng(0)
+    values = rng.uniform(20, 80, len(index))
+    composite = pd.DataFrame(
+        {"index": values, "band_lower": values - 5, "band_upper": values + 5}, index=index
+    )
+    components = pd.DataFrame(
+        {
+            name: rng.uniform(0, 100, len(index))
+            for name in ["capital_flow", "revenue_reality", "narrative", "macro_liquidity"]
+        },
+        index=index,
+    )
+    summary = {"asof": str(index[-1].date()), "index": float(values[-1]), "components": {}}
+    return composite, components, summary
+
+
+def test_generate_report_skips_unchanged_artifacts(tmp_path: Path) -> None:
+    composite, components, summary = _frames()
+
+    first = generate_report(tmp_path, composite, components, summary)
+    assert all(first.values())
+    assert (tmp_path / "index.png").read_bytes()[:4] == b"\x89PNG"
+    plain = tmp_path / "plain.txt"
+    plain.write_text("")
+    assert (tmp_path / "report.html").stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
+    second = generate_report(tmp_path, composite, components, summary, workers=1)
+    assert not any(second.values())
+
+    components.iloc[-1, 0] = 99.0
+    third = generate_report(tmp_path, composite, components, summary, workers=1)
+    assert third == {
+        "index.png": False,
+        "components.png": True,
+        "summary.json": False,
+        "timeseries.csv": True,
+        "report.html": True,
+    }
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_generate_report_renders_serially_by_default(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def no_pool(*args: object, **kwargs: object) -> None:
+        raise AssertionError("default report run started a pool")
+
+    monkeypatch.setattr(report_html, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(report_html, "ThreadPoolExecutor", no_pool)
+    composite, components, summary = _frames()
+    assert all(generate_report(tmp_path, composite, components, summary).values())
+
+
+def test_generate_archive_renders_dated_snapshots_once(tmp_path: Path) -> None:
+    composite, components, _ = _frames()
+    dates = [str(date.date()) for date in composite.index[-PROCESS_MIN_JOBS:]]
+
+    first = generate_archive(tmp_path, composite, components, start=dates[0], workers=2)
+    assert first == dict.fromkeys(dates, True)
+    html = (tmp_path / f"{dates[-1]}.html").read_text()
+    assert f'src="index-{dates[-1]}.png"' in html
+    assert (tmp_path / f"components-{dates[0]}.png").read_bytes()[:4] == b"\x89PNG"
+    assert json.loads((tmp_path / f"summary-{dates[1]}.json").read_text())["asof"] == dates[1]
+
+    components.iloc[-1, 0] = 99.0
+    second = generate_archive(tmp_path, composite, components, start=dates[0], workers=1)
+    assert second == {**dict.fromkeys(dates[:-1], False), dates[-1]: True}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_report_does_not_import_the_pipeline() -> None:
+    code = (
+        "import sys, fragility_monitor.report.html; "
+        "print('fragility_monitor.monitor' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "False"
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fragility_monitor.bench.suite import synthetic_config
+from fragility_monitor.bench.synthetic import generate
+from fragility_monitor.monitor import MonitorInputs, compute_monitor, compute_scenarios
+from fragility_monitor.scoring.scenarios import (
+    bootstrap_returns,
+    score_paths,
+    simulate_market_features,
+)
+from fragility_monitor.scoring.transforms import normalize_score
+
+
+def test_score_paths_matches_normalize_score() -> None:
+    rng = np.random.default_rng(1)
+    index = pd.date_range("2015-01-02", periods=300, freq="W-FRI")
+    series = pd.Series(rng.normal(size=300).cumsum(), index=index)
+    series.iloc[5] = np.nan
+    expected = normalize_score(series, 104, 0.05, 0.95).iloc[-20:].to_numpy()
+    paths = np.tile(series.iloc[-20:].to_numpy(), (3, 1))
+    result = score_paths(series.iloc[:-20], paths, 104, 0.05, 0.95)
+    np.testing.assert_allclose(result, np.tile(expected, (3, 1)), rtol=1e-12)
+
+
+def test_bootstrap_draws_contiguous_blocks() -> None:
+    history = np.arange(100.0)[:, None]
+    draws = bootstrap_returns(history, 23, 50, 5, np.random.default_rng(0))[:, :, 0]
+    assert draws.shape == (50, 23)
+    steps = np.diff(draws, axis=1)[:, [0, 1, 2, 3, 5, 6, 7, 8]]
+    assert (steps == 1).all()
+
+
+def test_compute_scenarios_fan_and_regimes(tmp_path: Path) -> None:
+    data = generate(8, 900, seed=5)
+    config = synthetic_config(data, tmp_path)
+    inputs = MonitorInputs(data.prices, data.macro, data.filings)
+    result = compute_monitor(config, inputs)
+
+    scenarios = compute_scenarios(config, inputs, result, n_paths=200, horizon_weeks=6, seed=2)
+    assert scenarios.paths.shape == (200, 6)
+    assert scenarios.dates[0] > result.composite.index[-1]
+    assert (scenarios.quantiles.diff(axis=1).iloc[:, 1:] >= 0).all().all()
+    np.testing.assert_allclose(scenarios.regimes.sum(axis=1), 1.0)
+    rows = scenarios.transitions.sum(axis=1).dropna()
+    np.testing.assert_allclose(rows[rows > 0], 1.0)
+
+    again = compute_scenarios(config, inputs, result, n_paths=200, horizon_weeks=6, seed=2)
+    np.testing.assert_array_equal(again.paths, scenarios.paths)
+    flat = compute_scenarios(config, inputs, result, n_paths=20, horizon_weeks=6, vol_scale=0.0)
+    assert np.ptp(flat.paths, axis=0).max() < 1e-9
+
+
+def test_scenarios_score_components_built_from_components(tmp_path: Path) -> None:
+    data = generate(8, 900, seed=5)
+    config = synthetic_config(data, tmp_path)
+    config.components = {"stress_mix": {"inputs": ["components.crowding", "components.volatility"]}}
+    config.weights = {"stress_mix": 1.0}
+    inputs = MonitorInputs(data.prices, data.macro, data.filings)
+    result = compute_monitor(config, inputs)
+
+    scenarios = compute_scenarios(config, inputs, result, n_paths=200, horizon_weeks=6, seed=2)
+    first = scenarios.quantiles.iloc[0]
+    assert first["p95"] - first["p05"] > 1.0
+    assert abs(first["p50"] - scenarios.start) < 25
+
+
+def test_simulated_volatility_uses_the_configured_window() -> None:
+    rng = np.random.default_rng(4)
+    index = pd.bdate_range("2020-01-01", periods=200)
+    returns = rng.normal(scale=0.01, size=(200, 2))
+    daily = pd.DataFrame(
+        {
+            "ai_returns": returns[:, 0],
+            "bench_returns": returns[:, 1],
+            "ai_price": 100 * np.cumprod(1 + returns[:, 0]),
+        },
+        index=index,
+    )
+    features = simulate_market_features(daily, 30, 2, 5, rng, vol_window=40)
+    path = np.concatenate([daily["ai_returns"].to_numpy(), features["ai_returns"][0]])
+    expected = pd.Series(path).rolling(40).std() * 252**0.5
+    np.testing.assert_allclose(features["ai_volatility"][0], expected.iloc[-30:], rtol=1e-10)
+
+
+def test_compute_scenarios_rejects_range_estimators(tmp_path: Path) -> None:
+    data = generate(4, 400, seed=1)
+    config = synthetic_config(data, tmp_path)
+    inputs = MonitorInputs(data.prices, data.macro, data.filings)
+    result = compute_monitor(config, inputs)
+    config.market = {**config.market, "volatility_estimator": "parkinson"}
+    with pytest.raises(ValueError, match="close volatility estimator"):
+        compute_scenarios(config, inputs, result, n_paths=10)
@@ -32,3 +32,18 @@ def test_fetch_prices_skips_malformed_csv(monkeypatch) -> None:
     assert len(prices) == 1
     assert prices.index[0] == pd.Timestamp("2026-04-16")
     assert prices.loc[pd.Timestamp("2026-04-16"), "SPY"] == 503
+
+
+def test_fetch_prices_keeps_ohlcv_fields(monkeypatch) -> None:
+    content = b"Date,Open,High,Low,Close,Volume\n2026-04-16,500,505,498,503,100\n"
+    monkeypatch.setattr(
+        "fragility_monitor.data.fetchers.stooq.requests.get",
+        lambda url, params, timeout: _Response(content),
+    )
+
+    market = StooqFetcher().fetch_prices(["SPY"])
+
+    assert sorted(market.ohlcv) == ["close", "high", "low", "open", "volume"]
+    row = {name: frame.iloc[0]["SPY"] for name, frame in market.ohlcv.items()}
+    assert row == {"open": 500, "high": 505, "low": 498, "close": 503, "volume": 100}
+    assert market.prices is market.ohlcv["close"]
@@ -1,6 +1,14 @@
+import numpy as np
 import pandas as pd
 
-from fragility_monitor.scoring.transforms import logistic_scale, normalize_score, rolling_robust_zscore, winsorize
+from fragility_monitor.scoring.transforms import (
+    logistic_scale,
+    normalize_score,
+    normalize_scores,
+    rolling_robust_zscore,
+    rolling_robust_zscores,
+    winsorize,
+)
 
 
 def test_winsorize_clips() -> None:
@@ -25,3 +33,31 @@ def test_normalize_score_bounds() -> None:
 def test_logistic_scale_center() -> None:
     scaled = logistic_scale(pd.Series([0.0]))
     assert abs(scaled.iloc[0] - 50) < 1e-6
+
+
+def test_rolling_robust_zscores_match_rolling_apply() -> None:
+    def robust_z(x: pd.Series) -> float:
+        median = x.median()
+        mad = (x - median).abs().median()
+        scale = 1.4826 * mad if mad > 0 else x.std(ddof=0)
+        if scale == 0 or np.isnan(scale):
+            return 0.0
+        return (x.iloc[-1] - median) / scale
+
+    rng = np.random.default_rng(1)
+    series = pd.Series(rng.normal(size=300).cumsum())
+    series[5:30] = np.nan
+    series[150:170] = 2.0
+    scores = rolling_robust_zscores(series, [52, 20, 104])
+    assert list(scores.columns) == [20, 52, 104]
+    for window in scores.columns:
+        expected = series.rolling(window, min_periods=max(10, window // 4)).apply(robust_z)
+        pd.testing.assert_series_equal(scores[window], expected, check_names=False)
+
+
+def test_normalize_scores_columns_match_single_window() -> None:
+    series = pd.Series(np.random.default_rng(2).normal(size=200))
+    scores = normalize_scores(series, [20, 52], 0.05, 0.95)
+    pd.testing.assert_series_equal(
+        scores[52], normalize_score(series, 52, 0.05, 0.95), check_names=False
+    )